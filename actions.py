@@ -5,13 +5,29 @@ BERT niyetleri, Zemberek analizleri ve yfinance verilerini
 birleştirerek kullanıcıya dinamik cevaplar üretir.
 """
 
+import atexit
 import random
+import threading
 import time
-import requests
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FutureTimeoutError
 import templates  # templates.py dosyasındaki şablonları kullanır
+from izleme import log, span, aktif_span, baglami_tasi
+from http_istemci import istemci, kalan_sure
+from bar_deposu import bar_deposu, bar_kapanis_zamani, TR_SAATI
+from gostergeler import gosterge_motoru
+from onbellek import LRUOnbellek, YuklemeliOnbellek, DiskKatmani
+from tarayici_havuzu import TarayiciHavuzu, TarayiciBulunamadi
 
 from config import (
-    CACHE_SURESI, HABER_CACHE_SURESI,
+    CACHE_SURESI, HABER_CACHE_SURESI, ON_YUKLEME_AKTIF, ON_YUKLEME_ISCI, ON_YUKLEME_SURESI,
+    FIYAT_YENILEYICI_AKTIF, FIYAT_YENILEME_SURESI,
+    INFO_ALAN_SURELERI, INFO_VARSAYILAN_SURE, INFO_MAKS_BAYATLIK, INFO_YENILEME_ISCI, INFO_CACHE_BOYUT,
+    CEVIRI_CACHE_SURESI,
+    AKSIYON_CACHE_BOYUT, CEVIRI_CACHE_BOYUT, NEGATIF_CACHE_SURESI, DISK_CACHE_AKTIF, DISK_CACHE_YOLU,
+    CEVIRI_HEDEF_DIL,
+    AKSIYON_SURESI, ALT_GOREV_ISCI, TARAYICI_ON_ISITMA, HABER_ZENGINLESTIRME_SURESI, HABER_KAZIMA_ISCI,
+    HABER_TARAYICI_BEKLEME,
     TICKER_MAP, PARA_BIRIMI, VARLIK_ISIM,
     HABER_ARAMA_MAP, TRADINGVIEW_NEWS_MAP, DEEPL_API_KEY
 )
@@ -63,62 +79,22 @@ class TeknikAnaliz:
             return None
         
         try:
-            # Son 6 aylık veriyi çek
-            ticker = TICKER_MAP.get(symbol, symbol)
-            # Yfinance sembol düzeltme (BIST için .IS ekle)
-            if symbol in ["THY", "GARAN", "AKBNK", "EREGL", "KCHOL", "BIST100"]:
-                if not ticker.endswith(".IS") and not ticker.startswith("^"):
-                    ticker += ".IS"
-            
-            df = yf.download(ticker, period="6mo", interval="1d", progress=False)
-            if df.empty or len(df) < 50:
-                print(f"   > [ANALİZ] Yetersiz veri: {ticker}")
+            # Günlük barlar (varlık bulunduğunda ön yüklemeye başlanmış olabilir)
+            barlar = on_yukleme_sonucu("gecmis", symbol)
+            if barlar is None or len(barlar) < 50:
+                log.info("   > [ANALİZ] Yetersiz veri: %s", symbol)
                 return None
             
-            # Kapanış fiyatları (MultiIndex kontrolü)
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.get_level_values(0)
+            # RSI(14), SMA50, SMA200: sembol başına kayan durum, yalnızca yeni / revize barlar uygulanır
+            with span("gosterge.guncelle", sembol=symbol) as s:
+                g = gosterge_motoru.senkronize(symbol, barlar)
+                s.ozellik(bar=g["bar_sayisi"])
+            current_price = g["fiyat"]
+            current_rsi = g["rsi"]
+            sma50 = g["sma50"]
+            sma200 = g["sma200"]
             
-            close = df['Close']
-            
-            # Son değeri güvenli al
-            last_val = close.iloc[-1]
-            if hasattr(last_val, 'item'):
-                current_price = float(last_val.item())
-            else:
-                current_price = float(last_val)
-            
-            # 1. RSI (Göreceli Güç Endeksi) - 14 günlük
-            delta = close.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            
-            rsi_val = rsi.iloc[-1]
-            if hasattr(rsi_val, 'item'):
-                current_rsi = float(rsi_val.item())
-            else:
-                current_rsi = float(rsi_val)
-            
-            # 2. Hareketli Ortalamalar (Trend)
-            sma50_series = close.rolling(window=50).mean()
-            sma50_val = sma50_series.iloc[-1]
-            if hasattr(sma50_val, 'item'):
-                sma50 = float(sma50_val.item())
-            else:
-                sma50 = float(sma50_val)
-            
-            sma200 = None
-            if len(df) > 200:
-                sma200_series = close.rolling(window=200).mean()
-                sma200_val = sma200_series.iloc[-1]
-                if hasattr(sma200_val, 'item'):
-                    sma200 = float(sma200_val.item())
-                else:
-                    sma200 = float(sma200_val)
-            
-            # 3. Yorumlama
+            # Yorumlama
             sinyal = "NÖTR"
             trend = "YATAY"
             
@@ -132,144 +108,383 @@ class TeknikAnaliz:
                 "fiyat": current_price,
                 "rsi": round(current_rsi, 2),
                 "sma50": round(float(sma50), 2),
+                "sma200": round(sma200, 2) if sma200 is not None else None,
                 "trend": trend,
                 "sinyal": sinyal
             }
         except Exception as e:
-            print(f"   > [ANALİZ] Teknik analiz hatası: {e}")
+            log.warning("   > [ANALİZ] Teknik analiz hatası: %s", e)
             return None
 
+def _gunluk_gecmis_cek(symbol):
+    """Günlük barlar (TeknikAnaliz girdisi, BAR_DTYPE dizisi), yerel bar deposundan."""
+    ticker = TICKER_MAP.get(symbol, symbol)
+    # Yfinance sembol düzeltme (BIST için .IS ekle)
+    if symbol in ["THY", "GARAN", "AKBNK", "EREGL", "KCHOL", "BIST100"]:
+        if not ticker.endswith(".IS") and not ticker.startswith("^"):
+            ticker += ".IS"
+    # Depo yalnızca son kayıtlı günden bu yana eksik barları çeker
+    return bar_deposu.guncelle(ticker)
+
 # =============================================================================
 # CACHE SİSTEMİ
 # =============================================================================
 
-_fiyat_cache = {}
-_haber_cache = {}
-_sirket_cache = {}
+# Boyut sınırlı, kayıt başına TTL, tek uçuş yükleme ve negatif cache (onbellek.py).
+# Disk katmanı: başarılı kayıtlar zaman damgalarıyla SQLite'a da yazılır;
+# yeniden başlatmadan sonra bellekte olmayan anahtar önce diskte aranır.
+disk_cache = DiskKatmani(DISK_CACHE_YOLU) if DISK_CACHE_AKTIF else None
+
+fiyat_cache = YuklemeliOnbellek("fiyat", maks_boyut=AKSIYON_CACHE_BOYUT, sure=CACHE_SURESI,
+                                negatif_sure=NEGATIF_CACHE_SURESI, disk=disk_cache)
+# Boş haber listesi de başarısız sayılır (RSS/TradingView kısa süre sonra tekrar denenir)
+haber_cache = YuklemeliOnbellek("haber", maks_boyut=AKSIYON_CACHE_BOYUT, sure=HABER_CACHE_SURESI,
+                                negatif_sure=NEGATIF_CACHE_SURESI, negatif_mi=lambda haberler: not haberler,
+                                disk=disk_cache)
+# Çeviri hafızası: "hedef dil|kaynak metin" -> çeviri
+ceviri_cache = YuklemeliOnbellek("ceviri", maks_boyut=CEVIRI_CACHE_BOYUT, sure=CEVIRI_CACHE_SURESI,
+                                 negatif_sure=NEGATIF_CACHE_SURESI, disk=disk_cache)
+
+_YOK = object()   # Önbellekte kayıt yok (negatif kayıttan ayırt etmek için)
+
+def cache_istatistikleri():
+    istatistik = {c.isim: c.istatistik() for c in (fiyat_cache, haber_cache, ceviri_cache)}
+    istatistik["info"] = ticker_bilgi.istatistik()
+    if disk_cache is not None:
+        istatistik["disk"] = dict(disk_cache.sayac)
+    return istatistik
+
+# =============================================================================
+# TICKER BİLGİ CACHE'İ (yf.Ticker.info)
+# =============================================================================
+# Şirket bilgisi ve hedef fiyat aynı büyük info yükünü kullanır; ham yük
+# ticker başına bir kez tutulur. Tazelik okuyucunun istediği alanlara göre
+# belirlenir (INFO_ALAN_SURELERI): özet günlerce, önceki kapanış dakikalarca
+# tazedir. Süresi dolan kayıt hemen döner ve arka planda yenilenir; aynı
+# ticker için aynı anda tek çekim yapılır. Kayıtlar boyut sınırlı LRU'da
+# tutulur: serbest metinden gelen ticker'lar belleği büyütemez. Başarısız
+# çekim NEGATIF_CACHE_SURESI boyunca tekrarlanmaz (varsa bayat kayıt
+# sunulur); kayıt yokken çekim en fazla AKSIYON_SURESI / istek bütçesi
+# kadar beklenir.
+
+class TickerBilgiCache:
+    def __init__(self, alan_sureleri=INFO_ALAN_SURELERI, varsayilan_sure=INFO_VARSAYILAN_SURE,
+                 maks_bayatlik=INFO_MAKS_BAYATLIK, disk=None, maks_boyut=INFO_CACHE_BOYUT,
+                 negatif_sure=NEGATIF_CACHE_SURESI, bekleme_suresi=AKSIYON_SURESI):
+        self.alan_sureleri = alan_sureleri
+        self.varsayilan_sure = varsayilan_sure
+        self.maks_bayatlik = maks_bayatlik
+        self.disk = disk
+        self.negatif_sure = negatif_sure
+        self.bekleme_suresi = bekleme_suresi
+        # ticker -> (info, çekim zamanı, son başarısız çekim zamanı); info None: veri yok
+        # (diskte de yok ise (None, 0, 0))
+        self._kayitlar = LRUOnbellek(maks_boyut)
+        self._ucustakiler = {}   # ticker -> Future
+        self._kilit = threading.Lock()
+        self._havuz = ThreadPoolExecutor(INFO_YENILEME_ISCI, thread_name_prefix="info_yenile")
+        self.sayac = {"taze": 0, "bayat": 0, "iska": 0, "negatif": 0, "cekim": 0, "hata": 0}
+
+    def sure(self, alanlar):
+        """İstenen alanların en kısa tazelik süresi."""
+        return min((self.alan_sureleri.get(a, self.varsayilan_sure) for a in alanlar),
+                   default=self.varsayilan_sure)
+
+    def _cek(self, ticker):
+        try:
+            try:
+                with span("yfinance.info", upstream="yfinance", ticker=ticker):
+                    info = yf.Ticker(ticker).info
+                if not info:
+                    raise ValueError(f"{ticker} için boş info")
+            except Exception:
+                # Negatif kayıt: varsa eski veri korunur, yeniden deneme negatif_sure sonra
+                with self._kilit:
+                    eski = self._kayitlar.al(ticker) or (None, 0, 0)
+                    self._kayitlar.kaydet(ticker, (eski[0], eski[1], time.time()))
+                    self.sayac["hata"] += 1
+                raise
+            zaman = time.time()
+            with self._kilit:
+                self._kayitlar.kaydet(ticker, (info, zaman, 0))
+                self.sayac["cekim"] += 1
+            if self.disk is not None:
+                # Diskte, en uzun ömürlü alan bayat sunulabildiği sürece tutulur
+                en_uzun = max(self.alan_sureleri.values(), default=self.varsayilan_sure)
+                self.disk.yaz("info", [(ticker, info, zaman, zaman + en_uzun + self.maks_bayatlik)])
+            return info
+        finally:
+            with self._kilit:
+                self._ucustakiler.pop(ticker, None)
+
+    def _yenile(self, ticker):
+        """Uçuşta çekim yoksa başlatır (kilit tutulurken çağrılır)."""
+        future = self._ucustakiler.get(ticker)
+        if future is None:
+            future = self._ucustakiler[ticker] = self._havuz.submit(self._cek, ticker)
+            future.add_done_callback(self._yenileme_bitti)
+        return future
+
+    @staticmethod
+    def _yenileme_bitti(future):
+        if future.exception() is not None:
+            log.warning("   > [INFO] Yenileme hatası: %s", future.exception())
+
+    def al(self, ticker, alanlar=()):
+        """
+        Ham info sözlüğü. Taze kayıt -> doğrudan; bayat kayıt -> hemen döner,
+        arka planda yenilenir; kayıt yok / çok bayat -> çekim beklenir.
+        Son çekim negatif_sure içinde başarısız olduysa ve sunulacak kayıt yoksa
+        yeniden denemeden hata atılır. Çekim beklemesi bekleme_suresi (ve istek
+        bütçesi) ile sınırlıdır; aşılırsa TimeoutError (çekim arka planda sürer).
+        """
+        sure = self.sure(alanlar)
+        if self.disk is not None and self._kayitlar.al(ticker) is None:
+            # Yeniden başlatmadan (veya LRU'dan atılmadan) sonraki ilk okuma:
+            # diskteki kayıt çekim zamanıyla yüklenir
+            diskteki = self.disk.oku("info", ticker)
+            with self._kilit:
+                if self._kayitlar.al(ticker) is None:
+                    self._kayitlar.kaydet(ticker, (diskteki[0], diskteki[1], 0) if diskteki is not None
+                                          else (None, 0, 0))
+        with self._kilit:
+            simdi = time.time()
+            info, zaman, son_hata = self._kayitlar.al(ticker) or (None, 0, 0)
+            yas = simdi - zaman if info is not None else None
+            hata_yakin = simdi - son_hata < self.negatif_sure
+            if yas is not None and yas < sure:
+                self.sayac["taze"] += 1
+                durum = "isabet"
+            elif yas is not None and yas < sure + self.maks_bayatlik:
+                self.sayac["bayat"] += 1
+                if not hata_yakin:
+                    self._yenile(ticker)
+                durum = "bayat"
+            elif hata_yakin:
+                self.sayac["negatif"] += 1
+                durum = "negatif"
+            else:
+                self.sayac["iska"] += 1
+                future = self._yenile(ticker)
+                durum = "iska"
+        aktif_span().ozellik(info_cache=durum)
+        if durum == "negatif":
+            raise LookupError(f"{ticker} için info alınamadı ({simdi - son_hata:.0f} s önce)")
+        if durum != "iska":
+            return info
+
+        bekleme = self.bekleme_suresi
+        kalan = kalan_sure()
+        if kalan is not None:
+            bekleme = max(0.0, min(bekleme, kalan))
+        try:
+            return future.result(timeout=bekleme)
+        except FutureTimeoutError:
+            raise TimeoutError(f"{ticker} info çekimi {bekleme:.1f} s içinde bitmedi") from None
+
+    def istatistik(self):
+        with self._kilit:
+            return dict(self.sayac, boyut=len(self._kayitlar))
+
+ticker_bilgi = TickerBilgiCache(disk=disk_cache)
+
+# =============================================================================
+# PARALEL ALT GÖREVLER
+# =============================================================================
+# Aksiyonlar birbirinden bağımsız dış çağrılarını {isim: fonksiyon} olarak
+# bildirir; hepsi aynı anda ve ortak bir süre sınırı altında çalışır.
+# Toplam süre ≈ en yavaş dal; süresi dolan dal None döner, cevap kalan
+# dallarla (kısmi) oluşturulur.
+
+_alt_gorev_havuzu = ThreadPoolExecutor(ALT_GOREV_ISCI, thread_name_prefix="alt_gorev")
 
-def _cache_kontrol(cache, anahtar, sure):
-    if anahtar in cache:
-        veri, zaman = cache[anahtar]
-        if time.time() - zaman < sure:
-            return veri
-    return None
+def paralel_calistir(gorevler, sure=AKSIYON_SURESI):
+    """
+    gorevler: {isim: parametresiz fonksiyon}
+    Dönüş: {isim: sonuç}; süre içinde bitmeyen veya hata veren görev için None.
+    İstek süre bütçesi (http_istemci.butce) daha kısaysa onu aşmaz.
+    """
+    kalan = kalan_sure()
+    if kalan is not None:
+        sure = max(0.0, min(sure, kalan))
+    with span("paralel", gorevler=",".join(gorevler), sure_s=sure) as s:
+        futures = {_alt_gorev_havuzu.submit(baglami_tasi(fn)): isim for isim, fn in gorevler.items()}
+        _, bitmeyenler = wait(futures, timeout=sure)
 
-def _cache_kaydet(cache, anahtar, veri):
-    cache[anahtar] = (veri, time.time())
+        sonuclar = {}
+        for future, isim in futures.items():
+            if future in bitmeyenler:
+                # Çalışmaya başlamışsa iptal edilemez; sonucu yalnızca beklenmez
+                future.cancel()
+                log.warning("   > [PARALEL] '%s' %.1f s içinde bitmedi, kısmi sonuç kullanılıyor.", isim, sure)
+                sonuclar[isim] = None
+            elif future.exception() is not None:
+                log.warning("   > [PARALEL] '%s' hatası: %s", isim, future.exception())
+                sonuclar[isim] = None
+            else:
+                sonuclar[isim] = future.result()
+        s.ozellik(zaman_asimi=",".join(futures[f] for f in bitmeyenler))
+    return sonuclar
+
+# =============================================================================
+# SELENIUM TARAYICI HAVUZU
+# =============================================================================
+# Haber scraping ve TradingView her URL için yeni Chrome başlatmak yerine
+# havuzdaki sıcak sürücüleri ödünç alır (bkz. tarayici_havuzu.py).
+
+_chromedriver_yolu = None
+_chromedriver_kilidi = threading.Lock()
+
+def _chrome_olustur():
+    """Havuz fabrikası: headless Chrome. ChromeDriverManager().install() süreç başına bir kez çağrılır."""
+    global _chromedriver_yolu
+    with _chromedriver_kilidi:
+        if _chromedriver_yolu is None:
+            _chromedriver_yolu = ChromeDriverManager().install()
+    
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+    chrome_options.add_argument("--log-level=3")
+    
+    driver = webdriver.Chrome(service=Service(_chromedriver_yolu), options=chrome_options)
+    driver.set_page_load_timeout(20)  # 20 saniye timeout
+    return driver
+
+tarayici_havuzu = TarayiciHavuzu(_chrome_olustur) if SELENIUM_AVAILABLE else None
+if tarayici_havuzu is not None:
+    atexit.register(tarayici_havuzu.kapat)  # Chrome süreçleri çıkışta açık kalmasın
+    if TARAYICI_ON_ISITMA:
+        tarayici_havuzu.isit()
+
+# Haber içeriği scrape'leri ayrı bir havuzda çalışır: çalışan driver.get iptal
+# edilemez (20 s'ye kadar sürebilir); süresi dolup bırakılan scrape'ler
+# paralel_calistir dallarının thread'lerini tutmaz. Havuz tarayıcı sayısından
+# bağımsızdır: boşta tarayıcı yoksa scrape kısa beklemeden sonra HTTP
+# scraper'lara (newspaper3k / trafilatura) geçer, thread tarayıcı beklemez.
+_kazima_havuzu = ThreadPoolExecutor(HABER_KAZIMA_ISCI, thread_name_prefix="haber_kazima")
+
+# Haber içeriği scraper'ları: deneme / kazanma sayısı ve toplam süre (/saglik)
+_kazici_sayac = {}
+_kazici_kilidi = threading.Lock()
+
+def _kazici_kaydet(isim, sure, kazandi):
+    with _kazici_kilidi:
+        sayac = _kazici_sayac.setdefault(isim, {"deneme": 0, "kazanma": 0, "sure_s": 0.0})
+        sayac["deneme"] += 1
+        sayac["kazanma"] += int(kazandi)
+        sayac["sure_s"] += sure
+
+def kazici_istatistikleri():
+    with _kazici_kilidi:
+        return {isim: dict(s, ort_ms=round(s["sure_s"] / s["deneme"] * 1000, 1))
+                for isim, s in _kazici_sayac.items()}
 
 # =============================================================================
 # ACTION: HABER GETİR (Google RSS + Selenium Scraping + TradingView Fallback)
 # =============================================================================
 
 class ActionHaberGetir:
+    GEREKSINIMLER = ("varlik",)
+
     def execute(self, varlik, soru, **kwargs):
         varlik_isim = VARLIK_ISIM.get(varlik, varlik)
         
-        # Cache kontrolü
-        cached = _cache_kontrol(_haber_cache, varlik, HABER_CACHE_SURESI)
-        if cached:
-            return self._formatla(varlik_isim, cached)
-        
-        # 1. Google News RSS'den haber başlıklarını çek
-        haberler = self._google_news_cek(varlik)
-        
-        # 2. RSS başarısız olursa TradingView'dan çek
-        if not haberler or len(haberler) == 0:
-            print("   > [HABER] Google RSS başarısız, TradingView'a geçiliyor...")
-            haberler = self._tradingview_cek(varlik)
+        haberler = haber_cache.al_veya_yukle(varlik, lambda: self._haberleri_cek(varlik))
         
         if haberler is None: 
             return random.choice(templates.HABER_HATA)
         if not haberler: 
             return random.choice(templates.HABER_YOK).format(varlik=varlik_isim)
         
-        _cache_kaydet(_haber_cache, varlik, haberler)
         return self._formatla(varlik_isim, haberler)
     
+    def _haberleri_cek(self, varlik):
+        # 1. Google News RSS'den haber başlıklarını çek
+        haberler = self._google_news_cek(varlik)
+        
+        # 2. RSS başarısız olursa TradingView'dan çek
+        if not haberler or len(haberler) == 0:
+            log.info("   > [HABER] Google RSS başarısız, TradingView'a geçiliyor...")
+            haberler = self._tradingview_cek(varlik)
+        return haberler
+    
     def _tradingview_cek(self, varlik):
         """TradingView News Flow'dan Selenium ile haber çek"""
         if not SELENIUM_AVAILABLE:
-            print("   > [HABER] Selenium yok, TradingView atlanıyor")
+            log.info("   > [HABER] Selenium yok, TradingView atlanıyor")
             return None
         
         url = TRADINGVIEW_NEWS_MAP.get(varlik)
         if not url:
-            print(f"   > [HABER] TradingView URL bulunamadı: {varlik}")
+            log.info("   > [HABER] TradingView URL bulunamadı: %s", varlik)
             return None
         
-        driver = None
         try:
-            import time as _time
-            
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-            chrome_options.add_argument("--log-level=3")
-            
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(20)
-            
-            print(f"   > [HABER] TradingView: {url[:50]}...")
-            driver.get(url)
-            _time.sleep(3)  # JavaScript render için bekle
-            
-            # Haber öğelerini bul
-            haberler = []
-            news_items = driver.find_elements(By.CSS_SELECTOR, ".news-item, .item-row, article")
-            
-            for item in news_items[:5]:
-                try:
-                    # Başlık
-                    title_elem = item.find_element(By.CSS_SELECTOR, ".title, h3, .headline, a")
-                    title = title_elem.text.strip() if title_elem else ""
-                    
-                    # Açıklama
-                    desc = ""
-                    try:
-                        desc_elem = item.find_element(By.CSS_SELECTOR, ".description, .summary, p")
-                        desc = desc_elem.text.strip()[:400] if desc_elem else ""
-                    except:
-                        pass
-                    
-                    # Tarih
-                    date = ""
-                    try:
-                        date_elem = item.find_element(By.CSS_SELECTOR, ".time, .date, time")
-                        date = date_elem.text.strip() if date_elem else ""
-                    except:
-                        pass
-                    
-                    if title and len(title) > 10:
-                        haberler.append({
-                            "title": title,
-                            "description": desc,
-                            "source": "TradingView",
-                            "url": "",
-                            "date": date
-                        })
-                except:
-                    continue
-            
-            driver.quit()
+            with tarayici_havuzu.al() as driver:
+                haberler = self._tradingview_oku(driver, url)
             
             if haberler:
-                print(f"   > [HABER] TradingView'dan {len(haberler)} haber alındı")
+                log.info("   > [HABER] TradingView'dan %d haber alındı", len(haberler))
                 return haberler
             else:
-                print("   > [HABER] TradingView'dan haber bulunamadı")
+                log.info("   > [HABER] TradingView'dan haber bulunamadı")
                 return None
                 
         except Exception as e:
-            if driver:
-                driver.quit()
-            print(f"   > [HABER] TradingView hatası: {e}")
+            log.warning("   > [HABER] TradingView hatası: %s", e)
             return None
     
+    def _tradingview_oku(self, driver, url):
+        """Havuzdan alınan sürücüyle TradingView sayfasındaki haberleri okur"""
+        log.info("   > [HABER] TradingView: %s...", url[:50])
+        with span("tradingview.sayfa", upstream="tradingview", url=url):
+            driver.get(url)
+            time.sleep(3)  # JavaScript render için bekle
+        
+        # Haber öğelerini bul
+        haberler = []
+        news_items = driver.find_elements(By.CSS_SELECTOR, ".news-item, .item-row, article")
+        
+        for item in news_items[:5]:
+            try:
+                # Başlık
+                title_elem = item.find_element(By.CSS_SELECTOR, ".title, h3, .headline, a")
+                title = title_elem.text.strip() if title_elem else ""
+                
+                # Açıklama
+                desc = ""
+                try:
+                    desc_elem = item.find_element(By.CSS_SELECTOR, ".description, .summary, p")
+                    desc = desc_elem.text.strip()[:400] if desc_elem else ""
+                except:
+                    pass
+                
+                # Tarih
+                date = ""
+                try:
+                    date_elem = item.find_element(By.CSS_SELECTOR, ".time, .date, time")
+                    date = date_elem.text.strip() if date_elem else ""
+                except:
+                    pass
+                
+                if title and len(title) > 10:
+                    haberler.append({
+                        "title": title,
+                        "description": desc,
+                        "source": "TradingView",
+                        "url": "",
+                        "date": date
+                    })
+            except:
+                continue
+        
+        return haberler
+    
     def _tarih_formatla(self, tarih_str):
         """Tarih stringini formatla"""
         if not tarih_str:
@@ -281,156 +496,157 @@ class ActionHaberGetir:
         except:
             return ""
     
-    def _icerik_cek(self, url):
-        """URL'den haber içeriğini scrape et - Selenium öncelikli"""
+    def _icerik_cek(self, url, iptal=None):
+        """
+        URL'den haber içeriğini scrape et - Selenium öncelikli.
+        Dönüş: (metin, kazanan scraper); içerik yoksa ("", None).
+        iptal (threading.Event) kurulursa sonraki scraper'lar denenmez.
+        """
         if not url:
-            return ""
+            return "", None
         
-        # Önce Selenium dene (Google News redirect'lerini en iyi takip eder)
-        if SELENIUM_AVAILABLE:
+        # Önce Selenium (Google News redirect'lerini en iyi takip eder), sonra newspaper3k, trafilatura
+        kaziyicilar = (
+            ("selenium", SELENIUM_AVAILABLE, lambda: self._selenium_scrape(url, iptal)),
+            ("newspaper3k", NEWSPAPER_AVAILABLE, lambda: self._newspaper_cek(url)),
+            ("trafilatura", TRAFILATURA_AVAILABLE, lambda: self._trafilatura_cek(url)),
+        )
+        for isim, var, cek in kaziyicilar:
+            if not var:
+                continue
+            if iptal is not None and iptal.is_set():
+                return "", None
+            baslangic = time.perf_counter()
+            text = ""
             try:
-                text = self._selenium_scrape(url)
-                if text and len(text) > 50:
-                    return text
+                with span(f"scrape.{isim}", upstream=isim, url=url) as s:
+                    text = cek() or ""
+                    s.ozellik(karakter=len(text))
+            except TarayiciBulunamadi:
+                log.debug("   > [SCRAPE] Boşta tarayıcı yok, sonraki scraper deneniyor")
+                continue
             except Exception as e:
-                print(f"   > [SCRAPE] Selenium hatası: {e}")
+                log.warning("   > [SCRAPE] %s hatası: %s", isim, e)
+            basarili = len(text) > 50
+            if not basarili and iptal is not None and iptal.is_set():
+                return "", None  # İptal nedeniyle boş döndü; istatistiğe girmez
+            _kazici_kaydet(isim, time.perf_counter() - baslangic, basarili)
+            if basarili:
+                return text, isim
         
-        # Fallback 1: newspaper3k
-        if NEWSPAPER_AVAILABLE:
-            try:
-                article = Article(url)
-                article.download()
-                article.parse()
-                
-                text = article.text
-                if text and len(text) > 50:
-                    text = text.strip()[:500]
-                    if len(text) == 500:
-                        text += "..."
-                    print(f"   > [SCRAPE] newspaper3k: {len(text)} karakter")
-                    return text
-            except Exception as e:
-                print(f"   > [SCRAPE] newspaper3k hatası: {e}")
+        return "", None
+    
+    def _newspaper_cek(self, url):
+        article = Article(url)
+        article.download()
+        article.parse()
         
-        # Fallback 2: trafilatura
-        if TRAFILATURA_AVAILABLE:
-            try:
-                downloaded = trafilatura.fetch_url(url)
-                if downloaded:
-                    text = trafilatura.extract(downloaded, include_comments=False, include_tables=False)
-                    if text and len(text) > 50:
-                        text = text.strip()[:500]
-                        if len(text) == 500:
-                            text += "..."
-                        print(f"   > [SCRAPE] trafilatura: {len(text)} karakter")
-                        return text
-            except Exception as e:
-                print(f"   > [SCRAPE] trafilatura hatası: {e}")
+        text = article.text
+        if text and len(text) > 50:
+            text = text.strip()[:500]
+            if len(text) == 500:
+                text += "..."
+            log.info("   > [SCRAPE] newspaper3k: %d karakter", len(text))
+            return text
+        return ""
+    
+    def _trafilatura_cek(self, url):
+        downloaded = trafilatura.fetch_url(url)
+        if downloaded:
+            text = trafilatura.extract(downloaded, include_comments=False, include_tables=False)
+            if text and len(text) > 50:
+                text = text.strip()[:500]
+                if len(text) == 500:
+                    text += "..."
+                log.info("   > [SCRAPE] trafilatura: %d karakter", len(text))
+                return text
+        return ""
+    
+    def _selenium_scrape(self, url, iptal=None):
+        """Selenium ile haber içeriği çek (sürücü havuzdan ödünç alınır, kısa bekleme)"""
+        with tarayici_havuzu.al(timeout=HABER_TARAYICI_BEKLEME) as driver:
+            content = self._selenium_oku(driver, url, iptal)
+        
+        if content and len(content) > 50:
+            import re
+            # Gereksiz boşlukları ve newline'ları temizle
+            content = re.sub(r'\n+', ' ', content)
+            content = re.sub(r'\s+', ' ', content).strip()
+            
+            # İlk 600 karakteri al
+            content = content[:600]
+            if len(content) == 600:
+                content += "..."
+            log.info("   > [SCRAPE] Selenium: %d karakter alındı", len(content))
+            return content
         
         return ""
     
-    def _selenium_scrape(self, url):
-        """Selenium ile haber içeriği çek"""
-        driver = None
-        try:
-            import time as _time
-            
-            # Headless Chrome ayarları
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-            chrome_options.add_argument("--log-level=3")
-            
-            # ChromeDriver başlat
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(20)  # 20 saniye timeout
-            
+    def _selenium_oku(self, driver, url, iptal=None):
+        """Sayfaya gidip paragraf metnini toplar; redirect başarısızsa (veya iptalde) boş döner"""
+        with span("selenium.sayfa", upstream="selenium", url=url):
             # Sayfaya git
             driver.get(url)
             
             # Google News ise redirect'i bekle (max 5 saniye)
             if "news.google.com" in url:
+                bekle = iptal.wait if iptal is not None else time.sleep
                 for _ in range(10):  # 10 x 0.5s = 5 saniye
-                    _time.sleep(0.5)
+                    if bekle(0.5):  # İptal edildi
+                        return ""
                     current = driver.current_url
                     if "news.google.com" not in current and "google.com" not in current:
                         break
-            
-            # Final URL'yi logla
-            final_url = driver.current_url
-            print(f"   > [SCRAPE] Selenium: {final_url[:60]}...")
-            
-            # Hala Google'da ise başarısız
-            if "google.com" in final_url:
-                driver.quit()
-                print("   > [SCRAPE] Redirect başarısız, hala Google'da")
-                return ""
-            
-            # Sayfa içeriğini al - önce paragrafları dene
-            content = ""
-            
-            # Paragraf selector'ları
-            p_selectors = [
-                "article p", ".article-body p", ".news-detail p", 
-                ".content-text p", ".post-content p", "main p", "#content p",
-                ".article p", ".news p", ".detail p", "p"
-            ]
-            
-            for selector in p_selectors:
+        
+        # Final URL'yi logla
+        final_url = driver.current_url
+        log.info("   > [SCRAPE] Selenium: %s...", final_url[:60])
+        
+        # Hala Google'da ise başarısız
+        if "google.com" in final_url:
+            log.info("   > [SCRAPE] Redirect başarısız, hala Google'da")
+            return ""
+        
+        # Sayfa içeriğini al - önce paragrafları dene
+        content = ""
+        
+        # Paragraf selector'ları
+        p_selectors = [
+            "article p", ".article-body p", ".news-detail p", 
+            ".content-text p", ".post-content p", "main p", "#content p",
+            ".article p", ".news p", ".detail p", "p"
+        ]
+        
+        for selector in p_selectors:
+            try:
+                elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                if elements:
+                    paragraphs = []
+                    for elem in elements[:15]:  # Max 15 paragraf
+                        text = elem.text.strip()
+                        # Kısa satırları filtrele (20 karakter)
+                        if len(text) > 20:
+                            paragraphs.append(text)
+                    
+                    if paragraphs:
+                        content = ' '.join(paragraphs)
+                        if len(content) > 100:  # En az 100 karakter
+                            break
+            except:
+                continue
+        
+        # Fallback: article veya main tag'inin tamamını al
+        if len(content) < 100:
+            for tag in ["article", "main", ".content", "#content"]:
                 try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        paragraphs = []
-                        for elem in elements[:15]:  # Max 15 paragraf
-                            text = elem.text.strip()
-                            # Kısa satırları filtrele (20 karakter)
-                            if len(text) > 20:
-                                paragraphs.append(text)
-                        
-                        if paragraphs:
-                            content = ' '.join(paragraphs)
-                            if len(content) > 100:  # En az 100 karakter
-                                break
+                    elem = driver.find_element(By.CSS_SELECTOR, tag)
+                    text = elem.text.strip()
+                    if len(text) > len(content):
+                        content = text
                 except:
                     continue
-            
-            # Fallback: article veya main tag'inin tamamını al
-            if len(content) < 100:
-                for tag in ["article", "main", ".content", "#content"]:
-                    try:
-                        elem = driver.find_element(By.CSS_SELECTOR, tag)
-                        text = elem.text.strip()
-                        if len(text) > len(content):
-                            content = text
-                    except:
-                        continue
-            
-            driver.quit()
-            
-            if content and len(content) > 50:
-                import re
-                # Gereksiz boşlukları ve newline'ları temizle
-                content = re.sub(r'\n+', ' ', content)
-                content = re.sub(r'\s+', ' ', content).strip()
-                
-                # İlk 600 karakteri al
-                content = content[:600]
-                if len(content) == 600:
-                    content += "..."
-                print(f"   > [SCRAPE] Selenium: {len(content)} karakter alındı")
-                return content
-            
-            return ""
-            
-        except Exception as e:
-            if driver:
-                driver.quit()
-            raise e
+        
+        return content
     
     def _get_real_url(self, google_news_url):
         """Google News redirect URL'sinden gerçek haber URL'sini al"""
@@ -460,7 +676,7 @@ class ActionHaberGetir:
                                     if char in url_part:
                                         url_part = url_part.split(char)[0]
                                 if url_part.startswith('http'):
-                                    print(f"   > [SCRAPE] Decoded URL: {url_part[:60]}...")
+                                    log.debug("   > [SCRAPE] Decoded URL: %s...", url_part[:60])
                                     return url_part
                         except:
                             continue
@@ -468,10 +684,10 @@ class ActionHaberGetir:
                     pass
             
             # Decode başarısız olursa None dön
-            print("   > [SCRAPE] URL decode başarısız")
+            log.debug("   > [SCRAPE] URL decode başarısız")
             return None
         except Exception as e:
-            print(f"   > [SCRAPE] URL decode hatası: {e}")
+            log.warning("   > [SCRAPE] URL decode hatası: %s", e)
             return None
     
     def _gnews_cek(self, varlik):
@@ -481,7 +697,7 @@ class ActionHaberGetir:
             
             # API key kontrolü
             if not GNEWS_API_KEY or GNEWS_API_KEY == "your_gnews_api_key":
-                print("   > [HABER] GNews API anahtarı ayarlanmamış, Google News'e düşülüyor...")
+                log.info("   > [HABER] GNews API anahtarı ayarlanmamış, Google News'e düşülüyor...")
                 return None
             
             # Varlık için finansal bağlamlı arama terimi kullan
@@ -491,16 +707,18 @@ class ActionHaberGetir:
             # GNews Search API - Türkçe haberler
             url = f"https://gnews.io/api/v4/search?q={arama_encoded}&lang=tr&country=tr&max=5&apikey={GNEWS_API_KEY}"
             
-            response = requests.get(url, timeout=10)
+            with span("gnews.arama", upstream="gnews", varlik=varlik) as s:
+                response = istemci.get(url, timeout=10)
+                s.ozellik(durum=response.status_code)
             
             if response.status_code != 200:
-                print(f"   > [HABER] GNews API hata kodu: {response.status_code}")
+                log.warning("   > [HABER] GNews API hata kodu: %s", response.status_code)
                 return None
             
             data = response.json()
             
             if data.get("totalArticles", 0) == 0:
-                print("   > [HABER] GNews'den haber bulunamadı")
+                log.info("   > [HABER] GNews'den haber bulunamadı")
                 return None
             
             haberler = []
@@ -514,11 +732,11 @@ class ActionHaberGetir:
                 }
                 haberler.append(haber)
             
-            print(f"   > [HABER] GNews'den {len(haberler)} haber alındı")
+            log.info("   > [HABER] GNews'den %d haber alındı", len(haberler))
             return haberler
             
         except Exception as e:
-            print(f"   > [HABER] GNews API hatası: {e}")
+            log.warning("   > [HABER] GNews API hatası: %s", e)
             return None
     
     def _google_news_cek(self, varlik):
@@ -531,7 +749,9 @@ class ActionHaberGetir:
             
             arama = quote(HABER_ARAMA_MAP.get(varlik, VARLIK_ISIM.get(varlik, varlik)))
             url = f"https://news.google.com/rss/search?q={arama}&hl=tr&gl=TR&ceid=TR:tr"
-            response = requests.get(url, timeout=10)
+            with span("google_news.rss", upstream="google_news", varlik=varlik) as s:
+                response = istemci.get(url, timeout=10)
+                s.ozellik(durum=response.status_code)
             if response.status_code != 200: return None
             
             root = ET.fromstring(response.content)
@@ -585,7 +805,8 @@ class ActionHaberGetir:
                         link = link_elem.tail.strip()
                 
                 # Debug: URL ve description durumunu logla
-                print(f"   > [DEBUG] Title: {title[:40]}... | URL: {'VAR' if link else 'YOK'} | Desc: {'VAR' if description else 'BOŞ'}")
+                log.debug("   > [DEBUG] Title: %s... | URL: %s | Desc: %s",
+                          title[:40], 'VAR' if link else 'YOK', 'VAR' if description else 'BOŞ')
                 
                 # Yayın tarihi
                 pub_date = ""
@@ -606,32 +827,96 @@ class ActionHaberGetir:
                     "date": pub_date
                 })
             
-            print(f"   > [HABER] Google News RSS'den {len(haberler)} haber alındı")
+            log.info("   > [HABER] Google News RSS'den %d haber alındı", len(haberler))
             return haberler
         except Exception as e:
-            print(f"   > [HABER] Google News RSS hatası: {e}")
+            log.warning("   > [HABER] Google News RSS hatası: %s", e)
             return None
     
+    def _icerikleri_topla(self, adaylar, gosterim, sure=HABER_ZENGINLESTIRME_SURESI):
+        """
+        Açıklaması olmayan (URL'li) adayların içeriği paralel scrape edilir.
+        Başlık sırasına göre ilk `gosterim` kullanılabilir haber belli olunca
+        veya süre (ya da istek bütçesi) dolunca kalan scrape'ler iptal edilir.
+        Dönüş: aday başına içerik; kullanılamayan / yetişmeyen aday için None.
+        """
+        kalan = kalan_sure()
+        if kalan is not None:
+            sure = max(0.0, min(sure, kalan))
+        
+        icerikler = [None] * len(adaylar)
+        cozuldu = [True] * len(adaylar)
+        bekleyenler = {}
+        iptal = threading.Event()
+        for i, h in enumerate(adaylar):
+            desc = h.get('description', '')  # TradingView'dan geliyorsa dolu olacak
+            if desc and len(desc) >= 30:
+                icerikler[i] = desc
+            elif h.get('url'):
+                cozuldu[i] = False
+                bekleyenler[_kazima_havuzu.submit(baglami_tasi(self._icerik_cek), h['url'], iptal)] = i
+        
+        def _yeterli():
+            # Sıradaki ilk `gosterim` kullanılabilir haber kesinleşti mi?
+            kullanilabilir = 0
+            for i in range(len(adaylar)):
+                if not cozuldu[i]:
+                    return False
+                if icerikler[i] is not None:
+                    kullanilabilir += 1
+                    if kullanilabilir >= gosterim:
+                        return True
+            return True
+        
+        with span("haber.zenginlestir", aday=len(adaylar), scrape=len(bekleyenler), sure_s=sure) as s:
+            baslangic = time.monotonic()
+            kazananlar = []
+            while bekleyenler and not _yeterli():
+                bitenler, _ = wait(bekleyenler, timeout=max(0.0, baslangic + sure - time.monotonic()),
+                                   return_when=FIRST_COMPLETED)
+                if not bitenler:
+                    log.warning("   > [HABER] İçerik toplama %.1f s içinde bitmedi, %d scrape iptal ediliyor.",
+                                sure, len(bekleyenler))
+                    break
+                for future in bitenler:
+                    i = bekleyenler.pop(future)
+                    cozuldu[i] = True
+                    try:
+                        text, kaynak = future.result()
+                    except Exception as e:
+                        log.warning("   > [HABER] %d. haber scrape hatası: %s", i + 1, e)
+                        continue
+                    if kaynak:
+                        icerikler[i] = text
+                        kazananlar.append(f"{i + 1}:{kaynak}")
+                        log.info("   > [HABER] %d. haber içeriği: %s, %.2f s", i + 1, kaynak,
+                                 time.monotonic() - baslangic)
+            
+            # Başlamamış scrape'ler hiç çalışmaz; çalışanlar sonraki scraper'a geçmez
+            iptal.set()
+            for future in bekleyenler:
+                future.cancel()
+            s.ozellik(kazanan=",".join(kazananlar), iptal=len(bekleyenler),
+                      kullanilabilir=sum(icerik is not None for icerik in icerikler))
+        return icerikler
+    
     def _formatla(self, varlik_isim, haberler):
         giris = random.choice(templates.HABER_GIRIS).format(varlik=varlik_isim)
         items = []
         
-        for idx, h in enumerate(haberler[:5]):  # Max 5 haber dene
+        adaylar = haberler[:5]  # Max 5 haber dene
+        icerikler = self._icerikleri_topla(adaylar, gosterim=3)
+        
+        for h, desc in zip(adaylar, icerikler):
             if len(items) >= 3:  # Max 3 göster
                 break
                 
             title = h.get('title', '')
             source = h.get('source', '')
             date = h.get('date', '')
-            url = h.get('url', '')
-            desc = h.get('description', '')  # TradingView'dan geliyorsa dolu olacak
-            
-            # Description yoksa ve URL varsa scrape et
-            if (not desc or len(desc) < 30) and url:
-                desc = self._icerik_cek(url)
             
             # İçerik yoksa bu haberi atla
-            if not desc or len(desc) < 30:
+            if desc is None:
                 continue
             
             # Kaynak ve tarih satırı oluştur
@@ -658,46 +943,83 @@ class ActionHaberGetir:
 # ACTION: ŞİRKET BİLGİSİ
 # =============================================================================
 
+# Şirket bilgisi cevabında kullanılan info alanları (tazelik bunlara göre belirlenir)
+SIRKET_ALANLARI = ("longBusinessSummary", "sector", "industry", "marketCap", "trailingPE",
+                   "forwardPE", "fiftyTwoWeekHigh", "fiftyTwoWeekLow", "recommendationKey", "currency")
+PIYASA_ALANLARI = ("open", "previousClose", "dayLow", "dayHigh", "volume", "currency")
+
 class ActionSirketBilgisi:
+    GEREKSINIMLER = ("varlik",)
+
     def execute(self, varlik, soru, **kwargs):
         varlik_isim = VARLIK_ISIM.get(varlik, varlik)
-        cached = _cache_kontrol(_sirket_cache, varlik, CACHE_SURESI * 2)
-        if cached: return self._formatla(varlik_isim, cached)
-        
+        # Ham info ortak cache'ten (ticker_bilgi), çeviriler ceviri_cache'ten gelir
         bilgi = self._bilgi_cek(varlik)
         if not bilgi: return random.choice(templates.SIRKET_BILGI_YOK).format(varlik=varlik_isim)
         
-        _cache_kaydet(_sirket_cache, varlik, bilgi)
         return self._formatla(varlik_isim, bilgi)
     
     def _ceviri_yap(self, text):
         """DeepL API ile metni Türkçe'ye çevirir"""
-        if not text or len(text) < 5 or "DEEPL" not in globals() and not DEEPL_API_KEY:
-            return text
-            
+        return self._ceviriler_yap([text]).get(text, text)
+    
+    def _ceviriler_yap(self, metinler, hedef_dil=CEVIRI_HEDEF_DIL):
+        """
+        {metin: çeviri}. Bilinen metinler kalıcı çeviri hafızasından
+        (ceviri_cache, anahtar: hedef dil + kaynak metin) gelir; eksikler
+        tek bir çok-text DeepL çağrısında çevrilir. Çevrilemeyen metin
+        kendisi olarak döner.
+        """
+        sonuc, eksikler = {}, []
+        for metin in dict.fromkeys(metinler):
+            if not metin or len(metin) < 5 or not DEEPL_API_KEY:
+                sonuc[metin] = metin
+                continue
+            ceviri = ceviri_cache.al(f"{hedef_dil}|{metin}", _YOK)
+            if ceviri is _YOK:
+                eksikler.append(metin)
+            else:
+                # Negatif kayıt (yakın zamanda başarısız): orijinal metin
+                sonuc[metin] = ceviri or metin
+        aktif_span().ozellik(ceviri_hafiza=len(sonuc), ceviri_eksik=len(eksikler))
+        if not eksikler:
+            return sonuc
+        
+        ceviriler = self._deepl_cevir_toplu(eksikler, hedef_dil)
+        # Başarısız çağrı tüm eksikler için negatif kaydedilir (NEGATIF_CACHE_SURESI)
+        ceviri_cache.kaydet_coklu({
+            f"{hedef_dil}|{metin}": ceviriler[i] if ceviriler else None for i, metin in enumerate(eksikler)
+        })
+        for i, metin in enumerate(eksikler):
+            sonuc[metin] = ceviriler[i] if ceviriler else metin
+        return sonuc
+    
+    def _deepl_cevir_toplu(self, metinler, hedef_dil=CEVIRI_HEDEF_DIL):
+        """Tek DeepL çağrısında birden fazla text; sırayla çeviriler veya başarısızsa None."""
         try:
             # DeepL API URL (Free veya Pro)
             url = "https://api-free.deepl.com/v2/translate"
             if DEEPL_API_KEY and not DEEPL_API_KEY.endswith(":fx"):
                 url = "https://api.deepl.com/v2/translate"
             
-            payload = {
-                "auth_key": DEEPL_API_KEY,
-                "text": text,
-                "target_lang": "TR"
-            }
+            # Tekrarlanan "text" alanları tek istekte çoklu çeviri demektir (sıra korunur)
+            payload = [("auth_key", DEEPL_API_KEY), ("target_lang", hedef_dil)]
+            payload += [("text", metin) for metin in metinler]
             
-            response = requests.post(url, data=payload, timeout=5)
+            with span("deepl.ceviri", upstream="deepl", metin=len(metinler),
+                      karakter=sum(len(m) for m in metinler)) as s:
+                response = istemci.post(url, data=payload, timeout=5, yeniden_dene=True)
+                s.ozellik(durum=response.status_code)
             if response.status_code == 200:
-                result = response.json()
-                if "translations" in result and len(result["translations"]) > 0:
-                    return result["translations"][0]["text"]
+                ceviriler = response.json().get("translations", [])
+                if len(ceviriler) == len(metinler):
+                    return [c["text"] for c in ceviriler]
             else:
-                print(f"   > [ÇEVİRİ] DeepL Hatası ({response.status_code}): {response.text}")
+                log.warning("   > [ÇEVİRİ] DeepL Hatası (%s): %s", response.status_code, response.text)
         except Exception as e:
-            print(f"   > [ÇEVİRİ] İstek hatası: {e}")
+            log.warning("   > [ÇEVİRİ] İstek hatası: %s", e)
             
-        return text
+        return None
 
     def _bilgi_cek(self, varlik):
         if not YFINANCE_AVAILABLE: return None
@@ -717,8 +1039,7 @@ class ActionSirketBilgisi:
         elif "=F" in ticker_kod or "GC" in ticker_kod or "SI" in ticker_kod: category = "EMTIA"
         
         try:
-            ticker = yf.Ticker(ticker_kod)
-            info = ticker.info
+            info = ticker_bilgi.al(ticker_kod, SIRKET_ALANLARI if category == "HISSE" else PIYASA_ALANLARI)
             
             # --- HİSSE SENEDİ ÖZEL VERİLERİ ---
             if category == "HISSE":
@@ -740,16 +1061,12 @@ class ActionSirketBilgisi:
                 rec_key = info.get("recommendationKey", "nötr").replace("_", " ").title()
                 recommendation = rec_map.get(rec_key, rec_key)
                 
-                # Özet ve Çeviri
+                # Özet ve Sektör Çevirileri (hafızada olmayanlar tek DeepL çağrısında)
                 summary_raw = info.get("longBusinessSummary", "")
-                summary = ""
-                if summary_raw:
-                    ozet_kisa = summary_raw[:400].rsplit('.', 1)[0] + "."
-                    summary = self._ceviri_yap(ozet_kisa)
-                
-                # Sektör Çevirisi
-                sector = self._ceviri_yap(info.get("sector", "Genel"))
-                industry = self._ceviri_yap(info.get("industry", ""))
+                ozet_kisa = summary_raw[:400].rsplit('.', 1)[0] + "." if summary_raw else ""
+                metinler = (ozet_kisa, info.get("sector", "Genel"), info.get("industry", ""))
+                ceviriler = self._ceviriler_yap(metinler)
+                summary, sector, industry = (ceviriler.get(metin, metin) for metin in metinler)
                 
                 # Piyasa Değeri Formatlama (milyar)
                 if market_cap:
@@ -822,30 +1139,41 @@ class ActionSirketBilgisi:
 # =============================================================================
 
 class ActionFiyatSorgula:
+    GEREKSINIMLER = ("varlik",)
+
     def execute(self, varlik, soru, **kwargs):
         varlik_isim = VARLIK_ISIM.get(varlik, varlik)
         para = PARA_BIRIMI.get(varlik, "TL")
         
-        fiyat = _cache_kontrol(_fiyat_cache, varlik, CACHE_SURESI)
-        if fiyat is None:
-            fiyat = self._fiyat_cek(varlik)
-            if fiyat: _cache_kaydet(_fiyat_cache, varlik, fiyat)
+        # Fiyat normalde toplu yenileyicinin yazdığı cache'ten gelir (bkz. FiyatYenileyici)
+        fiyat = fiyat_cache.al_veya_yukle(varlik, lambda: on_yukleme_sonucu("fiyat", varlik), zamanli=True)
+        zaman = fiyat_cache.zaman(varlik) or time.time()
         
         if fiyat is None: 
             return random.choice(templates.FIYAT_HATA).format(varlik_isim=varlik_isim)
         
         # Türkçe sayı formatı (Örn: 284.50 -> 284,50)
         fiyat_str = f"{fiyat:,.2f} {para}".replace(",", "TEMP").replace(".", ",").replace("TEMP", ".")
-        return random.choice(templates.FIYAT_BASARILI).format(varlik_isim=varlik_isim, fiyat=fiyat_str)
+        an = datetime.fromtimestamp(zaman, TR_SAATI)
+        # Bugünden eski veri (kapalı piyasa / tatil / bayat ticker) tarihiyle etiketlenir
+        bicim = "%H:%M:%S" if an.date() == datetime.now(TR_SAATI).date() else "%d.%m.%Y %H:%M"
+        saat = an.strftime(bicim)
+        return (random.choice(templates.FIYAT_BASARILI).format(varlik_isim=varlik_isim, fiyat=fiyat_str)
+                + templates.FIYAT_ZAMANI.format(saat=saat))
     
     def _fiyat_cek(self, varlik):
+        """(fiyat, barın zamanı) veya None; eski bar (tatil / kapalı piyasa) o günün kapanışıyla zamanlanır."""
         if not YFINANCE_AVAILABLE: return None
         ticker_kod = TICKER_MAP.get(varlik)
         try:
             # history metodu daha stabildir
-            ticker = yf.Ticker(ticker_kod)
-            data = ticker.history(period="1d")
-            return float(data['Close'].iloc[-1]) if not data.empty else None
+            with span("yfinance.history", upstream="yfinance", ticker=ticker_kod, period="1d"):
+                ticker = yf.Ticker(ticker_kod)
+                data = ticker.history(period="1d")
+            if data.empty:
+                return None
+            zaman = min(time.time(), bar_kapanis_zamani(ticker_kod, data.index[-1].date()).timestamp())
+            return float(data['Close'].iloc[-1]), zaman
         except: return None
 
 # =============================================================================
@@ -853,15 +1181,23 @@ class ActionFiyatSorgula:
 # =============================================================================
 
 class ActionTrendAnaliz:
+    GEREKSINIMLER = ("varlik",)
+    HEDEF_ALANLARI = ("currentPrice", "previousClose", "targetMeanPrice", "recommendationKey", "currency")
+
+    def alt_gorevler(self, varlik):
+        """Birbirinden bağımsız dış çağrılar: teknik analiz (6 aylık bar) ve analist hedefi (info)."""
+        return {
+            "teknik": lambda: TeknikAnaliz().analiz_et(varlik),
+            "hedef_fiyat": lambda: self._hedef_fiyat_cek(varlik),
+        }
+
     def execute(self, varlik, soru, **kwargs):
         varlik_isim = VARLIK_ISIM.get(varlik, varlik)
         
-        # Teknik Analiz Verisi
-        analizci = TeknikAnaliz()
-        teknik = analizci.analiz_et(varlik)
-        
-        # Analist Hedef Fiyatları
-        hedef_fiyat = self._hedef_fiyat_cek(varlik)
+        # Teknik Analiz ve Analist Hedef Fiyatları (paralel, ortak süre sınırı)
+        sonuclar = paralel_calistir(self.alt_gorevler(varlik))
+        teknik = sonuclar["teknik"]
+        hedef_fiyat = sonuclar["hedef_fiyat"]
         
         giris = random.choice(templates.ANALIST_GIRIS).format(varlik=varlik_isim)
         
@@ -895,7 +1231,7 @@ class ActionTrendAnaliz:
                 ticker_kod += ".IS"
                 
         try:
-            info = yf.Ticker(ticker_kod).info
+            info = ticker_bilgi.al(ticker_kod, self.HEDEF_ALANLARI)
             current = info.get("currentPrice") or info.get("previousClose")
             target = info.get("targetMeanPrice")
             
@@ -929,6 +1265,8 @@ class ActionTrendAnaliz:
 
 
 class ActionAlimSatimUyari:
+    GEREKSINIMLER = ("varlik",)
+
     def execute(self, varlik, soru, **kwargs):
         """Kullanıcının alım-satım sorusuna teknik analiz ile cevap verir"""
         varlik_isim = VARLIK_ISIM.get(varlik, varlik)
@@ -983,12 +1321,154 @@ ACTION_MAP = {
     'Piyasa Trend/Tahmin': ActionTrendAnaliz(),
 }
 
-def execute_action(niyet, varlik, soru, analiz=None):
+# =============================================================================
+# SPEKÜLATİF ÖN YÜKLEME
+# =============================================================================
+# Varlık NER ile bulunur bulunmaz ucuz ve çoğu aksiyonun paylaştığı veriler
+# (son fiyat, 6 aylık günlük bar) arka planda çekilmeye başlanır. BERT ve
+# Zemberek bu sırada çalışır; seçilen aksiyon uçuştaki sonucu bekler.
+
+ON_YUKLEME_KAYNAKLARI = {
+    "fiyat": ACTION_MAP['Hedef Fiyat Sorgulama']._fiyat_cek,
+    "gecmis": _gunluk_gecmis_cek,
+}
+
+_on_yukleme_havuzu = ThreadPoolExecutor(ON_YUKLEME_ISCI, thread_name_prefix="on_yukleme")
+_on_yuklemeler = {}   # (tür, varlık) -> (future, başlangıç zamanı)
+_on_yukleme_kilit = threading.Lock()
+
+def on_yukle(varlik):
+    """Varlık için fiyat ve günlük geçmişi arka planda çekmeye başlar (zaten uçuştaysa atlar)."""
+    if not ON_YUKLEME_AKTIF or not YFINANCE_AVAILABLE or not ANALYSIS_AVAILABLE:
+        return
+    simdi = time.time()
+    with _on_yukleme_kilit:
+        for tur, kaynak in ON_YUKLEME_KAYNAKLARI.items():
+            kayit = _on_yuklemeler.get((tur, varlik))
+            if kayit is not None and simdi - kayit[1] < ON_YUKLEME_SURESI:
+                continue
+            if tur == "fiyat" and varlik in fiyat_cache:
+                continue
+            _on_yuklemeler[(tur, varlik)] = (_on_yukleme_havuzu.submit(kaynak, varlik), simdi)
+
+def on_yukleme_sonucu(tur, varlik):
+    """
+    Uçuştaki (veya ON_YUKLEME_SURESI içinde tamamlanmış) ön yüklemenin
+    sonucunu döndürür; yoksa veriyi doğrudan çeker.
+    """
+    with _on_yukleme_kilit:
+        kayit = _on_yuklemeler.get((tur, varlik))
+        if kayit is not None and time.time() - kayit[1] >= ON_YUKLEME_SURESI:
+            del _on_yuklemeler[(tur, varlik)]
+            kayit = None
+    if kayit is None:
+        aktif_span().ozellik(on_yukleme="yok")
+        return ON_YUKLEME_KAYNAKLARI[tur](varlik)
+
+    future = kayit[0]
+    with span("on_yukleme.bekle", tur=tur, varlik=varlik, hazir=future.done()):
+        try:
+            sonuc = future.result()
+        except Exception:
+            sonuc = None
+            raise
+        finally:
+            # Hatalı / boş sonuç sonraki isteklerde tekrar kullanılmasın
+            if sonuc is None:
+                with _on_yukleme_kilit:
+                    if _on_yuklemeler.get((tur, varlik)) is kayit:
+                        del _on_yuklemeler[(tur, varlik)]
+        return sonuc
+
+# =============================================================================
+# TOPLU FİYAT YENİLEYİCİ
+# =============================================================================
+# Tek bir zamanlayıcı thread'i her FIYAT_YENILEME_SURESI saniyede
+# TICKER_MAP'teki tüm varlıkları tek bir yf.download çağrısıyla çekip fiyat
+# cache'ine yazar. Fiyat cevapları bellekten ve "itibarıyla" zamanıyla
+# verilir; dış istek sayısı kullanıcı sayısına değil döngü sayısına bağlıdır.
+# yf.download eşzamanlı çağrılara karşı güvenli olmadığından yalnızca bu
+# thread çağırır.
+
+class FiyatYenileyici:
+    def __init__(self, sure=FIYAT_YENILEME_SURESI):
+        self.sure = sure
+        self._dur = threading.Event()
+        self._thread = None
+        self.sayac = {"dongu": 0, "hata": 0, "eksik": 0, "eski_bar": 0}
+
+    def yenile(self):
+        """Tüm varlıkları tek toplu indirmeyle çeker, cache'e yazar ve {varlik: fiyat} döndürür."""
+        varliklar = {ticker: varlik for varlik, ticker in TICKER_MAP.items()}
+        with span("yfinance.download", upstream="yfinance", ticker=len(varliklar)) as s:
+            # 5 günlük pencere: tatil / farklı seans takvimlerinde de son kapanış bulunur
+            df = yf.download(list(varliklar), period="5d", interval="1d", group_by="ticker",
+                             progress=False, threads=True)
+            s.ozellik(satir=len(df))
+        zaman = time.time()
+
+        fiyatlar, zamanlar = {}, {}
+        for ticker, varlik in varliklar.items():
+            try:
+                kapanis = df[ticker]["Close"].dropna()
+            except KeyError:
+                kapanis = None
+            if kapanis is None or kapanis.empty:
+                self.sayac["eksik"] += 1
+                continue
+            fiyatlar[varlik] = float(kapanis.iloc[-1])
+            # Fiyatın zamanı son barınki: bugünün barı için şimdi, eski bir bar (tatil,
+            # kapalı piyasa, güncellenmeyen ticker) için o günün seans kapanışı
+            bar_kapanisi = bar_kapanis_zamani(ticker, kapanis.index[-1].date()).timestamp()
+            zamanlar[varlik] = min(zaman, bar_kapanisi)
+            if zaman - bar_kapanisi > 86400:
+                self.sayac["eski_bar"] += 1
+
+        # Tek kilit altında: okuyucular her varlık için ya eski ya yeni fiyatı görür
+        fiyat_cache.kaydet_coklu(fiyatlar, zaman=zaman, zamanlar=zamanlar)
+        self.sayac["dongu"] += 1
+        log.debug("   > [FİYAT] Toplu yenileme: %d/%d varlık", len(fiyatlar), len(varliklar))
+        return fiyatlar
+
+    def _dongu(self):
+        while not self._dur.is_set():
+            baslangic = time.time()
+            try:
+                self.yenile()
+            except Exception as e:
+                self.sayac["hata"] += 1
+                log.warning("   > [FİYAT] Toplu yenileme hatası: %s", e)
+            self._dur.wait(max(0.0, self.sure - (time.time() - baslangic)))
+
+    def baslat(self):
+        """Zamanlayıcı thread'ini başlatır (zaten çalışıyorsa bir şey yapmaz)."""
+        if not FIYAT_YENILEYICI_AKTIF or not YFINANCE_AVAILABLE:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._dur.clear()
+        self._thread = threading.Thread(target=self._dongu, name="fiyat_yenileyici", daemon=True)
+        self._thread.start()
+
+    def durdur(self):
+        self._dur.set()
+
+fiyat_yenileyici = FiyatYenileyici()
+
+# Aksiyonların GEREKSINIMLER ile isteyebileceği girdiler (chat.ASAMALAR):
+# "varlik", "niyet", "morfoloji" (Zemberek özeti), "hafiza" (konuşma hafızası)
+
+def aksiyon_gereksinimleri(niyet):
+    """Niyete karşılık gelen aksiyonun ihtiyaç duyduğu girdi isimleri."""
+    action = ACTION_MAP.get(niyet, ACTION_MAP['Genel Bilgi/Durum'])
+    return action.GEREKSINIMLER
+
+def execute_action(niyet, varlik, soru, **girdiler):
     """
-    Doğru action sınıfını bulur ve Zemberek analizini iletir.
+    Doğru action sınıfını bulur ve aksiyonun bildirdiği ek girdileri
+    (örn. morfoloji=..., hafiza=...) anahtar kelime olarak iletir.
     """
     action = ACTION_MAP.get(niyet)
     if action:
-        # analiz verisi 'analiz' anahtar kelimesiyle gönderilir
-        return action.execute(varlik, soru, analiz=analiz)
+        return action.execute(varlik, soru, **girdiler)
     return ACTION_MAP['Genel Bilgi/Durum'].execute(varlik, soru)
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""
+Finansal Chatbot - Yerel Günlük Bar (OHLCV) Deposu
+==================================================
+Her ticker için günlük barları düz (sıkıştırılmamış) bir .npy dosyasında
+(./bar_verisi/<ticker>.npy, BAR_DTYPE yapılandırılmış dizisi) tutar. Dosya
+memory-map ile açılır; TeknikAnaliz'e buradan hizmet verilir.
+
+Her istekte yalnızca son kayıtlı günden bu yana eksik barlar çekilir
+(son gün dahil: gün içi bar kapanışta revize edilir) ve dosya atomik
+olarak (geçici dosya + os.replace) yeniden yazılır. Piyasa kapalıysa ve
+son çekim kapanıştan sonra yapıldıysa hiç ağ çağrısı yapılmaz.
+
+Fiyatlar yfinance'in düzeltilmiş (auto_adjust) fiyatlarıdır. Temettü veya
+bölünme (BIST'te bedelsiz) sonrası yfinance tüm geçmişi yeniden düzeltir;
+delta çekimde yeni bir kurumsal işlem görülürse eski ve yeni düzeltme
+tabanları karışmasın diye geçmiş baştan çekilir.
+
+Kullanım:
+    python bar_deposu.py THY GARAN DOLAR
+"""
+
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from config import BAR_KLASORU, BAR_ILK_DONEM, BAR_YENILEME_SURESI
+from izleme import log, span
+
+# yfinance import
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = True
+except ImportError:
+    YFINANCE_AVAILABLE = False
+
+BAR_DTYPE = np.dtype([
+    ("ts", "<i8"),        # İşlem günü (borsa yerel tarihi, UTC gece yarısı epoch saniye)
+    ("open", "<f8"), ("high", "<f8"), ("low", "<f8"), ("close", "<f8"), ("volume", "<f8"),
+])
+
+# =============================================================================
+# PİYASA SAATLERİ
+# =============================================================================
+
+TR_SAATI = timezone(timedelta(hours=3))
+BIST_ACILIS = (10, 0)
+BIST_KAPANIS = (18, 10)
+BIST_KESIN_KAPANIS = (18, 30)   # 18:10 kapanış + kapanış seansı verisinin oturması
+
+def son_kapanis(ticker, simdi=None):
+    """
+    Piyasa şu an kapalıysa en son kapanış anını (datetime), açıksa None döndürür.
+    BIST (.IS): hafta içi 10:00-18:30 TR. Döviz / vadeli (=X, =F): Pazar 22:00 -
+    Cuma 22:00 UTC. Resmi tatiller dikkate alınmaz (o gün delta boş döner).
+    """
+    simdi = simdi or datetime.now(timezone.utc)
+    if ticker.endswith(".IS"):
+        yerel = simdi.astimezone(TR_SAATI)
+        acilis = yerel.replace(hour=BIST_ACILIS[0], minute=BIST_ACILIS[1], second=0, microsecond=0)
+        kapanis = yerel.replace(hour=BIST_KESIN_KAPANIS[0], minute=BIST_KESIN_KAPANIS[1], second=0, microsecond=0)
+        if yerel.weekday() < 5 and acilis <= yerel < kapanis:
+            return None
+        if yerel < kapanis or yerel.weekday() >= 5:
+            kapanis -= timedelta(days=1)
+        while kapanis.weekday() >= 5:
+            kapanis -= timedelta(days=1)
+        return kapanis
+
+    # 24/5 piyasalar
+    utc = simdi.astimezone(timezone.utc)
+    cuma_kapanis = (utc - timedelta(days=(utc.weekday() - 4) % 7)).replace(hour=22, minute=0, second=0, microsecond=0)
+    pazar_acilis = cuma_kapanis + timedelta(days=2)
+    if cuma_kapanis <= utc < pazar_acilis:
+        return cuma_kapanis
+    return None
+
+def bar_kapanis_zamani(ticker, gun):
+    """Günlük barın (gun: date) seans kapanış anı: BIST 18:10 TR, 24/5 piyasalar 22:00 UTC."""
+    if ticker.endswith(".IS"):
+        return datetime(gun.year, gun.month, gun.day, *BIST_KAPANIS, tzinfo=TR_SAATI)
+    return datetime(gun.year, gun.month, gun.day, 22, 0, tzinfo=timezone.utc)
+
+# =============================================================================
+# BAR DEPOSU
+# =============================================================================
+
+class BarDeposu:
+    def __init__(self, klasor=BAR_KLASORU, yenileme_suresi=BAR_YENILEME_SURESI):
+        self.klasor = klasor
+        self.yenileme_suresi = yenileme_suresi
+        self._kilitler = defaultdict(threading.Lock)
+        self._kilitler_kilit = threading.Lock()
+        self.sayac = {"tam": 0, "delta": 0, "atlandi": 0, "yeniden_duzeltme": 0}
+
+    def _yol(self, ticker):
+        return os.path.join(self.klasor, ticker.replace("/", "_").replace("^", "_") + ".npy")
+
+    def _kilit(self, ticker):
+        with self._kilitler_kilit:
+            return self._kilitler[ticker]
+
+    def oku(self, ticker):
+        """Kayıtlı barlar (salt okunur memory-map) veya None."""
+        try:
+            return np.load(self._yol(ticker), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+    def _yaz(self, ticker, barlar):
+        """Geçici dosyaya yazıp os.replace ile değiştirir; okuyucular yarım dosya görmez."""
+        os.makedirs(self.klasor, exist_ok=True)
+        yol = self._yol(ticker)
+        gecici = f"{yol}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(gecici, "wb") as f:
+            np.save(f, np.ascontiguousarray(barlar, dtype=BAR_DTYPE))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(gecici, yol)
+
+    def _cek(self, ticker, baslangic=None):
+        """
+        yfinance'ten günlük barlar. baslangic: 'YYYY-MM-DD' (dahil).
+        Dönüş: (BAR_DTYPE dizisi, temettü / bölünme olan barların ts dizisi)
+        """
+        donem = f"{baslangic}+" if baslangic else BAR_ILK_DONEM
+        with span("yfinance.history", upstream="yfinance", ticker=ticker, period=donem) as s:
+            t = yf.Ticker(ticker)
+            df = (t.history(start=baslangic, interval="1d", auto_adjust=True, actions=True) if baslangic
+                  else t.history(period=BAR_ILK_DONEM, interval="1d", auto_adjust=True, actions=True))
+            s.ozellik(bar=len(df))
+        if df.empty:
+            return np.empty(0, dtype=BAR_DTYPE), np.empty(0, dtype=np.int64)
+
+        index = df.index.tz_localize(None) if df.index.tz is not None else df.index
+        barlar = np.empty(len(df), dtype=BAR_DTYPE)
+        barlar["ts"] = index.normalize().values.astype("datetime64[s]").astype(np.int64)
+        for alan, sutun in (("open", "Open"), ("high", "High"), ("low", "Low"), ("close", "Close"), ("volume", "Volume")):
+            barlar[alan] = df[sutun].to_numpy(dtype=np.float64)
+
+        kurumsal = np.zeros(len(df), dtype=bool)
+        for sutun in ("Dividends", "Stock Splits"):
+            if sutun in df.columns:
+                kurumsal |= df[sutun].fillna(0).to_numpy(dtype=np.float64) != 0
+        return barlar, barlar["ts"][kurumsal]
+
+    def guncelle(self, ticker):
+        """
+        Barları gerekiyorsa günceller ve döndürür:
+        - Kayıt yoksa: BAR_ILK_DONEM tam çekim
+        - Son çekim yeni veya piyasa kapalı ve kapanıştan sonra çekilmiş: ağ yok
+        - Aksi halde: son kayıtlı günden itibaren delta çekim, son gün revize edilir
+        """
+        with self._kilit(ticker):
+            mevcut = self.oku(ticker)
+            if mevcut is None or len(mevcut) == 0:
+                if not YFINANCE_AVAILABLE:
+                    return None
+                barlar, _ = self._cek(ticker)
+                if len(barlar):
+                    self._yaz(ticker, barlar)
+                self.sayac["tam"] += 1
+                return barlar
+
+            son_cekim = os.path.getmtime(self._yol(ticker))
+            kapanis = son_kapanis(ticker)
+            if (time.time() - son_cekim < self.yenileme_suresi
+                    or (kapanis is not None and son_cekim >= kapanis.timestamp())
+                    or not YFINANCE_AVAILABLE):
+                self.sayac["atlandi"] += 1
+                return mevcut
+
+            son_gun = datetime.fromtimestamp(int(mevcut["ts"][-1]), timezone.utc).strftime("%Y-%m-%d")
+            try:
+                yeni, kurumsal = self._cek(ticker, baslangic=son_gun)
+                if (kurumsal > mevcut["ts"][-1]).any():
+                    # Yeni temettü / bölünme: yfinance geçmişi yeniden düzeltti, kayıtlı barlar eski tabanda
+                    log.info("   > [BAR] %s: temettü/bölünme, geçmiş yeniden çekiliyor", ticker)
+                    barlar, _ = self._cek(ticker)
+                    if len(barlar):
+                        self._yaz(ticker, barlar)
+                        self.sayac["yeniden_duzeltme"] += 1
+                        return barlar
+            except Exception as e:
+                log.warning("   > [BAR] %s delta çekim hatası: %s", ticker, e)
+                return mevcut
+            self.sayac["delta"] += 1
+
+            if len(yeni):
+                mevcut = np.concatenate([mevcut[mevcut["ts"] < yeni["ts"][0]], yeni])
+                self._yaz(ticker, mevcut)
+            else:
+                # Yeni bar yok: çekim zamanı yine de kaydedilsin
+                os.utime(self._yol(ticker))
+            log.debug("   > [BAR] %s: %d yeni/revize bar", ticker, len(yeni))
+            return mevcut
+
+
+bar_deposu = BarDeposu()
+
+
+if __name__ == "__main__":
+    import sys
+
+    from config import TICKER_MAP
+
+    for varlik in sys.argv[1:] or ["THY"]:
+        ticker = TICKER_MAP.get(varlik, varlik)
+        for deneme in ("ilk", "ılık"):
+            baslangic = time.perf_counter()
+            barlar = bar_deposu.guncelle(ticker)
+            print(f"  {ticker:<10} {deneme:<5} {0 if barlar is None else len(barlar):>4} bar | {(time.perf_counter() - baslangic) * 1000:>8.1f} ms "
+                  f"| kapanış: {son_kapanis(ticker)} | {bar_deposu.sayac}")
@@ -0,0 +1,94 @@
+"""
+Finansal Chatbot - Batch Inference Benchmark
+============================================
+Tekil tahmin (batch=1) yolu ile tahmin_yap_batch ve mikro-batch kuyruğunu
+training_data_cleaned.csv cümleleri üzerinde karşılaştırır.
+
+Kullanım:
+    python benchmark_batch.py --adet 512 --esz 16
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import chat
+from mikro_batch import MikroBatchKuyrugu
+from config import BATCH_MAKS_BOYUT, BATCH_BEKLEME_MS
+
+
+def cumleleri_yukle(adet):
+    df = pd.read_csv('training_data_cleaned.csv')
+    return df['text'].astype(str).head(adet).tolist()
+
+
+def olc(isim, fn, adet):
+    chat.tahmin_cache.temizle()  # Her yol modeli gerçekten çalıştırsın
+    baslangic = time.perf_counter()
+    sonuclar = fn()
+    sure = time.perf_counter() - baslangic
+    print(f"  {isim:<38} {sure:8.2f} s   {adet / sure:8.1f} niyet/s")
+    return sonuclar, sure
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BERT batch inference benchmark")
+    parser.add_argument("--adet", type=int, default=256, help="Ölçülecek cümle sayısı")
+    parser.add_argument("--esz", type=int, default=16, help="Eşzamanlı istemci sayısı")
+    args = parser.parse_args()
+
+    cumleler = cumleleri_yukle(args.adet)
+    adet = len(cumleler)
+    chat.tahmin_yap_batch(cumleler[:2])  # Isınma
+
+    print("=" * 66)
+    print(f"  {adet} cümle | batch={BATCH_MAKS_BOYUT} | bekleme={BATCH_BEKLEME_MS} ms | eşzamanlı={args.esz}")
+    print("=" * 66)
+
+    # 1. Mevcut yol: her soru ayrı forward pass
+    tekil, t_tekil = olc(
+        "Tekil (batch=1, sıralı)",
+        lambda: [chat.tahmin_yap_batch([c])[0] for c in cumleler], adet
+    )
+
+    # 2. Tekil yol, eşzamanlı istemciler
+    with ThreadPoolExecutor(max_workers=args.esz) as havuz:
+        olc(
+            "Tekil (batch=1, eşzamanlı)",
+            lambda: list(havuz.map(lambda c: chat.tahmin_yap_batch([c])[0], cumleler)), adet
+        )
+
+    # 3. Doğrudan batch API
+    def batch_calistir():
+        sonuc = []
+        for i in range(0, adet, BATCH_MAKS_BOYUT):
+            sonuc.extend(chat.tahmin_yap_batch(cumleler[i:i + BATCH_MAKS_BOYUT]))
+        return sonuc
+    toplu, t_toplu = olc("tahmin_yap_batch", batch_calistir, adet)
+
+    # 4. Mikro-batch kuyruğu, eşzamanlı istemciler
+    kuyruk = MikroBatchKuyrugu(chat.tahmin_yap_batch, BATCH_MAKS_BOYUT, BATCH_BEKLEME_MS)
+    with ThreadPoolExecutor(max_workers=args.esz) as havuz:
+        kuyruklu, t_kuyruk = olc(
+            "Mikro-batch kuyruğu (eşzamanlı)",
+            lambda: list(havuz.map(kuyruk.tahmin, cumleler)), adet
+        )
+    kuyruk.kapat()
+
+    print("-" * 66)
+    print(f"  Hızlanma (batch API / tekil):    x{t_tekil / t_toplu:.2f}")
+    print(f"  Hızlanma (kuyruk / tekil):       x{t_tekil / t_kuyruk:.2f}")
+    print(f"  Ortalama kuyruk batch boyutu:    {kuyruk.istek_sayisi / max(kuyruk.batch_sayisi, 1):.1f}")
+
+    # Tutarlılık: padding sonuçları değiştirmemeli
+    uyum = sum(a[0] == b[0] for a, b in zip(tekil, toplu)) / adet
+    uyum_k = sum(a[0] == b[0] for a, b in zip(tekil, kuyruklu)) / adet
+    sapma = max(abs(a[1] - b[1]) for a, b in zip(tekil, toplu))
+    print(f"  Niyet uyumu (batch / kuyruk):    %{uyum * 100:.2f} / %{uyum_k * 100:.2f}")
+    print(f"  Maks. güven sapması:             {sapma:.2e}")
+
+
+if __name__ == "__main__":
+    main()
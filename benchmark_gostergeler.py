@@ -0,0 +1,133 @@
+"""
+Finansal Chatbot - Artımlı Gösterge Benchmark
+=============================================
+1) Doğruluk: rastgele yürüyüş kapanışları bar bar motora verilir; her adımda
+   RSI / SMA50 / SMA200 önceki pandas hesabıyla (tam yeniden hesap)
+   karşılaştırılır. Son barın revizyonu da aynı şekilde doğrulanır.
+2) Hız: geçmiş uzunluğu arttıkça tam yeniden hesap doğrusal büyür, motorun
+   yeni bar başına maliyeti sabit kalır.
+
+Kullanım:
+    python benchmark_gostergeler.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from bar_deposu import BAR_DTYPE
+from gostergeler import GostergeDurumu, GostergeMotoru
+
+GUN = 86400
+
+
+def pandas_referans(close):
+    """TeknikAnaliz'in önceki tam hesabı (RSI rolling mean, SMA50, SMA200) - tüm seri için."""
+    close = pd.Series(close)
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    rsi = 100 - (100 / (1 + gain / loss))
+    return rsi.to_numpy(), close.rolling(window=50).mean().to_numpy(), close.rolling(window=200).mean().to_numpy()
+
+
+def wilder_referans(close, n=14):
+    """Wilder RSI: ilk n farkın ortalaması ile tohumlanır, sonra (önceki*(n-1) + x) / n."""
+    fark = np.diff(close)
+    rsi = np.full(len(close), np.nan)
+    kazanc, kayip = np.where(fark > 0, fark, 0.0), np.where(fark < 0, -fark, 0.0)
+    for i in range(n, len(close)):
+        if i == n:
+            ort_k, ort_y = kazanc[:n].mean(), kayip[:n].mean()
+        else:
+            ort_k = (ort_k * (n - 1) + kazanc[i - 1]) / n
+            ort_y = (ort_y * (n - 1) + kayip[i - 1]) / n
+        rsi[i] = 100 - 100 / (1 + ort_k / ort_y) if ort_y else 100.0
+    return rsi
+
+
+def seri(n, tohum=42):
+    rng = np.random.default_rng(tohum)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+
+
+def barlar_olustur(close):
+    barlar = np.zeros(len(close), dtype=BAR_DTYPE)
+    barlar["ts"] = 1_600_000_000 + np.arange(len(close)) * GUN
+    barlar["close"] = close
+    return barlar
+
+
+def sapma(a, b):
+    """None / NaN konumları aynı olmalı; diğerlerinde en büyük mutlak fark."""
+    a = np.array([np.nan if x is None else x for x in a], dtype=float)
+    if not np.array_equal(np.isnan(a), np.isnan(b)):
+        return float("inf")
+    maske = ~np.isnan(a)
+    return float(np.abs(a[maske] - b[maske]).max()) if maske.any() else 0.0
+
+
+def dogruluk(n=5000):
+    close = seri(n)
+    rsi_ref, sma50_ref, sma200_ref = pandas_referans(close)
+    wilder_ref = wilder_referans(close)
+
+    sma_durum, wilder_durum = GostergeDurumu("sma"), GostergeDurumu("wilder")
+    rsi, sma50, sma200, wilder = [], [], [], []
+    for i, c in enumerate(close):
+        ts = i * GUN
+        # Gün içi bar: önce yanlış bir fiyat, sonra kapanışta revize
+        for d in (sma_durum, wilder_durum):
+            d.ekle(ts, c * 1.05)
+            d.ekle(ts, c)
+        rsi.append(sma_durum.rsi)
+        sma50.append(sma_durum.sma50.deger)
+        sma200.append(sma_durum.sma200.deger)
+        wilder.append(wilder_durum.rsi)
+
+    print("=" * 64)
+    print(f"  Doğruluk ({n} bar, her bar bir kez revize edildi) - en büyük |fark|")
+    print("=" * 64)
+    for isim, a, b in (("RSI (sma)", rsi, rsi_ref), ("SMA50", sma50, sma50_ref),
+                       ("SMA200", sma200, sma200_ref), ("RSI (wilder)", wilder, wilder_ref)):
+        print(f"  {isim:<14} {sapma(a, b):.2e}")
+
+
+def hiz(uzunluklar=(250, 1_000, 10_000, 100_000), yeni_bar=1_000):
+    print("\n" + "=" * 64)
+    print(f"  {'Geçmiş (bar)':>12} {'Tam hesap ms':>14} {'Artımlı µs/bar':>16} {'Revize µs':>11}")
+    print("=" * 64)
+    for n in uzunluklar:
+        close = seri(n + yeni_bar)
+        barlar = barlar_olustur(close)
+
+        # Tam yeniden hesap: her istekte tüm seri
+        tekrar = max(3, 20_000 // n)
+        baslangic = time.perf_counter()
+        for _ in range(tekrar):
+            pandas_referans(close[:n])
+        tam_ms = (time.perf_counter() - baslangic) / tekrar * 1000
+
+        # Artımlı: ilk n bar bir kez, sonra her istekte bir yeni bar
+        motor = GostergeMotoru()
+        motor.senkronize("X", barlar[:n])
+        baslangic = time.perf_counter()
+        for i in range(n, n + yeni_bar):
+            motor.senkronize("X", barlar[:i + 1])
+        artimli_us = (time.perf_counter() - baslangic) / yeni_bar * 1e6
+
+        # Son barın revizyonu (gün içi)
+        durum = motor._durumlar["X"]
+        ts = durum.son_ts
+        baslangic = time.perf_counter()
+        for k in range(yeni_bar):
+            durum.ekle(ts, close[-1] + k * 1e-3)
+        revize_us = (time.perf_counter() - baslangic) / yeni_bar * 1e6
+
+        print(f"  {n:>12,} {tam_ms:>14.3f} {artimli_us:>16.2f} {revize_us:>11.2f}")
+
+
+if __name__ == "__main__":
+    dogruluk()
+    hiz()
@@ -0,0 +1,118 @@
+"""
+Finansal Chatbot - Haber İçeriği Zenginleştirme Benchmark
+=========================================================
+ActionHaberGetir._formatla'nın beş başlık için içerik toplamasını önceki
+sıralı yöntemle (başlık başına Selenium -> newspaper3k -> trafilatura)
+ve paralel, süre sınırlı yöntemle karşılaştırır. Scraper'lar URL başına
+sabit gecikmeli sahte fonksiyonlarla değiştirilir.
+
+Senaryo (saniye; "x" = içerik yok):
+    1. selenium 1.5
+    2. selenium 1.0 x, newspaper3k 0.8
+    3. selenium 1.0 x, newspaper3k 0.5 x, trafilatura 0.5 x
+    4. selenium 1.2
+    5. selenium 4.0
+
+Beklenen: sıralı ≈ 1.5 + 1.8 + 2.0 + 1.2 = 6.5 s; paralel ≈ 2.0 s: beş
+başlık aynı anda başlar, 3. başlığın boş olduğu kesinleşince 1, 2, 4 seçilir
+ve 5 iptal edilir. "Eşzamanlı" satırı aynı anda gelen dört isteğin en
+yavaşını gösterir: kazıma havuzu (HABER_KAZIMA_ISCI) istekler arasında
+paylaşılır, başka kullanıcıların scrape'leri sırayı uzatmamalıdır. Son satır
+süre sınırı dolduğunda yetişen haberlerle cevap verildiğini gösterir.
+
+Kullanım:
+    python benchmark_haber.py
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+config.DISK_CACHE_AKTIF = False
+
+import actions
+import izleme
+
+SENARYO = {
+    "https://haber/1": {"selenium": (1.5, True)},
+    "https://haber/2": {"selenium": (1.0, False), "newspaper3k": (0.8, True)},
+    "https://haber/3": {"selenium": (1.0, False), "newspaper3k": (0.5, False), "trafilatura": (0.5, False)},
+    "https://haber/4": {"selenium": (1.2, True)},
+    "https://haber/5": {"selenium": (4.0, True)},
+}
+METIN = "Şirket yönetim kurulu yeni yatırım kararını kamuyu aydınlatma platformunda duyurdu. " * 2
+
+
+def sahte_bagla():
+    def kazi(isim):
+        def _cek(self, url, iptal=None):
+            sure, basarili = SENARYO[url].get(isim, (0.0, False))
+            # Gerçek Selenium redirect beklemesi gibi iptal edilebilir bekleme
+            if iptal is not None and iptal.wait(sure):
+                return ""
+            if iptal is None:
+                time.sleep(sure)
+            return METIN if basarili else ""
+        return _cek
+
+    actions.SELENIUM_AVAILABLE = actions.NEWSPAPER_AVAILABLE = actions.TRAFILATURA_AVAILABLE = True
+    actions.ActionHaberGetir._selenium_scrape = kazi("selenium")
+    actions.ActionHaberGetir._newspaper_cek = kazi("newspaper3k")
+    actions.ActionHaberGetir._trafilatura_cek = kazi("trafilatura")
+
+
+def haberler():
+    return [{"title": f"Başlık {i}", "description": "", "source": "RSS", "url": url, "date": ""}
+            for i, url in enumerate(SENARYO, 1)]
+
+
+def sirali(action, adaylar):
+    """Önceki _formatla: başlıklar tek tek, 3 kullanılabilir haber bulununca durur."""
+    icerikler = []
+    for h in adaylar:
+        if len([i for i in icerikler if i]) >= 3:
+            break
+        text, _ = action._icerik_cek(h["url"])
+        icerikler.append(text or None)
+    return icerikler
+
+
+def eszamanli(action, istek):
+    """Aynı anda `istek` kullanıcı; en yavaş cevabın içerikleri döner."""
+    with ThreadPoolExecutor(istek) as isci:
+        return list(isci.map(lambda _: action._icerikleri_topla(haberler(), gosterim=3), range(istek)))[-1]
+
+
+def main():
+    izleme.log_seviyesi_ayarla("ERROR")
+    sahte_bagla()
+    action = actions.ActionHaberGetir()
+
+    def olc(fn):
+        baslangic = time.perf_counter()
+        icerikler = fn()
+        sure = time.perf_counter() - baslangic
+        secilen = [i + 1 for i, icerik in enumerate(icerikler) if icerik][:3]
+        return sure, secilen
+
+    sonuclar = {
+        "Sıralı (önceki)": olc(lambda: sirali(action, haberler())),
+        "Paralel": olc(lambda: action._icerikleri_topla(haberler(), gosterim=3)),
+        "Eşzamanlı 4 istek": olc(lambda: eszamanli(action, 4)),
+        "Paralel, sınır 1.6 s": olc(lambda: action._icerikleri_topla(haberler(), gosterim=3, sure=1.6)),
+    }
+
+    print("=" * 60)
+    print(f"  {'Yöntem':<24} {'Süre s':>8} {'Cevaptaki haberler':>22}")
+    print("=" * 60)
+    for isim, (sure, secilen) in sonuclar.items():
+        print(f"  {isim:<24} {sure:>8.2f} {str(secilen):>22}")
+
+    time.sleep(0.1)   # İptal edilen scrape'ler kaydını bitirsin
+    print("\n  Scraper istatistiği (tüm çalıştırmalar):")
+    for isim, s in actions.kazici_istatistikleri().items():
+        print(f"    {isim:<12} deneme {s['deneme']:>2}  kazanma {s['kazanma']:>2}  ort {s['ort_ms']:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Finansal Chatbot - Havuzlu HTTP İstemcisi Benchmark
+===================================================
+Yerel bir HTTP/1.1 sunucusu (keep-alive) dış kaynakları taklit eder. Her
+yeni bağlantının ilk isteği EL_SIKISMA kadar geciktirilir (TCP + TLS el
+sıkışmasının maliyeti); aynı bağlantıdaki sonraki istekler gecikmesizdir.
+
+1. Bağlantı: çıplak requests.get (her çağrı yeni bağlantı) ile paylaşılan
+   istemci karşılaştırılır - açılan bağlantı, istek başına gecikme.
+2. Yeniden deneme: ilk iki denemede 503 dönen uç; jitter'lı geri çekilme
+   ile üçüncü denemede 200.
+3. Bütçe: yavaş uç (2 s) ve 0.5 s bütçe; çağrı bütçe dolunca kesilir.
+
+Kullanım:
+    python benchmark_http.py
+    python benchmark_http.py --istek 200 --el-sikisma 0.03
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+import izleme
+from http_istemci import HttpIstemci, butce
+
+EL_SIKISMA = 0.02
+
+
+class SahteKaynak(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # Content-Length ile bağlantı açık kalır
+    disable_nagle_algorithm = True  # Başlık ve gövde ayrı yazılır; Nagle + gecikmeli ACK ölçümü bozar
+    yeni_baglanti = 0
+    denemeler = {}
+    kilit = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with SahteKaynak.kilit:
+            SahteKaynak.yeni_baglanti += 1
+        self._ilk_istek = True
+
+    def _yanit(self, durum, govde=b"ok", basliklar=()):
+        self.send_response(durum)
+        for anahtar, deger in basliklar:
+            self.send_header(anahtar, deger)
+        self.send_header("Content-Length", str(len(govde)))
+        self.end_headers()
+        self.wfile.write(govde)
+
+    def do_GET(self):
+        if self._ilk_istek:
+            time.sleep(EL_SIKISMA)
+            self._ilk_istek = False
+        if self.path.startswith("/yavas"):
+            time.sleep(2.0)
+            self._yanit(200)
+        elif self.path.startswith("/kararsiz"):
+            with SahteKaynak.kilit:
+                n = SahteKaynak.denemeler[self.path] = SahteKaynak.denemeler.get(self.path, 0) + 1
+            self._yanit(503 if n <= 2 else 200)
+        else:
+            self._yanit(200)
+
+    def log_message(self, *args):
+        pass
+
+
+def olc(cagri, url, istek_sayisi):
+    SahteKaynak.yeni_baglanti = 0
+    sureler = []
+    for _ in range(istek_sayisi):
+        baslangic = time.perf_counter()
+        cagri(url, timeout=5).close()
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+    return SahteKaynak.yeni_baglanti, statistics.mean(sureler), sorted(sureler)[int(len(sureler) * 0.95) - 1]
+
+
+def main():
+    global EL_SIKISMA
+    parser = argparse.ArgumentParser(description="Havuzlu HTTP istemcisi karşılaştırması")
+    parser.add_argument("--istek", type=int, default=100, help="Senaryo başına istek sayısı")
+    parser.add_argument("--el-sikisma", type=float, default=EL_SIKISMA, help="Yeni bağlantı maliyeti (s)")
+    args = parser.parse_args()
+    EL_SIKISMA = args.el_sikisma
+    izleme.log_seviyesi_ayarla("ERROR")
+
+    sunucu = ThreadingHTTPServer(("127.0.0.1", 0), SahteKaynak)
+    sunucu.daemon_threads = True
+    threading.Thread(target=sunucu.serve_forever, daemon=True).start()
+    taban = f"http://127.0.0.1:{sunucu.server_address[1]}"
+
+    print("=" * 70)
+    print(f"  Bağlantı yeniden kullanımı ({args.istek} istek, el sıkışma {EL_SIKISMA * 1000:.0f} ms)")
+    print("=" * 70)
+    print(f"  {'İstemci':<22} {'Yeni bağlantı':>14} {'Ort. ms':>9} {'p95 ms':>9}")
+    istemci = HttpIstemci()
+    for isim, cagri in (("requests.get", requests.get), ("HttpIstemci (havuz)", istemci.get)):
+        baglanti, ort, p95 = olc(cagri, f"{taban}/veri", args.istek)
+        print(f"  {isim:<22} {baglanti:>14} {ort:>9.2f} {p95:>9.2f}")
+    print(f"  Havuz: {istemci.baglanti_istatistigi()}")
+
+    print("\n" + "=" * 70)
+    print("  Yeniden deneme (ilk iki deneme 503)")
+    print("=" * 70)
+    istemci = HttpIstemci(geri_cekilme=0.05)
+    baslangic = time.perf_counter()
+    durum = istemci.get(f"{taban}/kararsiz/1", timeout=5).status_code
+    print(f"  Durum: {durum}, süre: {(time.perf_counter() - baslangic) * 1000:.0f} ms, sayaç: {istemci.sayac}")
+
+    print("\n" + "=" * 70)
+    print("  Süre bütçesi (uç 2 s'de yanıt verir, bütçe 0.5 s, timeout üst sınırı 10 s)")
+    print("=" * 70)
+    baslangic = time.perf_counter()
+    try:
+        with butce(0.5):
+            istemci.get(f"{taban}/yavas", timeout=10)
+        sonuc = "yanıt alındı"
+    except requests.Timeout as e:
+        sonuc = type(e).__name__
+    print(f"  Sonuç: {sonuc}, süre: {(time.perf_counter() - baslangic) * 1000:.0f} ms, sayaç: {istemci.sayac}")
+
+    sunucu.shutdown()
+
+
+if __name__ == "__main__":
+    main()
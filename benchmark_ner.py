@@ -0,0 +1,87 @@
+"""
+Finansal Chatbot - NER Benchmark
+================================
+Eski doğrusal tarama (her takma ad için substring testi) ile Aho-Corasick
+otomatını, sözlük binlerce takma ada büyürken karşılaştırır.
+
+Kullanım:
+    python benchmark_ner.py
+"""
+
+import random
+import string
+import time
+
+from chat import ner_sozlugu
+from varlik_tanima import VarlikTanimlayici
+
+SORULAR = [
+    "dolar ne kadar olur bu hafta",
+    "thy alınır mı sizce hedef fiyatı nedir",
+    "türk hava yolları için son haberler neler",
+    "altın ve gümüş yükselişe geçer mi",
+    "borsa istanbul endeksi düşüşte kalır mı",
+    "peki akbank için teknik analiz yapar mısın",
+    "ereğli demir çelik temettü verecek mi",
+    "koç holding bilançosu nasıl geldi",
+    # Varlık içermeyen sorular: doğrusal taramanın en kötü durumu
+    "bugün piyasalar nasıl kapanır sence",
+    "faiz kararı sonrası ne beklemeliyiz",
+]
+
+
+def dogrusal_tarama(sozluk, metin):
+    """chat.varlik_bul'un önceki hali: sözlük sırasıyla substring testi."""
+    metin = metin.lower()
+    for anahtar, varlik in sozluk.items():
+        if anahtar in metin:
+            return varlik
+    return None
+
+
+def dogrusal_tum(sozluk, metin):
+    """Tüm geçişleri bulmak için doğrusal tarama (her anahtar için substring testi)."""
+    metin = metin.lower()
+    return [varlik for anahtar, varlik in sozluk.items() if anahtar in metin]
+
+
+def sentetik_sozluk(boyut, tohum=42):
+    """Gerçek sözlüğü rastgele takma adlarla istenen boyuta büyütür."""
+    rnd = random.Random(tohum)
+    sozluk = dict(ner_sozlugu)
+    while len(sozluk) < boyut:
+        uzunluk = rnd.randint(4, 12)
+        anahtar = "".join(rnd.choice(string.ascii_lowercase + "çğıöşü") for _ in range(uzunluk))
+        sozluk[anahtar] = f"SYN{len(sozluk)}"
+    return sozluk
+
+
+def olc(fn, tekrar):
+    baslangic = time.perf_counter()
+    for _ in range(tekrar):
+        for soru in SORULAR:
+            fn(soru)
+    return (time.perf_counter() - baslangic) / (tekrar * len(SORULAR)) * 1e6
+
+
+def main(tekrar=200):
+    print("=" * 78)
+    print(f"  {'Takma ad':>9} {'Durum':>8} {'Derleme ms':>11} {'Doğrusal':>10} {'Doğrusal':>10} {'Aho-Corasick':>14}")
+    print(f"  {'':>9} {'':>8} {'':>11} {'ilk µs':>10} {'tümü µs':>10} {'tümü µs':>14}")
+    print("=" * 78)
+    for boyut in [len(ner_sozlugu), 100, 500, 1000, 2500, 5000, 10000]:
+        sozluk = sentetik_sozluk(boyut)
+
+        t0 = time.perf_counter()
+        tanimlayici = VarlikTanimlayici(sozluk)
+        derleme = (time.perf_counter() - t0) * 1000
+
+        ilk = olc(lambda s: dogrusal_tarama(sozluk, s), tekrar)
+        tumu = olc(lambda s: dogrusal_tum(sozluk, s), tekrar)
+        otomat = olc(tanimlayici.tum_eslesmeler, tekrar)
+        durum = tanimlayici._otomat.durum_sayisi
+        print(f"  {len(sozluk):>9} {durum:>8} {derleme:>11.1f} {ilk:>10.1f} {tumu:>10.1f} {otomat:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Finansal Chatbot - Paralel Alt Görev Benchmark
+==============================================
+ActionTrendAnaliz (teknik analiz + hedef fiyat) dallarını sıralı ve
+paralel, ActionSirketBilgisi'nin üç DeepL çevirisini ayrı ayrı ve tek
+toplu çağrıda çalıştırıp duvar saati süresini karşılaştırır. Ağ çağrıları sabit gecikmeli sahte
+fonksiyonlarla değiştirilir; böylece ölçüm ağdan bağımsız tekrarlanabilir.
+
+Beklenen: sıralı ≈ dalların toplamı, paralel ≈ en yavaş dal. Son test,
+bir dal süre sınırını aştığında kısmi cevabın döndüğünü gösterir.
+
+Kullanım:
+    python benchmark_paralel.py
+"""
+
+import time
+import types
+
+import config
+config.DISK_CACHE_AKTIF = False   # Ölçüm önceki çalıştırmaların disk önbelleğinden etkilenmesin
+
+import actions
+import izleme
+
+# Sahte dış çağrı gecikmeleri (saniye)
+TEKNIK_S = 0.8      # yf 6 aylık bar
+HEDEF_S = 0.5       # yf.Ticker(...).info
+INFO_S = 0.4        # Şirket bilgisi yf.Ticker(...).info
+CEVIRI_S = 0.3      # DeepL çağrısı başına (metin sayısından bağımsız)
+
+
+def sahte_bagla():
+    def teknik(self, symbol):
+        time.sleep(TEKNIK_S)
+        return {"fiyat": 300.0, "rsi": 55.0, "sma50": 290.0, "trend": "YÜKSELİŞ (Boğa)", "sinyal": "NÖTR"}
+
+    def hedef(self, varlik):
+        time.sleep(HEDEF_S)
+        return {"hedef_fiyat": 350.0, "potansiyel": 16.67, "tavsiye": "AL 🟢", "para": "TRY"}
+
+    def ceviri(self, metinler, hedef_dil="TR"):
+        time.sleep(CEVIRI_S)
+        return [f"[TR] {m}" for m in metinler]
+
+    class SahteTicker:
+        def __init__(self, kod):
+            time.sleep(INFO_S)
+            self.info = {
+                "longBusinessSummary": "Turkish Airlines is the national flag carrier airline of Turkey. It flies.",
+                "sector": "Industrials", "industry": "Airlines", "marketCap": 300_000_000_000,
+                "trailingPE": 4.2, "recommendationKey": "buy", "currency": "TRY",
+            }
+
+    actions.TeknikAnaliz.analiz_et = teknik
+    actions.ActionTrendAnaliz._hedef_fiyat_cek = hedef
+    actions.ActionSirketBilgisi._deepl_cevir_toplu = ceviri
+    actions.yf = types.SimpleNamespace(Ticker=SahteTicker)
+    actions.YFINANCE_AVAILABLE = True
+
+
+def sure_olc(fn):
+    baslangic = time.perf_counter()
+    sonuc = fn()
+    return time.perf_counter() - baslangic, sonuc
+
+
+def main():
+    izleme.log_seviyesi_ayarla("ERROR")
+    sahte_bagla()
+    trend = actions.ActionTrendAnaliz()
+    sirket = actions.ActionSirketBilgisi()
+
+    # Sıralı referans: aynı dallar tek tek
+    sirali_trend, _ = sure_olc(lambda: [fn() for fn in trend.alt_gorevler("THY").values()])
+    paralel_trend, _ = sure_olc(lambda: trend.execute("THY", "thy yükselir mi"))
+
+    def sirali_sirket():
+        # Önceki davranış: metin başına bir DeepL çağrısı
+        info = actions.yf.Ticker("THYAO.IS").info
+        for metin in (info["longBusinessSummary"], info["sector"], info["industry"]):
+            sirket._deepl_cevir_toplu([metin])
+    sirali_sirket_s, _ = sure_olc(sirali_sirket)
+    paralel_sirket_s, _ = sure_olc(lambda: sirket._bilgi_cek("THY"))
+    # İkinci soru: info ve çeviriler önbellekte
+    hafiza_sirket_s, _ = sure_olc(lambda: sirket._bilgi_cek("THY"))
+
+    print("=" * 66)
+    print(f"  {'Aksiyon':<22} {'Dallar':>14} {'Sıralı s':>9} {'Paralel s':>10} {'Beklenen':>8}")
+    print("=" * 66)
+    print(f"  {'TrendAnaliz':<22} {f'{TEKNIK_S}+{HEDEF_S}':>14} {sirali_trend:>9.2f} {paralel_trend:>10.2f} "
+          f"{max(TEKNIK_S, HEDEF_S):>8.2f}")
+    print(f"  {'SirketBilgisi (toplu)':<22} {f'{INFO_S}+3x{CEVIRI_S}':>14} {sirali_sirket_s:>9.2f} "
+          f"{paralel_sirket_s:>10.2f} {INFO_S + CEVIRI_S:>8.2f}")
+    print(f"  {'SirketBilgisi (hafıza)':<22} {'-':>14} {'-':>9} {hafiza_sirket_s:>10.2f} {0:>8.2f}")
+
+    # Süre sınırı: teknik dal 0.8 s, sınır 0.6 s -> hedef fiyat ile kısmi cevap
+    sure, cevap = sure_olc(lambda: actions.paralel_calistir(trend.alt_gorevler("THY"), sure=0.6))
+    print(f"\n  Süre sınırı 0.6 s: {sure:.2f} s | dönen dallar: "
+          f"{[isim for isim, v in cevap.items() if v is not None]} | "
+          f"zaman aşımı: {[isim for isim, v in cevap.items() if v is None]}")
+
+
+if __name__ == "__main__":
+    main()
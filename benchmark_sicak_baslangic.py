@@ -0,0 +1,143 @@
+"""
+Finansal Chatbot - Sıcak Başlangıç (Disk Önbellek Katmanı) Benchmark
+====================================================================
+Bir dağıtım / çökme sonrası yeniden başlatmayı taklit eder: aynı "ilk
+dakika" iş yükü (fiyat, haber, şirket bilgisi, hedef fiyat soruları)
+ayrı süreçlerde çalıştırılır ve dış çağrı sayıları karşılaştırılır.
+
+1. onceki : Disk katmanı açık; yeniden başlatmadan önceki süreç (diski doldurur)
+2. disksiz: Yeni süreç, yalnızca bellek önbelleği (soğuk başlangıç)
+3. diskli : Yeni süreç, aynı SQLite dosyası (sıcak başlangıç)
+
+Dış kaynaklar (yfinance, Google News, DeepL) sabit gecikmeli sahte
+fonksiyonlarla değiştirilir; sayılar ağdan bağımsız tekrarlanabilir.
+
+Kullanım:
+    python benchmark_sicak_baslangic.py
+    python benchmark_sicak_baslangic.py --soru 120
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+
+# Sahte dış çağrı gecikmeleri (saniye)
+GECIKME = {"fiyat": 0.05, "info": 0.15, "haber": 0.20, "ceviri": 0.05}
+
+
+def sahte_bagla(actions, sayac):
+    kilit = threading.Lock()
+
+    def cagri(tur):
+        with kilit:
+            sayac[tur] += 1
+        time.sleep(GECIKME[tur])
+
+    def fiyat(varlik):
+        cagri("fiyat")
+        return 100.0 + len(varlik), time.time()
+
+    class SahteTicker:
+        def __init__(self, kod):
+            cagri("info")
+            self.info = {
+                "longBusinessSummary": f"{kod} is a company. It does business in Turkey.",
+                "sector": "Financial Services", "industry": "Banks—Regional", "marketCap": 1e11,
+                "trailingPE": 5.0, "currentPrice": 100.0, "targetMeanPrice": 130.0,
+                "recommendationKey": "buy", "currency": "TRY", "previousClose": 99.0,
+            }
+
+    def haberler(self, varlik):
+        cagri("haber")
+        return [{"title": f"{varlik} haberi", "description": "", "source": "RSS", "url": "", "date": ""}]
+
+    def ceviri(self, metinler, hedef_dil="TR"):
+        cagri("ceviri")
+        return [f"[TR] {m}" for m in metinler]
+
+    actions.YFINANCE_AVAILABLE = True
+    actions.yf = types.SimpleNamespace(Ticker=SahteTicker)
+    actions.ON_YUKLEME_KAYNAKLARI["fiyat"] = fiyat
+    actions.ActionHaberGetir._haberleri_cek = haberler
+    actions.ActionHaberGetir._formatla = lambda self, isim, h: f"{isim}: {len(h)} haber"
+    actions.ActionSirketBilgisi._deepl_cevir_toplu = ceviri
+
+
+def calistir(disk, yol, soru_sayisi, tohum):
+    """Alt süreç: iş yükünü çalıştırır, sayaçları JSON olarak yazar."""
+    import config
+    config.DISK_CACHE_AKTIF = disk
+    config.DISK_CACHE_YOLU = yol
+
+    import actions
+    import izleme
+    izleme.log_seviyesi_ayarla("ERROR")
+
+    sayac = {tur: 0 for tur in GECIKME}
+    sahte_bagla(actions, sayac)
+
+    isler = {
+        "fiyat": lambda v: actions.ActionFiyatSorgula().execute(v, ""),
+        "haber": lambda v: actions.ActionHaberGetir().execute(v, ""),
+        "sirket": lambda v: actions.ActionSirketBilgisi().execute(v, ""),
+        "hedef": lambda v: actions.ActionTrendAnaliz()._hedef_fiyat_cek(v),
+    }
+    rng = random.Random(tohum)
+    varliklar = list(config.TICKER_MAP)
+    baslangic = time.perf_counter()
+    for _ in range(soru_sayisi):
+        isler[rng.choice(list(isler))](rng.choice(varliklar))
+    sayac["sure_s"] = time.perf_counter() - baslangic
+    print(json.dumps(sayac))
+
+
+def alt_surec(disk, yol, soru_sayisi, tohum):
+    cikti = subprocess.run(
+        [sys.executable, __file__, "--calistir", "--disk", str(int(disk)), "--yol", yol,
+         "--soru", str(soru_sayisi), "--tohum", str(tohum)],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(cikti.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Disk önbellek katmanı sıcak başlangıç karşılaştırması")
+    parser.add_argument("--soru", type=int, default=60, help="İlk dakikadaki soru sayısı")
+    parser.add_argument("--calistir", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--disk", type=int, default=1, help=argparse.SUPPRESS)
+    parser.add_argument("--yol", help=argparse.SUPPRESS)
+    parser.add_argument("--tohum", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.calistir:
+        calistir(bool(args.disk), args.yol, args.soru, args.tohum)
+        return
+
+    with tempfile.TemporaryDirectory() as klasor:
+        yol = os.path.join(klasor, "onbellek.sqlite3")
+        sonuclar = {
+            "onceki": alt_surec(True, yol, args.soru, tohum=1),
+            # Yeniden başlatma sonrası: farklı kullanıcılar, aynı varlık evreni
+            "disksiz": alt_surec(False, yol, args.soru, tohum=2),
+            "diskli": alt_surec(True, yol, args.soru, tohum=2),
+        }
+
+    print("=" * 70)
+    print(f"  İlk {args.soru} soru - dış çağrı sayıları")
+    print("=" * 70)
+    print(f"  {'Süreç':<10} {'fiyat':>7} {'info':>7} {'haber':>7} {'çeviri':>7} {'Toplam':>7} {'Süre s':>8}")
+    for isim, s in sonuclar.items():
+        toplam = sum(s[tur] for tur in GECIKME)
+        print(f"  {isim:<10} {s['fiyat']:>7} {s['info']:>7} {s['haber']:>7} {s['ceviri']:>7} "
+              f"{toplam:>7} {s['sure_s']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,37 +4,101 @@ Finansal Chatbot - Gelişmiş Inference Script (v4.5)
 Loglama Özellikli: NER, BERT, Zemberek ve Hafıza süreçlerini izler.
 """
 
-import torch
+import logging
+import os
 import random
-import re
+import threading
+import time
+import types
+from contextlib import contextmanager
 import templates
-from transformers import BertTokenizer, BertForSequenceClassification
-from actions import execute_action
-from config import GUVEN_ESIK
+from actions import execute_action, aksiyon_gereksinimleri, on_yukle, fiyat_yenileyici, cache_istatistikleri
+from mikro_batch import MikroBatchKuyrugu
+from varlik_tanima import VarlikTanimlayici
+from onbellek import LRUOnbellek
+from oturum import Oturum
+from soru_analizi import SoruAnalizi
+from tembel_yukleme import TembelBilesen, olcum, baslatma_raporu
+from izleme import log, span, aktif_span, yeni_iz_id
+from http_istemci import butce
+from config import (
+    GUVEN_ESIK, MIKRO_BATCH_AKTIF, BATCH_MAKS_BOYUT, BATCH_BEKLEME_MS,
+    MODEL_YOLU, INFERENCE_BACKEND, ONNX_MODEL_YOLU, ONNX_INT8_MODEL_YOLU,
+    ARKA_PLAN_ISINMA, TAHMIN_CACHE_BOYUT, TAHMIN_CACHE_SURESI, MODEL_KONTROL_ARALIGI,
+    ANALIZ_CACHE_BOYUT, KADEME_AKTIF, KADEME_ESIK, KADEME_MODEL_YOLU, ISTEK_BUTCESI
+)
 
 # =============================================================================
 # SİSTEM YÜKLEME VE YAPILANDIRMA
 # =============================================================================
-print("\n[*] Sistemler başlatılıyor...")
+# Bileşenler import sırasında değil ilk kullanımda yüklenir (bkz. isindir).
 
-try:
+def _zemberek_yukle():
     from zemberek import TurkishMorphology, TurkishSentenceNormalizer
     morphology = TurkishMorphology.create_with_defaults()
     normalizer = TurkishSentenceNormalizer(morphology)
-    ZEMBEREK_AVAILABLE = True
     print("[+] [NLP] Zemberek ve Morfoloji motoru yüklendi.")
-except Exception as e:
-    ZEMBEREK_AVAILABLE = False
-    print(f"[!] [NLP] Zemberek yüklenemedi: {e}")
-
-model_path = "./finans_model"
-try:
-    tokenizer = BertTokenizer.from_pretrained(model_path)
-    model = BertForSequenceClassification.from_pretrained(model_path)
-    model.eval()
+    return morphology, normalizer
+
+def _bert_yukle():
+    from transformers import BertTokenizer
+
+    bert = types.SimpleNamespace(
+        tokenizer=BertTokenizer.from_pretrained(MODEL_YOLU),
+        model=None, onnx_model=None, backend=INFERENCE_BACKEND
+    )
+    if bert.backend in ("onnx", "onnx-int8"):
+        try:
+            from onnx_backend import OnnxNiyetModeli
+            onnx_yolu = ONNX_INT8_MODEL_YOLU if bert.backend == "onnx-int8" else ONNX_MODEL_YOLU
+            bert.onnx_model = OnnxNiyetModeli(onnx_yolu)
+            print(f"[+] [BERT] ONNX Runtime backend hazır ({bert.backend}).")
+        except Exception as e:
+            print(f"[!] [BERT] ONNX backend yüklenemedi, PyTorch'a dönülüyor: {e}")
+            bert.backend = "pytorch"
+    if bert.backend == "pytorch":
+        from transformers import BertForSequenceClassification
+        bert.model = BertForSequenceClassification.from_pretrained(MODEL_YOLU)
+        bert.model.eval()
     print("[+] [BERT] Model ve Tokenizer hazır.")
-except Exception as e:
-    print(f"[!] [BERT] Model yükleme hatası: {e}")
+    return bert
+
+def _kademe_yukle():
+    from kademe import KademeSiniflandirici
+    k = KademeSiniflandirici(KADEME_MODEL_YOLU)
+    print("[+] [KADEME] Hafif niyet modeli hazır.")
+    return k
+
+zemberek = TembelBilesen("Zemberek", _zemberek_yukle)
+bert = TembelBilesen("BERT", _bert_yukle)
+kademe = TembelBilesen("Kademe", _kademe_yukle)
+
+def zemberek_hazir():
+    """Zemberek'i (gerekirse yükleyerek) kullanılabilir mi diye kontrol eder."""
+    return zemberek.al() is not None
+
+def isindir(arka_plan=False):
+    """
+    Zemberek ve BERT'i önceden yükler, ilk gerçek soru yavaş olmasın diye
+    bir dummy forward pass çalıştırır. arka_plan=True ise thread döndürür.
+    """
+    def _calistir():
+        zemberek.al()
+        if KADEME_AKTIF:
+            kademe.al()
+        if bert.al() is None:
+            return
+        try:
+            with olcum("Isınma (dummy forward)"):
+                tahmin_yap_batch(["dolar ne kadar"])
+        except Exception as e:
+            print(f"[!] [BERT] Isınma hatası: {e}")
+
+    if arka_plan:
+        isci = threading.Thread(target=_calistir, name="isinma", daemon=True)
+        isci.start()
+        return isci
+    _calistir()
 
 label_names = [
     'Genel Bilgi/Durum', 'Risk ve Haber Analizi', 
@@ -54,150 +118,357 @@ ner_sozlugu = {
     "bist": "BIST100", "bist100": "BIST100", "endeks": "BIST100", "borsa": "BIST100"
 }
 
+# Sözlük import sırasında tek seferde Aho-Corasick otomatına derlenir
+ner = VarlikTanimlayici(ner_sozlugu)
+
 # =============================================================================
 # ANALİZ VE LOGLAMA FONKSİYONLARI
 # =============================================================================
 
-def girdi_irdeles(soru):
+analiz_cache = LRUOnbellek(maks_boyut=ANALIZ_CACHE_BOYUT)
+_analiz_kilidi = threading.Lock()
+
+def soru_analizi(soru):
     """
-    Zemberek morfolojisi ile kural tabanlı soru kontrolünü birleştirir (Hibrit Yaklaşım).
+    Soru için paylaşılan SoruAnalizi nesnesini döndürür. Aynı metin
+    tekrar sorulursa önceki analiz (normalize + morfoloji) yeniden kullanılır.
     """
-    if not ZEMBEREK_AVAILABLE:
-        return {"fiil": "işlem", "zaman": "güncel", "soru_mu": "?" in soru}
+    analiz = analiz_cache.al(soru)
+    if analiz is None:
+        z = zemberek.al()
+        morphology, normalizer = z if z is not None else (None, None)
+        with _analiz_kilidi:
+            # Eşzamanlı aynı soru: tek nesne oluşturulsun, Zemberek çağrıları paylaşılsın
+            analiz = analiz_cache.al(soru)
+            if analiz is None:
+                analiz = SoruAnalizi(soru, morphology, normalizer)
+                analiz_cache.kaydet(soru, analiz)
+    return analiz
 
-    # Zemberek Analizi
-    analiz = morphology.analyze_and_disambiguate(soru).best_analysis()
-    
-    # Soru Kelimeleri ve Noktalama Kontrolü (Kural Tabanlı Katman)
-    soru_kelimeleri = ["ne", "nasıl", "kaç", "ne kadar", "ne zaman", "niçin", "neden", "kim"]
-    soru_temiz = soru.lower().strip()
-    
-    ozet = {
-        "fiil": "belirsiz",
-        "zaman": "belirtilmemiş",
-        "soru_mu": False
-    }
-
-    # 1. Kural: Soru işareti var mı veya soru kelimesi içeriyor mu?
-    if soru_temiz.endswith("?") or any(re.search(rf"\b{k}\b", soru_temiz) for k in soru_kelimeleri):
-        ozet["soru_mu"] = True
-
-    # 2. Kural: Zemberek etiketlerini kontrol et (mı/mi ekleri için)
-    for res in analiz:
-        pos = res.item.primary_pos.name
-        tags = res.format_string()
-        
-        # Zemberek 'Quest' etiketini yakalarsa (örn: alacak mısın?)
-        if "Quest" in tags or "Question" in tags:
-            ozet["soru_mu"] = True
-            
-        if pos == "Verb":
-            ozet["fiil"] = res.item.lemma
-            if "Fut" in tags: ozet["zaman"] = "gelecek"
-            elif "Past" in tags: ozet["zaman"] = "geçmiş"
-            elif "Prog" in tags: ozet["zaman"] = "şimdiki"
-            elif "Necess" in tags: ozet["zaman"] = "gereklilik"
-            
-    print(f"   > [ZEMBEREK] Fiil: '{ozet['fiil']}' | Zaman: '{ozet['zaman']}' | Soru: {ozet['soru_mu']}")
+def girdi_irdeles(soru, analiz=None):
+    """
+    Zemberek morfolojisi ile kural tabanlı soru kontrolünü birleştirir (Hibrit Yaklaşım).
+    """
+    ozet = (analiz or soru_analizi(soru)).ozet
+    log.info("   > [ZEMBEREK] Fiil: '%s' | Zaman: '%s' | Soru: %s", ozet['fiil'], ozet['zaman'], ozet['soru_mu'])
     return ozet
+
 def varlik_bul(text):
-    """NER katmanı: Varlık tespiti yapar ve loglar."""
-    text_lower = text.lower()
-    for anahtar, varlik in ner_sozlugu.items():
-        if anahtar in text_lower:
-            print(f"   > [NER] Tespit Edilen: {varlik} ('{anahtar}')")
-            return varlik
+    """NER katmanı: Metindeki ilk (en soldaki) varlığı tespit eder ve loglar."""
+    eslesme = ner.bul(text)
+    if eslesme:
+        log.info("   > [NER] Tespit Edilen: %s ('%s')", eslesme.varlik, eslesme.anahtar)
+        return eslesme.varlik
     return None
 
-def tahmin_yap(text):
-    """BERT niyet tahmini yapar ve güven skorunu loglar."""
-    if ZEMBEREK_AVAILABLE:
-        try: text = normalizer.normalize(text)
+def varliklari_bul(text):
+    """Metindeki tüm varlık geçişlerini konumlarıyla döndürür (VarlikEslesmesi listesi)."""
+    return ner.tum_eslesmeler(text)
+
+def _normalize_et(text):
+    """Zemberek normalizasyonu (hata durumunda metni olduğu gibi döndürür)."""
+    z = zemberek.al()
+    if z is not None:
+        try: return z[1].normalize(text)
         except: pass
-    
-    inputs = tokenizer(text, return_tensors="pt", truncation=True, padding=True, max_length=128)
-    with torch.no_grad():
-        outputs = model(**inputs)
-        probs = torch.nn.functional.softmax(outputs.logits, dim=-1)
-        pred_idx = torch.argmax(probs).item()
-        guven = probs[0][pred_idx].item()
-    
-    niyet = label_names[pred_idx]
-    print(f"   > [BERT] Tahmin: '{niyet}' | Güven: %{guven*100:.2f}")
+    return text
+
+def _model_parmak_izi():
+    """Model klasöründeki dosyaların (isim, boyut, mtime) özeti + backend (+ kademe modeli)."""
+    try:
+        dosyalar = sorted(
+            (g.name, g.stat().st_size, g.stat().st_mtime_ns)
+            for g in os.scandir(MODEL_YOLU) if g.is_file()
+        )
+    except OSError:
+        dosyalar = []
+    if KADEME_AKTIF:
+        try:
+            st = os.stat(KADEME_MODEL_YOLU)
+            dosyalar.append((KADEME_MODEL_YOLU, st.st_size, st.st_mtime_ns, KADEME_ESIK))
+        except OSError:
+            pass
+    return (INFERENCE_BACKEND, tuple(dosyalar))
+
+tahmin_cache = LRUOnbellek(maks_boyut=TAHMIN_CACHE_BOYUT, sure=TAHMIN_CACHE_SURESI)
+_cache_parmak_izi = None
+_cache_kontrol_zamani = 0.0
+
+def _tahmin_cache_dogrula():
+    """Model klasörü değiştiyse tahmin cache'ini boşaltır (en fazla MODEL_KONTROL_ARALIGI'nda bir)."""
+    global _cache_parmak_izi, _cache_kontrol_zamani
+    simdi = time.monotonic()
+    if simdi - _cache_kontrol_zamani < MODEL_KONTROL_ARALIGI:
+        return
+    _cache_kontrol_zamani = simdi
+    parmak_izi = _model_parmak_izi()
+    if _cache_parmak_izi is not None and parmak_izi != _cache_parmak_izi:
+        log.info("   > [CACHE] Model klasörü değişti, tahmin cache'i temizlendi.")
+        tahmin_cache.temizle()
+    _cache_parmak_izi = parmak_izi
+
+def _model_tahmin(b, texts):
+    """Normalize edilmiş cümleler için seçili backend ile forward pass."""
+    if b.onnx_model is not None:
+        with span("bert.tokenize", boyut=len(texts)):
+            inputs = b.tokenizer(texts, return_tensors="np", truncation=True, padding="longest", max_length=128)
+        with span("bert.forward", backend=b.backend, boyut=len(texts)):
+            probs = b.onnx_model.olasiliklar(inputs)
+            pred_idx, guvenler = probs.argmax(axis=-1), probs.max(axis=-1)
+    else:
+        import torch
+        with span("bert.tokenize", boyut=len(texts)):
+            inputs = b.tokenizer(texts, return_tensors="pt", truncation=True, padding="longest", max_length=128)
+        with span("bert.forward", backend=b.backend, boyut=len(texts)), torch.no_grad():
+            outputs = b.model(**inputs)
+            probs = torch.nn.functional.softmax(outputs.logits, dim=-1)
+            guvenler, pred_idx = probs.max(dim=-1)
+
+    return [(label_names[i], g) for i, g in zip(pred_idx.tolist(), guvenler.tolist())]
+
+# Kademe: hafif modelin cevapladığı / BERT'e düşen soru sayıları
+kademe_sayac = {"kademe": 0, "bert": 0}
+_kademe_kilit = threading.Lock()   # Mikro-batch, sunucu ve CLI thread'lerinden artırılır
+
+def kademe_istatistigi():
+    with _kademe_kilit:
+        return dict(kademe_sayac)
+
+def _kademe_tahmin(texts):
+    """Hafif modelin güveni KADEME_ESIK'i geçen tahminleri döndürür: {metin: (niyet, guven)}."""
+    k = kademe.al()
+    if k is None:
+        return {}
+    with span("kademe", boyut=len(texts)) as s:
+        sonuc = {t: tg for t, tg in zip(texts, k.tahmin(texts)) if tg[1] >= KADEME_ESIK}
+        s.ozellik(kisa_devre=len(sonuc))
+    return sonuc
+
+def tahmin_yap_batch(texts, normalize=True):
+    """
+    Birden fazla cümle için tek forward pass ile niyet tahmini yapar.
+    Padding batch içindeki en uzun cümleye göre dinamik yapılır; normalize
+    edilmiş metni tahmin cache'inde bulunan cümleler modele hiç gitmez.
+    KADEME_AKTIF ise hafif modelin emin olduğu cümleler de BERT'e gitmez.
+    normalize=False ise cümlelerin zaten normalize edildiği varsayılır.
+    Dönüş: Her cümle için (niyet, guven) listesi (girdi sırasıyla).
+    """
+    if not texts:
+        return []
+    if normalize:
+        texts = [_normalize_et(t) for t in texts]
+
+    _tahmin_cache_dogrula()
+    sonuclar = [tahmin_cache.al(t) for t in texts]
+    eksikler = list(dict.fromkeys(t for t, s in zip(texts, sonuclar) if s is None))
+    aktif_span().ozellik(cache="iska" if eksikler else "isabet")
+    if eksikler:
+        yeni = _kademe_tahmin(eksikler) if KADEME_AKTIF else {}
+        bert_eksikler = [t for t in eksikler if t not in yeni]
+        with _kademe_kilit:
+            kademe_sayac["kademe"] += len(yeni)
+            kademe_sayac["bert"] += len(bert_eksikler)
+        if bert_eksikler:
+            b = bert.al()
+            if b is None:
+                raise RuntimeError(f"BERT modeli yüklenemedi: {bert.hata}")
+            yeni.update(zip(bert_eksikler, _model_tahmin(b, bert_eksikler)))
+        for metin, tahmin in yeni.items():
+            tahmin_cache.kaydet(metin, tahmin)
+        sonuclar = [s if s is not None else yeni[t] for t, s in zip(texts, sonuclar)]
+
+    return sonuclar
+
+_batch_kuyrugu = None
+_kuyruk_kilit = threading.Lock()
+
+def batch_kuyrugu():
+    """tahmin_yap_batch önündeki paylaşılan mikro-batch kuyruğunu döndürür."""
+    global _batch_kuyrugu
+    with _kuyruk_kilit:
+        if _batch_kuyrugu is None:
+            _batch_kuyrugu = MikroBatchKuyrugu(
+                lambda metinler: tahmin_yap_batch(metinler, normalize=False),
+                maks_boyut=BATCH_MAKS_BOYUT, bekleme_ms=BATCH_BEKLEME_MS
+            )
+    return _batch_kuyrugu
+
+# Sunucunun işçi modunda (SUNUCU_ISCI_HAVUZU) server.py bir worker_havuzu.IsciHavuzu atar;
+# tahminler bu süreçte değil, modeli copy-on-write paylaşan işçi süreçlerinde yapılır
+isci_havuzu = None
+
+def tahmin_yap(text, analiz=None):
+    """BERT niyet tahmini yapar ve güven skorunu loglar."""
+    metin = analiz.normalize if analiz is not None else _normalize_et(text)
+    if isci_havuzu is not None:
+        niyet, guven = isci_havuzu.tahmin([metin], normalize=False)[0]
+    elif MIKRO_BATCH_AKTIF:
+        niyet, guven = batch_kuyrugu().tahmin(metin)
+    else:
+        niyet, guven = tahmin_yap_batch([metin], normalize=False)[0]
+
+    log.info("   > [BERT] Tahmin: '%s' | Güven: %%%.2f", niyet, guven * 100)
     return niyet, guven
 
 # =============================================================================
 # DİYALOG HAFIZASI
 # =============================================================================
 
-class KonusmaHafizasi:
-    def __init__(self):
-        self.son_varlik = None
-        self.son_niyet = None
-        self.gecmis = []
-    
-    def guncelle(self, varlik, niyet, soru, cevap):
-        if varlik: self.son_varlik = varlik
-        if niyet: self.son_niyet = niyet
-        self.gecmis.append((soru, cevap))
-        if len(self.gecmis) > 5: self.gecmis.pop(0)
+# Oturum başına hafıza oturum.py'de: __slots__ nesnesi + halka tampon geçmiş.
+# CLI tek oturumla çalışır; sunucu her oturum için OturumDeposu'ndan alır.
+KonusmaHafizasi = Oturum
 
-    def referans_var_mi(self, soru):
-        referans_kelimeler = ["peki", "ya", "onun", "bu", "o da", "aynısı", "ne kadar", "ne olur"]
-        return any(kelime in soru.lower() for kelime in referans_kelimeler)
-
-hafiza = KonusmaHafizasi()
+hafiza = Oturum()
 
 # =============================================================================
-# ANA CEVAP MOTORU
+# TALEBE BAĞLI AŞAMALAR (PIPELINE)
 # =============================================================================
+# Her aşama IstekBaglami.al() ile ilk istendiğinde bir kez çalışır. Aksiyonlar
+# ihtiyaç duydukları girdileri GEREKSINIMLER ile bildirir; kimsenin istemediği
+# aşama (örn. morfoloji) hiç hesaplanmaz.
+
+@contextmanager
+def _asama(sureler, isim, **oznitelikler):
+    """Bir aşamanın süresini (ms) kaydeder ve aşamayı bir span ile sarar."""
+    baslangic = time.perf_counter()
+    try:
+        with span(isim, **oznitelikler) as s:
+            yield s
+    finally:
+        sureler[isim] = (time.perf_counter() - baslangic) * 1000
+
+def _sure_logla(sureler):
+    if log.isEnabledFor(logging.INFO):
+        log.info("   > [SÜRE] %s", " | ".join(f"{isim}: {ms:.1f} ms" for isim, ms in sureler.items()))
+
+def _asama_varlik(b):
+    """NER + hafıza: varlık bulunamazsa referans ifadesiyle son varlığa döner."""
+    with _asama(b.sureler, "NER") as s:
+        varlik = varlik_bul(b.soru)
+        if varlik is None and b.hafiza.referans_var_mi(b.soru) and b.hafiza.son_varlik:
+            varlik = b.hafiza.son_varlik
+            s.ozellik(hafizadan=True)
+            log.info("   > [MEMORY] Varlık hafızadan çekildi: %s", varlik)
+        s.ozellik(varlik=varlik)
+    if varlik is not None:
+        # Ağ gecikmesi BERT / Zemberek süresiyle örtüşsün
+        on_yukle(varlik)
+    return varlik
+
+def _asama_niyet(b):
+    """BERT niyet tahmini + bağlam düzeltmesi. Dönüş: (niyet, guven)."""
+    with _asama(b.sureler, "Normalize"):
+        b.analiz.normalize
+    with _asama(b.sureler, "BERT") as s:
+        niyet, guven = tahmin_yap(b.soru, analiz=b.analiz)
+        s.ozellik(niyet=niyet, guven=round(guven, 4))
 
-def cevap_uret(soru):
-    print(f"\n[*] Analiz Başlatıldı: '{soru}'")
-    
-    # 1. NER Aşaması
-    varlik = varlik_bul(soru)
-    
-    # 2. Hafıza Kontrolü
-    if varlik is None:
-        if hafiza.referans_var_mi(soru) and hafiza.son_varlik:
-            varlik = hafiza.son_varlik
-            print(f"   > [MEMORY] Varlık hafızadan çekildi: {varlik}")
-        else:
-            print("   > [NER] Herhangi bir varlık bulunamadı.")
-            return "Hangi hisse veya varlık hakkında konuşuyoruz? (Örn: THY, Altın)"
-
-    # 3. BERT Aşaması
-    niyet, guven = tahmin_yap(soru)
-    
     # --- CONTEXT OVERRIDE (BAĞLAM DÜZELTME) ---
     # Eğer sadece varlık ismi verilmişse ve bir önceki niyet teknik analiz gibiyse, niyeti koru.
     # Örn: Önce "THY teknik analiz", sonra "peki akbank?" -> Akbank Teknik Analiz
-    if varlik and len(soru.split()) <= 3 and niyet == "Genel Bilgi/Durum":
+    hafiza = b.hafiza
+    if b.al("varlik") and len(b.soru.split()) <= 3 and niyet == "Genel Bilgi/Durum":
         if hafiza.son_niyet and hafiza.son_niyet != "Genel Bilgi/Durum":
-            print(f"   > [MEMORY] Bağlam tespit edildi: '{hafiza.son_niyet}' niyeti korunuyor.")
+            log.info("   > [MEMORY] Bağlam tespit edildi: '%s' niyeti korunuyor.", hafiza.son_niyet)
             niyet = hafiza.son_niyet
-    # ----------------------------------------
+    return niyet, guven
+
+def _asama_morfoloji(b):
+    """Zemberek fiil/zaman/soru özeti (paylaşılan analiz nesnesinden)."""
+    with _asama(b.sureler, "Morfoloji"):
+        return girdi_irdeles(b.soru, analiz=b.analiz)
+
+ASAMALAR = {
+    "varlik": _asama_varlik,
+    "niyet": _asama_niyet,
+    "morfoloji": _asama_morfoloji,
+    "hafiza": lambda b: b.hafiza,
+}
+
+class IstekBaglami:
+    """Tek bir sorunun aşama sonuçlarını talep geldikçe hesaplayıp saklar."""
+
+    def __init__(self, soru, hafiza):
+        self.soru = soru
+        self.hafiza = hafiza
+        self.sureler = {}
+        self.iz_id = yeni_iz_id()  # Hazırlık ve tamamlama span'leri farklı thread'lerde olabilir
+        self.baslangic = time.monotonic()  # Dış çağrıların süre bütçesi bu andan sayılır
+        self._sonuclar = {}
+        self._analiz = None
+
+    @property
+    def analiz(self):
+        """Paylaşılan Zemberek analizi; yalnızca bir aşama isterse oluşturulur."""
+        if self._analiz is None:
+            self._analiz = soru_analizi(self.soru)
+        return self._analiz
+
+    def al(self, asama):
+        if asama not in self._sonuclar:
+            self._sonuclar[asama] = ASAMALAR[asama](self)
+        return self._sonuclar[asama]
+
+    def hesaplandi_mi(self, asama):
+        return asama in self._sonuclar
+
+# =============================================================================
+# ANA CEVAP MOTORU
+# =============================================================================
+
+def cevap_hazirla(soru, hafiza=hafiza):
+    """
+    Cevabın CPU tarafı: NER, hafıza ve BERT. Dönüş: (baglam, erken_cevap).
+    erken_cevap None değilse aksiyona gerek yoktur (varlık yok / düşük güven).
+    """
+    log.info("\n[*] Analiz Başlatıldı: '%s'", soru)
+    b = IstekBaglami(soru, hafiza)
+    with span("cevap_hazirla", iz=b.iz_id, soru=soru):
+        return b, _cevap_hazirla(b)
+
+def _cevap_hazirla(b):
+    # 1. NER + Hafıza
+    varlik = b.al("varlik")
+    if varlik is None:
+        log.info("   > [NER] Herhangi bir varlık bulunamadı.")
+        return "Hangi hisse veya varlık hakkında konuşuyoruz? (Örn: THY, Altın)"
+
+    # 2. BERT (+ bağlam düzeltme)
+    niyet, guven = b.al("niyet")
     
     # Güven kontrolü
     if guven < GUVEN_ESIK:
-        print(f"   > [WARN] Güven skoru eşik değerin ({GUVEN_ESIK}) altında!")
+        log.info("   > [WARN] Güven skoru eşik değerin (%s) altında!", GUVEN_ESIK)
+        _sure_logla(b.sureler)
         return f"[{varlik}] Bu soruyu tam anlayamadım, finansal bir analiz mi istiyorsunuz?"
+    return None
 
-    # 4. Zemberek Aşaması
-    analiz = girdi_irdeles(soru)
+def cevap_tamamla(b):
+    """Cevabın G/Ç tarafı: aksiyonu çalıştırır ve hafızayı günceller."""
+    varlik = b.al("varlik")
+    niyet, _ = b.al("niyet")
 
-    # 5. Aksiyon Aşaması
-    print(f"   > [ACTION] '{niyet}' aksiyonu tetikleniyor...")
-    cevap = execute_action(niyet, varlik, soru, analiz=analiz)
+    with span("cevap_tamamla", iz=b.iz_id, varlik=varlik, niyet=niyet):
+        # 3. Aksiyon: yalnızca aksiyonun bildirdiği girdiler hesaplanır
+        girdiler = {g: b.al(g) for g in aksiyon_gereksinimleri(niyet) if g != "varlik"}
+        log.info("   > [ACTION] '%s' aksiyonu tetikleniyor...", niyet)
+        with _asama(b.sureler, "Aksiyon", varlik=varlik, niyet=niyet), butce(ISTEK_BUTCESI, b.baslangic):
+            cevap = execute_action(niyet, varlik, b.soru, **girdiler)
 
-    # 6. Sonuç
-    sonuc = f"{cevap}\n{templates.YTD_NOTU}"
-    hafiza.guncelle(varlik, niyet, soru, sonuc)
+        # 4. Sonuç
+        sonuc = f"{cevap}\n{templates.YTD_NOTU}"
+        b.hafiza.guncelle(varlik, niyet, b.soru, sonuc)
     
-    print("[*] Analiz Tamamlandı.\n")
+    _sure_logla(b.sureler)
+    log.info("[*] Analiz Tamamlandı.\n")
     return sonuc
 
+def cevap_uret(soru, hafiza=hafiza):
+    b, erken_cevap = cevap_hazirla(soru, hafiza)
+    if erken_cevap is not None:
+        return erken_cevap
+    return cevap_tamamla(b)
+
 # =============================================================================
 # ANA DÖNGÜ
 # =============================================================================
@@ -206,13 +477,26 @@ if __name__ == "__main__":
     print("\n" + "="*55)
     print("      AVA v4.5 - FINANSAL ASISTAN (DEBUG MODE ON)")
     print("="*55)
-    print("Çıkış: 'exit' | Logları terminalden izleyebilirsiniz.\n")
+    print("Çıkış: 'exit' | Başlatma raporu: 'rapor' | Logları terminalden izleyebilirsiniz.\n")
+
+    if ARKA_PLAN_ISINMA:
+        print("[*] Sistemler arka planda başlatılıyor...")
+        isindir(arka_plan=True)
+    fiyat_yenileyici.baslat()
     
     while True:
         try:
             user_input = input("Siz: ").strip()
             if user_input.lower() == 'exit': break
             if not user_input: continue
+            if user_input.lower() == 'rapor':
+                print(baslatma_raporu())
+                print(f"  Tahmin cache: {tahmin_cache.istatistik()}")
+                for isim, ist in cache_istatistikleri().items():
+                    print(f"  {isim.capitalize()} cache: {ist}")
+                if KADEME_AKTIF:
+                    print(f"  Kademe: {kademe_istatistigi()}")
+                continue
             
             # Cevap üret ve terminale bas
             print(cevap_uret(user_input))
@@ -20,9 +20,39 @@ DEEPL_API_KEY = "3163134b-8654-4c18-8cb8-b90fb25c9748:fx"  # Buraya DeepL API Ke
 # MODEL AYARLARI
 # =============================================================================
 
+# Fine-tune edilmiş BERTurk niyet modeli
+# Damıtılmış küçük model için: "./finans_model_small" ('python distill_bert.py' ile üretilir)
+MODEL_YOLU = "./finans_model"
+
+# Inference backend: "pytorch" | "onnx" (fp32) | "onnx-int8" (dinamik INT8 kuantize)
+# ONNX dosyaları 'python onnx_backend.py' ile üretilir
+INFERENCE_BACKEND = "pytorch"
+ONNX_MODEL_YOLU = "./finans_model/model.onnx"
+ONNX_INT8_MODEL_YOLU = "./finans_model/model.int8.onnx"
+ONNX_THREAD_SAYISI = 0  # 0: ONNX Runtime varsayılanı (tüm çekirdekler)
+
+# Zemberek ve BERT ilk kullanımda yüklenir. True ise CLI açılışında arka planda
+# yüklenip bir dummy forward pass ile ısıtılır (ilk soru yavaş olmasın diye)
+ARKA_PLAN_ISINMA = True
+
 # BERT güven eşiği - bu değerin altındaki tahminler "anlayamadım" döner
 GUVEN_ESIK = 0.35
 
+# Kademeli sınıflandırıcı: önce karakter n-gram TF-IDF modeli, kalibre güveni
+# KADEME_ESIK'in altındaysa BERT. Model 'python kademe.py' ile üretilir
+KADEME_AKTIF = False
+KADEME_ESIK = 0.9
+KADEME_MODEL_YOLU = "./kademe_model.joblib"
+
+# Mikro-batch kuyruğu - eşzamanlı sorular tek forward pass'te toplanır
+MIKRO_BATCH_AKTIF = False   # True: tahmin_yap istekleri kuyruk üzerinden gider
+BATCH_MAKS_BOYUT = 32       # Bir forward pass'teki maksimum cümle sayısı
+BATCH_BEKLEME_MS = 5        # İlk istekten sonra batch'in dolması için beklenen süre
+
+# NER: bu uzunluktaki ve daha uzun takma adlar Türkçe ek alabilir ("dolardan").
+# Daha kısa olanlar ("koç", "ons", "usd") tam kelime olarak geçmelidir.
+NER_EK_MIN_UZUNLUK = 4
+
 # =============================================================================
 # CACHE AYARLARI
 # =============================================================================
@@ -30,9 +60,92 @@ GUVEN_ESIK = 0.35
 # Fiyat cache süresi (saniye) - API rate limit'i önlemek için
 CACHE_SURESI = 150  # 2.5 dakika
 
+# Ham ticker bilgisi (yf.Ticker.info) cache'i - tüm aksiyonlar ortak kullanır.
+# Bir okuma, istediği alanların en kısa süresi kadar tazedir; süre dolunca
+# bayat değer hemen döner ve arka planda yenilenir (stale-while-revalidate).
+INFO_ALAN_SURELERI = {
+    # Şirket tanımı: neredeyse hiç değişmez
+    "longBusinessSummary": 7 * 86400, "sector": 7 * 86400, "industry": 7 * 86400, "currency": 7 * 86400,
+    # Analist ve temel oranlar: günde birkaç kez
+    "targetMeanPrice": 6 * 3600, "recommendationKey": 6 * 3600,
+    "trailingPE": 3600, "forwardPE": 3600, "fiftyTwoWeekHigh": 3600, "fiftyTwoWeekLow": 3600,
+    "marketCap": 900,
+    # Seans içi
+    "previousClose": 300, "open": 300,
+    "currentPrice": 60, "dayLow": 60, "dayHigh": 60, "volume": 60,
+}
+INFO_VARSAYILAN_SURE = 300      # Listede olmayan alanlar
+INFO_MAKS_BAYATLIK = 3600       # Süre dolduktan sonra bayat değerin sunulabileceği ek süre
+INFO_YENILEME_ISCI = 4          # Arka plan yenileme thread sayısı
+INFO_CACHE_BOYUT = 1024         # Bellekte tutulan en fazla ticker info kaydı (LRU)
+CEVIRI_CACHE_SURESI = 30 * 86400   # DeepL çeviri hafızası (hedef dil + kaynak metin -> çeviri)
+CEVIRI_HEDEF_DIL = "TR"
+
+# actions.py önbellekleri (onbellek.YuklemeliOnbellek)
+AKSIYON_CACHE_BOYUT = 1024      # Fiyat / haber önbelleği başına maksimum kayıt (LRU)
+CEVIRI_CACHE_BOYUT = 4096       # Çeviri önbelleği maksimum kayıt
+NEGATIF_CACHE_SURESI = 30       # Başarısız çekim bu kadar saniye tekrar denenmez
+
+# Kalıcı disk katmanı: yeniden başlatmada fiyat / info / haber / çeviri önbellekleri soğuk başlamaz
+DISK_CACHE_AKTIF = True
+DISK_CACHE_YOLU = "./onbellek.sqlite3"
+
+# BERT tahmin cache'i (normalize edilmiş soru -> (niyet, güven))
+TAHMIN_CACHE_BOYUT = 1024       # Maksimum kayıt sayısı (LRU)
+TAHMIN_CACHE_SURESI = 3600      # Kayıt ömrü (saniye)
+MODEL_KONTROL_ARALIGI = 10      # Model klasörü değişikliği kontrol aralığı (saniye)
+
+# Zemberek analiz cache'i (ham soru -> normalize + morfoloji sonuçları)
+ANALIZ_CACHE_BOYUT = 256
+
+# Spekülatif ön yükleme: varlık bulunur bulunmaz fiyat ve 6 aylık günlük bar
+# arka planda çekilir; BERT bu sırada çalışır, aksiyon uçuştaki sonucu kullanır
+ON_YUKLEME_AKTIF = True
+ON_YUKLEME_ISCI = 8             # Ön yükleme thread sayısı
+ON_YUKLEME_SURESI = 60          # Tamamlanan ön yükleme sonucu bu kadar saniye paylaşılır
+
+# Aksiyon içi bağımsız dış çağrılar (örn. teknik analiz + hedef fiyat, üç çeviri)
+# paralel çalışır; hepsi bu ortak süre sınırını paylaşır (saniye)
+AKSIYON_SURESI = 8
+ALT_GOREV_ISCI = 32
+
+# Kullanıcı isteğinin dış çağrılar için toplam süre bütçesi (soru geldiği andan itibaren, saniye).
+# HTTP timeout'ları ve paralel alt görev süresi kalan bütçeden türetilir.
+ISTEK_BUTCESI = 12
+
+# Paylaşılan HTTP istemcisi (http_istemci.py): Google News, GNews, DeepL
+HTTP_HAVUZ_HOST = 16            # Bağlantı havuzu tutulan host sayısı
+HTTP_HAVUZ_BOYUT = 32           # Host başına keep-alive bağlantı (ALT_GOREV_ISCI ile uyumlu)
+HTTP_DENEME = 3                 # Deneme sayısı (ilk istek dahil)
+HTTP_GERI_CEKILME = 0.2         # Üstel geri çekilme tabanı (saniye, full jitter)
+HTTP_GERI_CEKILME_MAKS = 2.0    # Tek bekleme üst sınırı (saniye)
+HTTP_BAGLANTI_SURESI = 3.05     # Bağlantı kurma timeout üst sınırı (saniye)
+
+# Selenium headless tarayıcı havuzu (tarayici_havuzu.py): haber scraping + TradingView
+TARAYICI_HAVUZ_BOYUT = 3        # Aynı anda açık en fazla Chrome
+TARAYICI_MAKS_SAYFA = 50        # Sürücü bu kadar sayfadan sonra yenilenir
+TARAYICI_BEKLEME_SURESI = 10    # Boşta tarayıcı için en uzun bekleme (saniye)
+TARAYICI_ON_ISITMA = False      # Sunucu açılışında havuzu doldur (her tarayıcı ~100-200 MB)
+HABER_KAZIMA_ISCI = 32          # Haber içeriği scrape thread'i (tüm istekler için ortak; Chrome sayısını tarayıcı havuzu sınırlar)
+HABER_TARAYICI_BEKLEME = 0.5    # Haber scrape'i boşta tarayıcıyı en fazla bu kadar bekler, sonra HTTP scraper'lara geçer
+
+# Toplu fiyat yenileyici: TICKER_MAP'in tamamı tek yf.download ile arka planda çekilir
+FIYAT_YENILEYICI_AKTIF = True
+FIYAT_YENILEME_SURESI = 60      # Döngü aralığı (saniye); CACHE_SURESI'nden kısa olmalı
+
+# Yerel günlük bar deposu (bar_deposu.py) - TeknikAnaliz verisi
+BAR_KLASORU = "./bar_verisi"    # Ticker başına bir .npy dosyası
+BAR_ILK_DONEM = "6mo"           # Kayıt yoksa ilk çekilen dönem
+BAR_YENILEME_SURESI = 60        # Son çekimden bu kadar saniye geçmeden delta çekilmez
+RSI_YONTEMI = "sma"             # "sma": 14 günlük basit ortalama (mevcut hesap) | "wilder": Wilder yumuşatması
+
 # Haber cache süresi (saniye) - aynı haberleri tekrar çekmemek için
 HABER_CACHE_SURESI = 600  # 10 dakika
 
+# Haber cevabı için başlıkların içeriği paralel scrape edilir; ilk 3 kullanılabilir
+# haber belli olunca veya bu süre dolunca kalanlar iptal edilir (saniye, istek bütçesini aşmaz)
+HABER_ZENGINLESTIRME_SURESI = 6
+
 # =============================================================================
 # VARLIK EŞLEŞTİRMELERİ
 # =============================================================================
@@ -99,3 +212,45 @@ VARLIK_ISIM = {
     "GUMUS": "Gümüş",
     "BIST100": "BIST 100 Endeksi"
 }
+
+# =============================================================================
+# SUNUCU AYARLARI (server.py)
+# =============================================================================
+
+SUNUCU_HOST = "0.0.0.0"
+SUNUCU_PORT = 8080
+SUNUCU_MODEL_ISCI = 2           # BERT/Zemberek için thread sayısı (CPU işi)
+SUNUCU_AG_ISCI = 32             # yfinance / haber / DeepL aksiyonları için thread sayısı
+SUNUCU_MAKS_ESZAMANLI = 512     # Aynı anda işlenen istek üst sınırı (fazlası beklemede)
+SUNUCU_ISTEK_ZAMAN_ASIMI = 30   # Bir cevabın üretilmesi için maksimum süre (saniye)
+SUNUCU_MIKRO_BATCH = True       # Eşzamanlı BERT istekleri mikro-batch kuyruğunda toplansın
+SUNUCU_ISCI_HAVUZU = False      # True: niyet tahmini pre-fork işçi süreçlerinde (worker_havuzu.py)
+
+# Oturum deposu (oturum.py) - oturum başına konuşma hafızası
+OTURUM_MAKS = 100_000           # Aynı anda tutulan en fazla oturum (LRU ile tahliye)
+OTURUM_SURESI = 1800            # Bu kadar saniye erişilmeyen oturum silinir
+OTURUM_MAKS_BELLEK_MB = 256     # Tüm oturumların tahmini bellek üst sınırı
+OTURUM_GECMIS_BOYUT = 5         # Oturum başına saklanan son soru-cevap sayısı
+
+# Pre-fork işçi havuzu (worker_havuzu.py)
+ISCI_SAYISI = 4                 # İşçi süreç sayısı
+ISCI_TORCH_THREAD = 1           # İşçi başına torch thread'i (fork güvenliği + çekirdek paylaşımı)
+ISCI_BATCH_BOYUT = 8            # İşçiye tek seferde gönderilen soru sayısı
+ISCI_HAZIR_SURESI = 300         # İşçilerin modeli yükleyip hazır olması için en uzun bekleme (saniye)
+ISCI_TAHMIN_SURESI = 30         # Bir tahmin çağrısının en uzun bekleme süresi (saniye)
+ISCI_YOKLAMA_SURESI = 1.0       # Ölü işçi kontrolü aralığı (saniye)
+
+# =============================================================================
+# İZLEME VE LOG AYARLARI (izleme.py)
+# =============================================================================
+
+# Terminal log seviyesi: "DEBUG" | "INFO" | "WARNING" | "ERROR"
+# Seviyenin altındaki log çağrıları mesaj metnini hiç oluşturmaz
+LOG_SEVIYESI = "INFO"
+SUNUCU_LOG_SEVIYESI = "WARNING"  # server.py altında istek başına log basılmasın
+
+# Span izleme: aşama ve dış çağrı süreleri iz dosyasına yazılır
+IZLEME_AKTIF = False
+IZLEME_DOSYASI = "./izler.jsonl"
+IZLEME_FORMATI = "jsonl"        # "jsonl" | "chrome" (chrome://tracing / Perfetto için .json)
+IZLEME_ESIK_MS = 0              # Yalnızca bu süreden uzun kök span'ler (istekler) yazılır
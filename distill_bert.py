@@ -0,0 +1,249 @@
+"""
+Finansal Chatbot - Bilgi Damıtma (Knowledge Distillation)
+=========================================================
+Fine-tune edilmiş ./finans_model (öğretmen) ile daha az katmanlı bir
+öğrenci model eğitir. Öğrenci, öğretmenin yumuşak olasılıklarını (soft
+label) ve gerçek etiketleri birlikte öğrenir; istenirse raw_data'daki
+etiketsiz yorumlar da yalnızca soft label ile eğitime katılır.
+
+Etiketsiz yorumlar etiketli veriyle aynı ön işlemden (nlp_preprocessing)
+geçirilir; etiketli metinlerin (eğitim / doğrulama / test) büyük-küçük harf,
+noktalama ve boşluk farkıyla yakın tekrarları eğitime alınmaz. En iyi
+checkpoint test'ten ayrılmış bir doğrulama bölümüyle seçilir; rapor edilen
+test bölümü eğitim boyunca görülmez.
+
+Çıktı: ./finans_model_small (chat.py'de MODEL_YOLU olarak doğrudan kullanılabilir)
+       + öğretmen / öğrenci doğruluk, F1 ve ms/soru raporu
+"""
+
+import glob
+import re
+import time
+
+import pandas as pd
+import torch
+import torch.nn.functional as F
+from torch.utils.data import Dataset
+from transformers import BertTokenizer, BertForSequenceClassification, Trainer, TrainingArguments
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support
+
+from nlp_preprocessing import nlp_islem_yap, ZEMBEREK_AVAILABLE
+
+# =============================================================================
+# AYARLAR
+# =============================================================================
+
+OGRETMEN_YOLU = "./finans_model"
+OGRENCI_YOLU = "./finans_model_small"
+OGRENCI_KATMAN = 4          # Öğretmen 12 katman; öğrenci eşit aralıklı katmanlarla başlatılır
+SICAKLIK = 2.0              # Soft label yumuşatma sıcaklığı (T)
+ALFA = 0.7                  # Kayıp = ALFA * KL(öğretmen || öğrenci) + (1 - ALFA) * CE
+ETIKETSIZ_KULLAN = True     # raw_data/*_comments.csv yorumlarını soft label ile ekle
+ETIKETSIZ_MAKS = 5000       # Eklenecek maksimum etiketsiz yorum
+DOGRULAMA_ORANI = 0.1       # Eğitim bölümünden checkpoint seçimi için ayrılan pay
+
+label_map = {
+    'Genel Bilgi/Durum': 0,
+    'Risk ve Haber Analizi': 1,
+    'Hedef Fiyat Sorgulama': 2,
+    'Alım-Satım Niyeti': 3,
+    'Piyasa Trend/Tahmin': 4
+}
+
+# 1. Veriyi Yükle (train_bert.py ile aynı bölme)
+df = pd.read_csv('training_data_cleaned.csv')
+df['label'] = df['label'].map(label_map)
+train_texts, test_texts, train_labels, test_labels = train_test_split(
+    df['text'].values, df['label'].values, test_size=0.2, random_state=42
+)
+# Checkpoint seçimi için doğrulama bölümü (test yalnızca son raporda kullanılır)
+train_texts, val_texts, train_labels, val_labels = train_test_split(
+    train_texts, train_labels, test_size=DOGRULAMA_ORANI, random_state=42
+)
+train_texts, val_texts, test_texts = (list(map(str, t)) for t in (train_texts, val_texts, test_texts))
+train_labels, val_labels, test_labels = list(train_labels), list(val_labels), list(test_labels)
+
+# 2. Etiketsiz Yorumlar (opsiyonel, etiket = -100 -> CE kaybına girmez)
+def tekrar_anahtari(text):
+    """Yakın tekrar karşılaştırması: ön işleme + Türkçe küçük harf, noktalama ve boşluk farkı yok sayılır."""
+    text = nlp_islem_yap(text, zemberek_kullan=False, min_uzunluk=0)
+    text = text.replace("I", "ı").replace("İ", "i").lower()
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", "", text)).strip()
+
+if ETIKETSIZ_KULLAN:
+    yorumlar = []
+    for dosya in sorted(glob.glob('raw_data/*_comments.csv')):
+        yorumlar.extend(pd.read_csv(dosya)['comment'].dropna().astype(str).tolist())
+    # Etiketli veriyle aynı temizlik (training_data_cleaned.csv nlp_preprocessing çıktısıdır)
+    yorumlar = [nlp_islem_yap(y, zemberek_kullan=ZEMBEREK_AVAILABLE) for y in dict.fromkeys(yorumlar)]
+    goruldu = {tekrar_anahtari(t) for t in train_texts + val_texts + test_texts}
+    secilen, atlanan = [], 0
+    for y in yorumlar:
+        if len(y) <= 10:
+            continue
+        anahtar = tekrar_anahtari(y)
+        if anahtar in goruldu:
+            atlanan += 1
+            continue
+        goruldu.add(anahtar)
+        secilen.append(y)
+    yorumlar = secilen[:ETIKETSIZ_MAKS]
+    print(f"[*] {len(yorumlar)} etiketsiz yorum eklendi ({atlanan} etiketli veri / kendi içinde tekrar atlandı).")
+    train_texts += yorumlar
+    train_labels += [-100] * len(yorumlar)
+
+# 3. Öğretmen Modeli ve Soft Label'lar
+tokenizer = BertTokenizer.from_pretrained(OGRETMEN_YOLU)
+ogretmen = BertForSequenceClassification.from_pretrained(OGRETMEN_YOLU)
+ogretmen.eval()
+
+def logit_hesapla(model, metinler, batch=64):
+    parcalar = []
+    with torch.no_grad():
+        for i in range(0, len(metinler), batch):
+            inputs = tokenizer(metinler[i:i + batch], return_tensors="pt", truncation=True,
+                               padding="longest", max_length=128)
+            parcalar.append(model(**inputs).logits)
+    return torch.cat(parcalar)
+
+print("[*] Öğretmen soft label'ları hesaplanıyor...")
+train_logits = logit_hesapla(ogretmen, train_texts)
+val_logits = logit_hesapla(ogretmen, val_texts)
+
+# 4. Dataset Sınıfı (öğretmen logit'leri ile)
+class DistilDataset(Dataset):
+    def __init__(self, texts, labels, logits, tokenizer, max_len=128):
+        self.texts = texts
+        self.labels = labels
+        self.logits = logits
+        self.tokenizer = tokenizer
+        self.max_len = max_len
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __getitem__(self, item):
+        encoding = self.tokenizer.encode_plus(
+            self.texts[item],
+            add_special_tokens=True,
+            max_length=self.max_len,
+            return_token_type_ids=False,
+            padding='max_length',
+            truncation=True,
+            return_attention_mask=True,
+            return_tensors='pt',
+        )
+        return {
+            'input_ids': encoding['input_ids'].flatten(),
+            'attention_mask': encoding['attention_mask'].flatten(),
+            'labels': torch.tensor(self.labels[item], dtype=torch.long),
+            'teacher_logits': self.logits[item]
+        }
+
+train_dataset = DistilDataset(train_texts, train_labels, train_logits, tokenizer)
+val_dataset = DistilDataset(val_texts, val_labels, val_logits, tokenizer)
+
+# 5. Öğrenci Modeli: öğretmenden eşit aralıklı katmanlarla başlat
+def ogrenci_olustur(ogretmen, katman_sayisi):
+    config = ogretmen.config.to_dict()
+    config['num_hidden_layers'] = katman_sayisi
+    ogrenci = BertForSequenceClassification(type(ogretmen.config).from_dict(config))
+
+    L = ogretmen.config.num_hidden_layers
+    secilen = [round(i * (L - 1) / (katman_sayisi - 1)) for i in range(katman_sayisi)]
+    ogrenci.bert.embeddings.load_state_dict(ogretmen.bert.embeddings.state_dict())
+    for hedef, kaynak in enumerate(secilen):
+        ogrenci.bert.encoder.layer[hedef].load_state_dict(ogretmen.bert.encoder.layer[kaynak].state_dict())
+    ogrenci.bert.pooler.load_state_dict(ogretmen.bert.pooler.state_dict())
+    ogrenci.classifier.load_state_dict(ogretmen.classifier.state_dict())
+    print(f"[*] Öğrenci: {katman_sayisi} katman (öğretmen katmanları: {secilen})")
+    return ogrenci
+
+ogrenci = ogrenci_olustur(ogretmen, OGRENCI_KATMAN)
+
+# 6. Damıtma Kaybı
+class DistilTrainer(Trainer):
+    def compute_loss(self, model, inputs, return_outputs=False, **kwargs):
+        teacher_logits = inputs.pop('teacher_logits')
+        labels = inputs.pop('labels')
+        outputs = model(**inputs)
+        logits = outputs.logits
+
+        kl = F.kl_div(
+            F.log_softmax(logits / SICAKLIK, dim=-1),
+            F.softmax(teacher_logits / SICAKLIK, dim=-1),
+            reduction='batchmean'
+        ) * (SICAKLIK ** 2)
+
+        # Etiketsiz örnekler (-100) yalnızca KL kaybına katkı verir
+        if (labels != -100).any():
+            ce = F.cross_entropy(logits, labels, ignore_index=-100)
+            loss = ALFA * kl + (1 - ALFA) * ce
+        else:
+            loss = kl
+        return (loss, outputs) if return_outputs else loss
+
+def compute_metrics(pred):
+    labels = pred.label_ids
+    preds = pred.predictions.argmax(-1)
+    precision, recall, f1, _ = precision_recall_fscore_support(labels, preds, average='weighted')
+    acc = accuracy_score(labels, preds)
+    return {'accuracy': acc, 'f1': f1, 'precision': precision, 'recall': recall}
+
+# 7. Eğitim Parametreleri
+training_args = TrainingArguments(
+    output_dir='./results_distil',
+    num_train_epochs=5,
+    per_device_train_batch_size=16,
+    per_device_eval_batch_size=16,
+    warmup_steps=100,
+    weight_decay=0.01,
+    logging_dir='./logs_distil',
+    logging_steps=10,
+    eval_strategy="epoch",
+    save_strategy="epoch",
+    load_best_model_at_end=True,
+    metric_for_best_model="f1",
+    label_names=["labels"],
+    remove_unused_columns=False      # teacher_logits sütunu düşürülmesin
+)
+
+# 8. Eğitimi Başlat
+trainer = DistilTrainer(
+    model=ogrenci,
+    args=training_args,
+    train_dataset=train_dataset,
+    eval_dataset=val_dataset,       # En iyi checkpoint doğrulama bölümüyle seçilir
+    compute_metrics=compute_metrics
+)
+
+print("[*] Damıtma eğitimi başlıyor...")
+trainer.train()
+
+ogrenci.save_pretrained(OGRENCI_YOLU)
+tokenizer.save_pretrained(OGRENCI_YOLU)
+print(f"[BAŞARILI] Öğrenci model '{OGRENCI_YOLU}' klasörüne kaydedildi.")
+
+# 9. Rapor: Doğruluk / F1 ve ms/soru (CPU, batch=1)
+def degerlendir(model, isim):
+    model = model.to("cpu").eval()
+    tahminler = logit_hesapla(model, test_texts).argmax(-1).tolist()
+    _, _, f1, _ = precision_recall_fscore_support(test_labels, tahminler, average='weighted')
+    acc = accuracy_score(test_labels, tahminler)
+
+    ornek = test_texts[:200]
+    with torch.no_grad():
+        baslangic = time.perf_counter()
+        for metin in ornek:
+            model(**tokenizer(metin, return_tensors="pt", truncation=True, max_length=128))
+        ms = (time.perf_counter() - baslangic) / len(ornek) * 1000
+
+    parametre = sum(p.numel() for p in model.parameters()) / 1e6
+    print(f"  {isim:<10} {acc * 100:>9.2f} {f1 * 100:>9.2f} {ms:>10.2f} {parametre:>12.1f}")
+
+print("\n" + "=" * 56)
+print(f"  {'Model':<10} {'Doğruluk':>9} {'F1':>9} {'ms/soru':>10} {'Param (M)':>12}")
+print("=" * 56)
+degerlendir(ogretmen, "Öğretmen")
+degerlendir(ogrenci, "Öğrenci")
@@ -0,0 +1,222 @@
+"""
+Finansal Chatbot - Artımlı Teknik Gösterge Motoru
+=================================================
+TeknikAnaliz her çağrıda tüm kapanış serisi üzerinde diff + rolling mean
+hesaplıyordu. Bu motor her sembol için O(1) kayan durum tutar:
+
+- SMA50 / SMA200: sabit pencereli kuyruk + koşan toplam
+- RSI(14): kazanç / kayıp ortalamaları
+    "sma"    -> 14 günlük basit ortalama (önceki pandas koduyla birebir)
+    "wilder" -> Wilder yumuşatması (ilk 14 fark ortalaması ile tohumlanır)
+
+Yeni bar O(1) eklenir. Aynı günün barı tekrar gelirse (gün içi bar
+kapanışta revize edilir) son ekleme O(1) geri alınıp yeniden uygulanır.
+Sonuçlar tam yeniden hesaplama ile aynıdır (kayan toplam her pencere
+turunda math.fsum ile tazelenir, kayan nokta sapması birikmez). Temettü /
+bölünme sonrası bar deposu geçmişi yeniden düzeltilmiş fiyatlarla yazar;
+durumun son barından önceki kapanış değişmişse durum baştan kurulur.
+
+Kullanım:
+    from gostergeler import gosterge_motoru
+    sonuc = gosterge_motoru.senkronize("THY", barlar)   # barlar: bar_deposu dizisi
+"""
+
+import math
+import threading
+from collections import deque
+
+import numpy as np
+
+from config import RSI_YONTEMI
+
+RSI_PERIYOT = 14
+
+
+class KayanOrtalama:
+    """Sabit pencereli basit hareketli ortalama: O(1) ekleme ve son eklemeyi geri alma."""
+
+    __slots__ = ("pencere", "_degerler", "_toplam", "_tur", "_geri")
+
+    def __init__(self, pencere):
+        self.pencere = pencere
+        self._degerler = deque()
+        self._toplam = 0.0
+        self._tur = 0          # Toplamın fsum ile tazelenmesine kalan ekleme
+        self._geri = None      # (pencereden çıkan değer, önceki toplam, önceki tur)
+
+    def ekle(self, x):
+        cikan = self._degerler.popleft() if len(self._degerler) == self.pencere else None
+        self._geri = (cikan, self._toplam, self._tur)
+        self._degerler.append(x)
+        self._tur += 1
+        if self._tur >= self.pencere:
+            self._toplam = math.fsum(self._degerler)
+            self._tur = 0
+        else:
+            self._toplam += x - (cikan if cikan is not None else 0.0)
+
+    def geri_al(self):
+        cikan, self._toplam, self._tur = self._geri
+        self._degerler.pop()
+        if cikan is not None:
+            self._degerler.appendleft(cikan)
+        self._geri = None
+
+    @property
+    def deger(self):
+        return self._toplam / self.pencere if len(self._degerler) == self.pencere else None
+
+
+class WilderOrtalama:
+    """Wilder yumuşatması: ilk `periyot` değerin ortalaması, sonra (önceki*(n-1) + x) / n."""
+
+    __slots__ = ("periyot", "_ortalama", "_sayi", "_toplam", "_geri")
+
+    def __init__(self, periyot):
+        self.periyot = periyot
+        self._ortalama = None
+        self._sayi = 0
+        self._toplam = 0.0
+        self._geri = None
+
+    def ekle(self, x):
+        self._geri = (self._ortalama, self._sayi, self._toplam)
+        self._sayi += 1
+        if self._sayi < self.periyot:
+            self._toplam += x
+        elif self._sayi == self.periyot:
+            self._ortalama = (self._toplam + x) / self.periyot
+        else:
+            self._ortalama = (self._ortalama * (self.periyot - 1) + x) / self.periyot
+
+    def geri_al(self):
+        self._ortalama, self._sayi, self._toplam = self._geri
+        self._geri = None
+
+    @property
+    def deger(self):
+        return self._ortalama
+
+
+class GostergeDurumu:
+    """Tek bir sembolün kayan gösterge durumu."""
+
+    __slots__ = ("rsi_yontemi", "sma50", "sma200", "kazanc", "kayip",
+                 "son_ts", "son_kapanis", "onceki_kapanis", "bar_sayisi", "_geri")
+
+    def __init__(self, rsi_yontemi=RSI_YONTEMI):
+        self.rsi_yontemi = rsi_yontemi
+        self.sma50 = KayanOrtalama(50)
+        self.sma200 = KayanOrtalama(200)
+        ortalama = WilderOrtalama if rsi_yontemi == "wilder" else KayanOrtalama
+        self.kazanc = ortalama(RSI_PERIYOT)
+        self.kayip = ortalama(RSI_PERIYOT)
+        self.son_ts = None
+        self.son_kapanis = None
+        self.onceki_kapanis = None
+        self.bar_sayisi = 0
+        self._geri = None
+
+    def ekle(self, ts, kapanis):
+        """Yeni günlük bar ekler; ts son bar ile aynıysa son bar revize edilir."""
+        if self.son_ts is not None:
+            if ts == self.son_ts:
+                self._geri_al()
+            elif ts < self.son_ts:
+                raise ValueError(f"Bar sırası bozuk: {ts} < {self.son_ts}")
+
+        self._geri = (self.son_ts, self.son_kapanis, self.onceki_kapanis)
+        if self.son_kapanis is None:
+            # İlk bar: pandas'ta diff NaN, where(...) ile 0 kazanç / 0 kayıp olarak pencereye girer
+            if self.rsi_yontemi != "wilder":
+                self.kazanc.ekle(0.0)
+                self.kayip.ekle(0.0)
+        else:
+            fark = kapanis - self.son_kapanis
+            self.kazanc.ekle(fark if fark > 0 else 0.0)
+            self.kayip.ekle(-fark if fark < 0 else 0.0)
+        self.sma50.ekle(kapanis)
+        self.sma200.ekle(kapanis)
+
+        self.onceki_kapanis = self.son_kapanis
+        self.son_ts = ts
+        self.son_kapanis = kapanis
+        self.bar_sayisi += 1
+
+    def _geri_al(self):
+        if self.onceki_kapanis is not None or self.rsi_yontemi != "wilder":
+            self.kazanc.geri_al()
+            self.kayip.geri_al()
+        self.sma50.geri_al()
+        self.sma200.geri_al()
+        self.son_ts, self.son_kapanis, self.onceki_kapanis = self._geri
+        self.bar_sayisi -= 1
+        self._geri = None
+
+    @property
+    def rsi(self):
+        kazanc, kayip = self.kazanc.deger, self.kayip.deger
+        if kazanc is None or kayip is None:
+            return None
+        if kayip == 0:
+            return 100.0 if kazanc > 0 else float("nan")
+        return 100 - (100 / (1 + kazanc / kayip))
+
+    def sonuc(self):
+        return {
+            "fiyat": self.son_kapanis,
+            "rsi": self.rsi,
+            "sma50": self.sma50.deger,
+            "sma200": self.sma200.deger,
+            "bar_sayisi": self.bar_sayisi,
+        }
+
+
+def _gecmis_degisti(durum, barlar):
+    """
+    Durumun dayandığı geçmiş barlarda yok ya da farklı mı: son bar silinmiş / geri
+    gitmiş veya ondan önceki kapanış değişmiş (geriye dönük temettü / bölünme düzeltmesi).
+    Son barın kendisinin değişmesi normal revizyondur.
+    """
+    i = int(np.searchsorted(barlar["ts"], durum.son_ts, side="left"))
+    if i == len(barlar) or barlar["ts"][i] != durum.son_ts:
+        return True
+    if durum.onceki_kapanis is None:
+        return False
+    return i == 0 or float(barlar["close"][i - 1]) != durum.onceki_kapanis
+
+
+class GostergeMotoru:
+    """Sembol -> GostergeDurumu. Bar deposundan yalnızca yeni / revize barları uygular."""
+
+    def __init__(self, rsi_yontemi=RSI_YONTEMI):
+        self.rsi_yontemi = rsi_yontemi
+        self._durumlar = {}
+        self._kilit = threading.Lock()
+
+    def senkronize(self, sembol, barlar):
+        """
+        barlar: ts'ye göre sıralı bar_deposu dizisi (ts, close alanları).
+        Durumun son barından itibaren (son bar dahil) farkları uygular ve sonucu döndürür.
+        """
+        with self._kilit:
+            durum = self._durumlar.get(sembol)
+            if durum is None or (durum.son_ts is not None and len(barlar) and _gecmis_degisti(durum, barlar)):
+                durum = self._durumlar[sembol] = GostergeDurumu(self.rsi_yontemi)
+
+            bas = 0 if durum.son_ts is None else int(np.searchsorted(barlar["ts"], durum.son_ts, side="left"))
+            for ts, kapanis in zip(barlar["ts"][bas:].tolist(), barlar["close"][bas:].tolist()):
+                if ts == durum.son_ts and kapanis == durum.son_kapanis:
+                    continue
+                durum.ekle(ts, kapanis)
+            return durum.sonuc()
+
+    def sifirla(self, sembol=None):
+        with self._kilit:
+            if sembol is None:
+                self._durumlar.clear()
+            else:
+                self._durumlar.pop(sembol, None)
+
+
+gosterge_motoru = GostergeMotoru()
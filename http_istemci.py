@@ -0,0 +1,179 @@
+"""
+Finansal Chatbot - Havuzlu HTTP İstemcisi ve İstek Süre Bütçesi
+===============================================================
+Google News RSS, GNews ve DeepL çağrıları tek bir paylaşılan
+requests.Session üzerinden yapılır:
+
+- Host başına bağlantı havuzu ve keep-alive: her çağrı yeni TCP/TLS el
+  sıkışması yapmaz
+- Sınırlı yeniden deneme: bağlantı hatası, zaman aşımı ve 429/5xx için
+  "full jitter" üstel geri çekilme (Retry-After'a uyulur)
+- Süre bütçesi: kullanıcı isteğinin kalan süresi bir contextvar'da taşınır;
+  her denemenin timeout'u ve geri çekilme beklemesi kalan bütçeyi aşmaz,
+  bütçe bitince ButceAsimi (requests.Timeout) atılır
+
+Session'ın durumu (header, adapter) oluşturulduktan sonra değiştirilmez;
+urllib3 havuzları thread-safe olduğundan tüm thread'ler aynı istemciyi
+kullanır.
+
+Kullanım:
+    from http_istemci import istemci, butce
+    with butce(10):
+        response = istemci.get(url, timeout=10)   # timeout: üst sınır
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    HTTP_HAVUZ_HOST, HTTP_HAVUZ_BOYUT, HTTP_DENEME, HTTP_GERI_CEKILME, HTTP_GERI_CEKILME_MAKS,
+    HTTP_BAGLANTI_SURESI,
+)
+from izleme import log, aktif_span
+
+# =============================================================================
+# SÜRE BÜTÇESİ
+# =============================================================================
+
+_son_an = ContextVar("istek_son_an", default=None)   # time.monotonic() cinsinden
+
+class ButceAsimi(requests.Timeout):
+    """İsteğin süre bütçesi dış çağrı yapılamadan / beklenirken bitti."""
+
+@contextmanager
+def butce(saniye, baslangic=None):
+    """
+    Blok içindeki dış çağrıların toplam süre bütçesi. baslangic verilirse
+    (time.monotonic()) bütçe o andan sayılır. İç içe bütçelerde daha sıkı
+    olan geçerlidir.
+    """
+    son_an = (time.monotonic() if baslangic is None else baslangic) + saniye
+    mevcut = _son_an.get()
+    token = _son_an.set(son_an if mevcut is None else min(mevcut, son_an))
+    try:
+        yield
+    finally:
+        _son_an.reset(token)
+
+def kalan_sure():
+    """Bütçenin kalan saniyesi (bütçe yoksa None)."""
+    son_an = _son_an.get()
+    return None if son_an is None else son_an - time.monotonic()
+
+# =============================================================================
+# İSTEMCİ
+# =============================================================================
+
+YENIDEN_DENENEN_DURUMLAR = frozenset({429, 500, 502, 503, 504})
+
+class HttpIstemci:
+    def __init__(self, havuz_host=HTTP_HAVUZ_HOST, havuz_boyut=HTTP_HAVUZ_BOYUT, deneme=HTTP_DENEME,
+                 geri_cekilme=HTTP_GERI_CEKILME, geri_cekilme_maks=HTTP_GERI_CEKILME_MAKS,
+                 baglanti_suresi=HTTP_BAGLANTI_SURESI):
+        self.deneme = deneme
+        self.geri_cekilme = geri_cekilme
+        self.geri_cekilme_maks = geri_cekilme_maks
+        self.baglanti_suresi = baglanti_suresi
+        self.session = requests.Session()
+        # Yeniden deneme burada yapılır (bütçeye göre); urllib3'ün kendi denemesi kapalı
+        self._adapter = HTTPAdapter(pool_connections=havuz_host, pool_maxsize=havuz_boyut, max_retries=0)
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self._kilit = threading.Lock()
+        self.sayac = {"istek": 0, "deneme": 0, "yeniden_deneme": 0, "butce_asimi": 0}
+
+    def _say(self, **artislar):
+        with self._kilit:
+            for isim, artis in artislar.items():
+                self.sayac[isim] += artis
+
+    def _timeout(self, ust_sinir):
+        """(bağlantı, okuma) timeout'u: üst sınır ve kalan bütçenin küçüğü."""
+        kalan = kalan_sure()
+        if kalan is not None and kalan <= 0:
+            self._say(butce_asimi=1)
+            raise ButceAsimi("İstek süre bütçesi doldu")
+        okuma = ust_sinir if kalan is None else min(ust_sinir, kalan)
+        return min(self.baglanti_suresi, okuma), okuma
+
+    def _bekleme(self, deneme_no, response):
+        """Full jitter: U(0, min(maks, taban * 2^n)); 429/503 Retry-After varsa o kadar."""
+        bekleme = random.uniform(0, min(self.geri_cekilme_maks, self.geri_cekilme * 2 ** deneme_no))
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            bekleme = min(self.geri_cekilme_maks, float(retry_after))
+        kalan = kalan_sure()
+        if kalan is not None and bekleme >= kalan:
+            return None   # Beklemek bütçeyi tüketir; tekrar denenmez
+        return bekleme
+
+    def istek(self, yontem, url, timeout=10, yeniden_dene=None, **kwargs):
+        """
+        Tek HTTP isteği (gerekirse yeniden denenir). timeout: deneme başına
+        üst sınır (saniye). yeniden_dene: varsayılan olarak yalnızca GET/HEAD;
+        idempotent POST'lar (örn. çeviri) için True verilebilir.
+        """
+        if yeniden_dene is None:
+            yeniden_dene = yontem.upper() in ("GET", "HEAD")
+        deneme_sayisi = self.deneme if yeniden_dene else 1
+        self._say(istek=1)
+
+        for deneme_no in range(deneme_sayisi):
+            son_deneme = deneme_no == deneme_sayisi - 1
+            self._say(deneme=1)
+            response, hata = None, None
+            try:
+                response = self.session.request(yontem, url, timeout=self._timeout(timeout), **kwargs)
+            except ButceAsimi:
+                raise
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if son_deneme:
+                    raise
+                hata = e
+            if response is not None and (response.status_code not in YENIDEN_DENENEN_DURUMLAR or son_deneme):
+                aktif_span().ozellik(deneme=deneme_no + 1)
+                return response
+
+            bekleme = self._bekleme(deneme_no, response)
+            if bekleme is None:
+                self._say(butce_asimi=1)
+                if hata is not None:
+                    raise hata
+                return response
+            log.debug("   > [HTTP] %s %s yeniden deneniyor (%s), %.2f s sonra", yontem, url[:60],
+                      hata or response.status_code, bekleme)
+            self._say(yeniden_deneme=1)
+            if response is not None:
+                response.close()
+            time.sleep(bekleme)
+
+    def get(self, url, **kwargs):
+        return self.istek("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.istek("POST", url, **kwargs)
+
+    def baglanti_istatistigi(self):
+        """Host havuzları: açılan bağlantı ve yapılan istek sayısı (fark = yeniden kullanım)."""
+        havuzlar = self._adapter.poolmanager.pools
+        baglanti = istek = 0
+        for anahtar in havuzlar.keys():
+            havuz = havuzlar[anahtar]
+            baglanti += havuz.num_connections
+            istek += havuz.num_requests
+        return {"host": len(havuzlar), "yeni_baglanti": baglanti, "istek": istek,
+                "yeniden_kullanim": istek - baglanti}
+
+    def istatistik(self):
+        with self._kilit:
+            sayac = dict(self.sayac)
+        return dict(sayac, **self.baglanti_istatistigi())
+
+
+istemci = HttpIstemci()
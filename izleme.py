@@ -0,0 +1,229 @@
+"""
+Finansal Chatbot - İzleme (Tracing) ve Seviyeli Loglama
+=======================================================
+Hattın her aşaması (NER, normalize, tokenize, BERT, aksiyon) ve
+actions.py'deki her dış çağrı (yfinance, Google News, Selenium, DeepL)
+bir span ile sarılır. Span'ler öznitelik taşır (varlik, niyet, cache,
+upstream) ve iz dosyasına JSONL veya Chrome-trace biçiminde yazılır;
+Chrome-trace dosyası chrome://tracing, Perfetto veya speedscope ile
+flame-graph olarak açılabilir.
+
+İzleme kapalıyken span() boş bir nesne döndürür; log çağrıları %-biçimli
+olduğundan seviye kapalıysa metin hiç oluşturulmaz.
+
+Kullanım:
+    from izleme import log, span, aktif_span, baglami_tasi
+    with span("yfinance.history", upstream="yfinance", varlik=varlik):
+        ...
+    aktif_span().ozellik(cache="isabet")
+    log.info("   > [NER] Tespit Edilen: %s", varlik)
+"""
+
+import contextvars
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from config import LOG_SEVIYESI, IZLEME_AKTIF, IZLEME_DOSYASI, IZLEME_FORMATI, IZLEME_ESIK_MS
+
+# =============================================================================
+# LOGLAMA
+# =============================================================================
+# Mevcut terminal çıktısı korunur: mesajlar önek olmadan stdout'a yazılır.
+
+log = logging.getLogger("ava")
+if not log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_handler)
+    log.propagate = False
+log.setLevel(LOG_SEVIYESI)
+
+def log_seviyesi_ayarla(seviye):
+    """Çalışma anında log seviyesini değiştirir ("DEBUG", "INFO", "WARNING"...)."""
+    log.setLevel(seviye)
+
+# =============================================================================
+# SPAN'LER
+# =============================================================================
+
+_span_sayaci = itertools.count(1)
+_yerel = threading.local()
+_kok_kilidi = threading.Lock()   # Kökün kapanışı ile başka thread'deki çocuğun eklenmesi yarışmasın
+
+class Span:
+    """
+    Tek bir zaman aralığı. Kök span bittiğinde tüm alt span'leriyle yazılır;
+    kökten sonra biten alt span (örn. süresi dolan paralel dal, iptal edilen
+    scrape) kaybolmaz, aynı iz kimliğiyle tek başına ve gec=True ile yazılır.
+    """
+
+    __slots__ = ("isim", "oznitelikler", "id", "ust", "kok", "iz", "baslangic",
+                 "_t0", "sure_ms", "cocuklar", "tid", "kapandi")
+
+    def __init__(self, isim, ust, oznitelikler):
+        self.isim = isim
+        self.oznitelikler = oznitelikler
+        self.id = next(_span_sayaci)
+        self.ust = ust
+        self.kok = ust.kok if ust is not None else self
+        self.iz = ust.iz if ust is not None else (oznitelikler.pop("iz", None) or yeni_iz_id())
+        self.baslangic = time.time()
+        self._t0 = time.perf_counter()
+        self.sure_ms = 0.0
+        self.cocuklar = [] if ust is None else None
+        self.tid = threading.get_ident()
+        self.kapandi = False
+
+    def ozellik(self, **oznitelikler):
+        """Span'e sonradan öznitelik ekler (örn. cache isabeti, sonuç sayısı)."""
+        self.oznitelikler.update(oznitelikler)
+        return self
+
+class _BosSpan:
+    """İzleme kapalıyken döndürülen, hiçbir şey yapmayan span."""
+
+    __slots__ = ()
+    sure_ms = 0.0
+
+    def ozellik(self, **oznitelikler):
+        return self
+
+_BOS_SPAN = _BosSpan()
+
+def yeni_iz_id():
+    """Bir isteğin span'lerini gruplayan iz kimliği (izleme kapalıysa None)."""
+    return uuid.uuid4().hex[:16] if _yazici is not None else None
+
+def aktif_span():
+    """Bu thread'de açık olan en içteki span (yoksa boş span)."""
+    yigin = getattr(_yerel, "yigin", None)
+    return yigin[-1] if yigin else _BOS_SPAN
+
+def baglami_tasi(fn):
+    """
+    fn başka bir thread'de (thread havuzu) çalışacaksa, içinde açılan
+    span'lerin çağıranın aktif span'inin altına bağlanmasını ve
+    contextvar'ların (örn. http_istemci süre bütçesi) taşınmasını sağlar.
+    """
+    ust = aktif_span()
+    baglam = contextvars.copy_context()
+
+    def _sarmalanmis(*args, **kwargs):
+        if ust is _BOS_SPAN:
+            return baglam.run(fn, *args, **kwargs)
+        eski = getattr(_yerel, "yigin", None)
+        _yerel.yigin = [ust]
+        try:
+            return baglam.run(fn, *args, **kwargs)
+        finally:
+            _yerel.yigin = eski
+    return _sarmalanmis
+
+@contextmanager
+def span(isim, **oznitelikler):
+    """
+    Bloğu bir span ile sarar. Aynı thread'de iç içe açılan span'ler
+    ebeveyn-çocuk ilişkisi kurar; kök span'e iz=... verilirse farklı
+    thread'lerdeki kökler aynı istek altında gruplanır.
+    """
+    if _yazici is None:
+        yield _BOS_SPAN
+        return
+
+    yigin = getattr(_yerel, "yigin", None)
+    if yigin is None:
+        yigin = _yerel.yigin = []
+    s = Span(isim, yigin[-1] if yigin else None, oznitelikler)
+    yigin.append(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.oznitelikler["hata"] = type(e).__name__
+        raise
+    finally:
+        s.sure_ms = (time.perf_counter() - s._t0) * 1000
+        yigin.pop()
+        with _kok_kilidi:
+            if s.kok is s:
+                s.kapandi = True
+                yazilacak = s.cocuklar + [s] if s.sure_ms >= IZLEME_ESIK_MS else None
+            elif s.kok.kapandi:
+                # Kök çoktan yazıldı (veya eşik altındaydı): geç biten span ayrı yazılır
+                s.oznitelikler["gec"] = True
+                yazilacak = [s]
+            else:
+                s.kok.cocuklar.append(s)
+                yazilacak = None
+        if yazilacak and _yazici is not None:
+            _yazici.yaz(yazilacak)
+
+# =============================================================================
+# İZ DOSYASI
+# =============================================================================
+
+class IzYazici:
+    """
+    Span'leri dosyaya ekler. Biçimler:
+    - "jsonl": satır başına bir span (iz, id, ust, isim, baslangic, sure_ms, oznitelikler)
+    - "chrome": Chrome Trace Event "X" olayları (kapanış ']' isteğe bağlıdır)
+    """
+
+    def __init__(self, yol, bicim="jsonl"):
+        self.yol = yol
+        self.bicim = bicim
+        self._kilit = threading.Lock()
+        self._pid = os.getpid()
+        yeni = not os.path.exists(yol) or os.path.getsize(yol) == 0
+        self._dosya = open(yol, "a", encoding="utf-8")
+        if bicim == "chrome" and yeni:
+            self._dosya.write("[\n")
+
+    def _satir(self, s):
+        if self.bicim == "chrome":
+            return json.dumps({
+                "name": s.isim, "cat": s.oznitelikler.get("upstream", "hat"), "ph": "X",
+                "ts": int(s.baslangic * 1e6), "dur": int(s.sure_ms * 1000),
+                "pid": self._pid, "tid": s.tid,
+                "args": dict(s.oznitelikler, iz=s.iz, id=s.id, ust=s.ust.id if s.ust else None),
+            }, ensure_ascii=False, default=str) + ",\n"
+        return json.dumps({
+            "iz": s.iz, "id": s.id, "ust": s.ust.id if s.ust else None, "isim": s.isim,
+            "baslangic": round(s.baslangic, 6), "sure_ms": round(s.sure_ms, 3),
+            "oznitelikler": s.oznitelikler,
+        }, ensure_ascii=False, default=str) + "\n"
+
+    def yaz(self, spanler):
+        satirlar = "".join(self._satir(s) for s in spanler)
+        with self._kilit:
+            self._dosya.write(satirlar)
+            self._dosya.flush()
+
+    def kapat(self):
+        with self._kilit:
+            self._dosya.close()
+
+_yazici = None
+
+def izlemeyi_baslat(yol=IZLEME_DOSYASI, bicim=IZLEME_FORMATI):
+    """İz dosyasını açar; bundan sonra span() kayıt tutar."""
+    global _yazici
+    if _yazici is None:
+        _yazici = IzYazici(yol, bicim)
+        print(f"[+] [İZLEME] Span'ler '{yol}' dosyasına yazılıyor ({bicim}).")
+    return _yazici
+
+def izlemeyi_durdur():
+    global _yazici
+    if _yazici is not None:
+        _yazici.kapat()
+        _yazici = None
+
+if IZLEME_AKTIF:
+    izlemeyi_baslat()
@@ -0,0 +1,130 @@
+"""
+Finansal Chatbot - Kademeli (Cascade) Niyet Sınıflandırıcı
+==========================================================
+"fiyatı ne", "haber var mı", "alınır mı" gibi kalıp sorular için BERT'e
+gerek yoktur. Karakter n-gram TF-IDF + kalibre edilmiş doğrusal model
+önce dener; kalibre güveni KADEME_ESIK'i geçerse cevap verir, geçmezse
+soru BERT'e düşer.
+
+Model training_data_cleaned.csv'nin train_bert.py ile aynı eğitim
+bölümünden (random_state=42) eğitilir; test bölümünde BERT ile
+karşılaştırılır.
+
+Kullanım:
+    python kademe.py                       # Eğit, kaydet, eşik taraması raporu
+    python kademe.py --esik 0.8 0.9 0.95
+"""
+
+import time
+
+from config import KADEME_MODEL_YOLU, KADEME_ESIK
+
+try:
+    import joblib
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+
+class KademeSiniflandirici:
+    """Kaydedilmiş TF-IDF + kalibre doğrusal model. tahmin() -> [(niyet, guven), ...]"""
+
+    def __init__(self, yol=KADEME_MODEL_YOLU):
+        if not SKLEARN_AVAILABLE:
+            raise ImportError("scikit-learn / joblib kurulu değil")
+        self.model = joblib.load(yol)
+
+    def tahmin(self, texts):
+        probs = self.model.predict_proba(texts)
+        siniflar = self.model.classes_
+        return [(siniflar[i], float(p[i])) for p, i in zip(probs, probs.argmax(axis=1))]
+
+
+def model_olustur():
+    from sklearn.calibration import CalibratedClassifierCV
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.pipeline import make_pipeline
+    from sklearn.svm import LinearSVC
+
+    return make_pipeline(
+        # char_wb: kelime sınırlarına duyarlı n-gram; Türkçe ekleri ("alınır", "alınırmı") yakalar
+        TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 5), sublinear_tf=True, min_df=2),
+        # Sigmoid kalibrasyonu: eşik karşılaştırması için anlamlı olasılıklar
+        CalibratedClassifierCV(LinearSVC(C=0.5), method="sigmoid", cv=5),
+    )
+
+
+def veri_bol():
+    """train_bert.py ile aynı eğitim / test bölmesi."""
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+
+    df = pd.read_csv('training_data_cleaned.csv').dropna(subset=['text', 'label'])
+    return train_test_split(
+        df['text'].astype(str).values, df['label'].values, test_size=0.2, random_state=42
+    )
+
+
+# =============================================================================
+# EĞİTİM VE RAPOR
+# =============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    import numpy as np
+
+    parser = argparse.ArgumentParser(description="Kademeli niyet sınıflandırıcı eğitimi ve raporu")
+    parser.add_argument("--esik", type=float, nargs="+", default=[0.7, 0.8, 0.9, 0.95, KADEME_ESIK])
+    parser.add_argument("--bert-yok", action="store_true", help="BERT karşılaştırmasını atla")
+    args = parser.parse_args()
+
+    train_texts, test_texts, train_labels, test_labels = veri_bol()
+    test_texts, test_labels = list(test_texts), np.asarray(test_labels)
+
+    print(f"[*] Hafif model eğitiliyor ({len(train_texts)} örnek)...")
+    baslangic = time.perf_counter()
+    model = model_olustur().fit(train_texts, train_labels)
+    print(f"[+] Eğitim: {time.perf_counter() - baslangic:.1f} s")
+    joblib.dump(model, KADEME_MODEL_YOLU)
+    print(f"[BAŞARILI] Model '{KADEME_MODEL_YOLU}' olarak kaydedildi.")
+
+    # Hafif model: soru başına tahmin ve süre
+    kademe = KademeSiniflandirici(KADEME_MODEL_YOLU)
+    baslangic = time.perf_counter()
+    hafif = [kademe.tahmin([t])[0] for t in test_texts]
+    hafif_ms = (time.perf_counter() - baslangic) / len(test_texts) * 1000
+    hafif_niyet = np.array([n for n, _ in hafif])
+    hafif_guven = np.array([g for _, g in hafif])
+
+    # BERT: aynı test bölümü, soru başına
+    bert_niyet, bert_ms = None, None
+    if not args.bert_yok:
+        import chat
+        chat.isindir()
+        baslangic = time.perf_counter()
+        bert_niyet = np.array([chat._model_tahmin(chat.bert.al(), [t])[0][0] for t in test_texts])
+        bert_ms = (time.perf_counter() - baslangic) / len(test_texts) * 1000
+
+    print("\n" + "=" * 72)
+    print(f"  Hafif model tek başına: doğruluk %{(hafif_niyet == test_labels).mean() * 100:.2f} | "
+          f"{hafif_ms:.2f} ms/soru")
+    if bert_niyet is not None:
+        print(f"  BERT tek başına:        doğruluk %{(bert_niyet == test_labels).mean() * 100:.2f} | "
+              f"{bert_ms:.2f} ms/soru")
+    print("=" * 72)
+    print(f"  {'Eşik':>6} {'Kısa devre':>11} {'Kademe doğr.':>13} {'Δ doğr. (BERT)':>15} {'Ort. ms/soru':>13}")
+    for esik in sorted(set(args.esik)):
+        kisa = hafif_guven >= esik
+        if bert_niyet is not None:
+            kademe_niyet = np.where(kisa, hafif_niyet, bert_niyet)
+            dogruluk = (kademe_niyet == test_labels).mean()
+            delta = dogruluk - (bert_niyet == test_labels).mean()
+            # Hafif model her soruda çalışır, BERT yalnızca düşen sorularda
+            ort_ms = hafif_ms + (1 - kisa.mean()) * bert_ms
+            print(f"  {esik:>6.2f} {kisa.mean() * 100:>10.1f}% {dogruluk * 100:>12.2f}% "
+                  f"{delta * 100:>+14.2f}% {ort_ms:>13.2f}")
+        else:
+            # BERT yoksa yalnızca kısa devre edilen soruların doğruluğu
+            dogruluk = (hafif_niyet[kisa] == test_labels[kisa]).mean() if kisa.any() else float("nan")
+            print(f"  {esik:>6.2f} {kisa.mean() * 100:>10.1f}% {dogruluk * 100:>12.2f}% {'-':>15} {'-':>13}")
@@ -0,0 +1,95 @@
+"""
+Finansal Chatbot - Mikro-Batch Kuyruğu
+======================================
+Eşzamanlı gelen tekil tahmin isteklerini birkaç milisaniye boyunca
+toplayıp tek bir batch fonksiyonu çağrısında işler. Her çağıran kendi
+sonucunu Future üzerinden alır.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from collections import deque
+
+
+class MikroBatchKuyrugu:
+    """
+    Tekil istekleri batch'lere toplayan arka plan işçisi.
+
+    Parametreler:
+    - batch_fn: Liste alıp aynı sırada sonuç listesi döndüren fonksiyon
+    - maks_boyut: Bir batch'teki maksimum istek sayısı
+    - bekleme_ms: İlk istek geldikten sonra batch'in dolması için beklenen süre
+    """
+
+    def __init__(self, batch_fn, maks_boyut=32, bekleme_ms=5):
+        self.batch_fn = batch_fn
+        self.maks_boyut = maks_boyut
+        self.bekleme = bekleme_ms / 1000.0
+        self._bekleyenler = deque()
+        self._kosul = threading.Condition()
+        self._calisiyor = True
+        self.batch_sayisi = 0
+        self.istek_sayisi = 0
+        self._isci = threading.Thread(target=self._dongu, name="mikro-batch", daemon=True)
+        self._isci.start()
+
+    def gonder(self, girdi):
+        """İsteği kuyruğa ekler, sonucu taşıyacak Future'ı döndürür."""
+        future = Future()
+        with self._kosul:
+            if not self._calisiyor:
+                raise RuntimeError("Mikro-batch kuyruğu kapatıldı")
+            self._bekleyenler.append((girdi, future))
+            self._kosul.notify()
+        return future
+
+    def tahmin(self, girdi, timeout=None):
+        """İsteği gönderir ve sonucunu bekler (bloklayan kısayol)."""
+        return self.gonder(girdi).result(timeout=timeout)
+
+    def kapat(self):
+        """İşçiyi durdurur; kuyrukta kalan istekler yine de işlenir."""
+        with self._kosul:
+            self._calisiyor = False
+            self._kosul.notify()
+        self._isci.join()
+
+    def _batch_topla(self):
+        with self._kosul:
+            while not self._bekleyenler and self._calisiyor:
+                self._kosul.wait()
+            if not self._bekleyenler:
+                return None
+
+            # İlk istekten itibaren en fazla 'bekleme' kadar daha istek topla
+            son_tarih = time.monotonic() + self.bekleme
+            while len(self._bekleyenler) < self.maks_boyut and self._calisiyor:
+                kalan = son_tarih - time.monotonic()
+                if kalan <= 0:
+                    break
+                self._kosul.wait(kalan)
+
+            batch = []
+            while self._bekleyenler and len(batch) < self.maks_boyut:
+                batch.append(self._bekleyenler.popleft())
+            return batch
+
+    def _dongu(self):
+        while True:
+            batch = self._batch_topla()
+            if batch is None:
+                return
+
+            girdiler = [girdi for girdi, _ in batch]
+            try:
+                sonuclar = self.batch_fn(girdiler)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.batch_sayisi += 1
+            self.istek_sayisi += len(batch)
+            for (_, future), sonuc in zip(batch, sonuclar):
+                future.set_result(sonuc)
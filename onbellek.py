@@ -0,0 +1,374 @@
+"""
+Finansal Chatbot - Önbellek Bileşenleri
+=======================================
+- LRUOnbellek: Boyut sınırlı, TTL destekli, thread-safe LRU önbellek.
+- YuklemeliOnbellek: Dış çağrı sonuçları için; LRU + kayıt başına TTL,
+  tek uçuş (single-flight) yükleme, negatif cache ve istatistik.
+- DiskKatmani: YuklemeliOnbellek'in arkasındaki kalıcı SQLite katmanı;
+  yeniden başlatmadan sonra önbellekler soğuk başlamaz.
+
+Kullanım:
+    disk = DiskKatmani("./onbellek.sqlite3")
+    fiyat_cache = YuklemeliOnbellek("fiyat", maks_boyut=1024, sure=150, negatif_sure=30, disk=disk)
+    fiyat = fiyat_cache.al_veya_yukle("THY", lambda: fiyat_cek("THY"))
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from izleme import aktif_span
+
+
+class LRUOnbellek:
+    """
+    En son kullanılanı tutan, boyut ve süre sınırlı önbellek.
+
+    Parametreler:
+    - maks_boyut: Tutulacak maksimum kayıt sayısı (aşılınca en eski atılır)
+    - sure: Kayıt ömrü (saniye). None ise süresiz.
+    """
+
+    def __init__(self, maks_boyut=1024, sure=None):
+        self.maks_boyut = maks_boyut
+        self.sure = sure
+        self._veri = OrderedDict()
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iska = 0
+
+    def al(self, anahtar):
+        """Kayıt varsa ve süresi dolmadıysa değeri döndürür, yoksa None."""
+        with self._kilit:
+            kayit = self._veri.get(anahtar)
+            if kayit is not None:
+                deger, zaman = kayit
+                if self.sure is None or time.monotonic() - zaman < self.sure:
+                    self._veri.move_to_end(anahtar)
+                    self.isabet += 1
+                    return deger
+                del self._veri[anahtar]
+            self.iska += 1
+            return None
+
+    def kaydet(self, anahtar, deger):
+        with self._kilit:
+            self._veri[anahtar] = (deger, time.monotonic())
+            self._veri.move_to_end(anahtar)
+            while len(self._veri) > self.maks_boyut:
+                self._veri.popitem(last=False)
+
+    def temizle(self):
+        with self._kilit:
+            self._veri.clear()
+
+    def __len__(self):
+        return len(self._veri)
+
+    def istatistik(self):
+        toplam = self.isabet + self.iska
+        return {
+            "boyut": len(self._veri),
+            "isabet": self.isabet,
+            "iska": self.iska,
+            "isabet_orani": self.isabet / toplam if toplam else 0.0,
+        }
+
+
+class _Ucus:
+    """Bir anahtar için süren yükleme; bekleyenler sonucu buradan alır."""
+
+    __slots__ = ("olay", "deger", "hata")
+
+    def __init__(self):
+        self.olay = threading.Event()
+        self.deger = None
+        self.hata = None
+
+
+class YuklemeliOnbellek:
+    """
+    Dış çağrı sonuçlarını tutan önbellek.
+
+    - Boyut sınırı: maks_boyut aşılınca en az yakın zamanda kullanılan atılır
+    - Kayıt başına TTL: bitiş anı yazılırken belirlenir, okurken kontrol edilir
+    - Tek uçuş: aynı anahtar için eşzamanlı ıskalarda yükleyici bir kez çalışır,
+      diğerleri sonucunu bekler
+    - Negatif cache: başarısız sonuç (negatif_mi(deger) veya istisna) kısa
+      negatif_sure boyunca tutulur; dış kaynak her istekte tekrar denenmez
+
+    Parametreler:
+    - isim: İstatistik / iz etiketleri için
+    - sure: Başarılı kayıt ömrü (saniye)
+    - negatif_sure: Başarısız kayıt ömrü (saniye)
+    - negatif_mi: Değerin başarısız sayılıp sayılmadığı (varsayılan: None ise)
+    - disk: DiskKatmani. Başarılı kayıtlar zaman damgalarıyla diske de yazılır;
+      bellekte olmayan anahtar yükleyiciden önce diskte aranır (negatifler yazılmaz)
+    """
+
+    def __init__(self, isim, maks_boyut=1024, sure=300, negatif_sure=30, negatif_mi=None, disk=None):
+        self.isim = isim
+        self.maks_boyut = maks_boyut
+        self.sure = sure
+        self.negatif_sure = negatif_sure
+        self.negatif_mi = negatif_mi or (lambda deger: deger is None)
+        self.disk = disk
+        self._veri = OrderedDict()   # anahtar -> (deger, zaman, bitis, negatif)
+        self._ucuslar = {}           # anahtar -> _Ucus
+        self._kilit = threading.Lock()
+        self._yukleme_s = 0.0
+        self.sayac = {"isabet": 0, "negatif_isabet": 0, "iska": 0, "bekleme": 0, "disk_isabet": 0,
+                      "tahliye": 0, "suresi_dolan": 0, "yukleme": 0, "yukleme_hata": 0}
+
+    # --- Kilit tutulurken çağrılanlar ---
+
+    def _oku(self, anahtar):
+        kayit = self._veri.get(anahtar)
+        if kayit is None:
+            return None
+        if time.time() >= kayit[2]:
+            del self._veri[anahtar]
+            self.sayac["suresi_dolan"] += 1
+            return None
+        self._veri.move_to_end(anahtar)
+        return kayit
+
+    def _yaz(self, anahtar, deger, zaman, sure, yazma=None):
+        """
+        Belleğe yazar; diske yazılacaksa (anahtar, deger, zaman, bitis) döndürür.
+        yazma verilirse TTL veri zamanından değil bu andan sayılır.
+        """
+        negatif = self.negatif_mi(deger)
+        if negatif or sure is None:
+            sure = self.negatif_sure if negatif else self.sure
+        bitis = (zaman if yazma is None else yazma) + sure
+        self._veri[anahtar] = (deger, zaman, bitis, negatif)
+        self._veri.move_to_end(anahtar)
+        while len(self._veri) > self.maks_boyut:
+            self._veri.popitem(last=False)
+            self.sayac["tahliye"] += 1
+        return None if negatif else (anahtar, deger, zaman, bitis)
+
+    def _diske_yaz(self, satirlar):
+        satirlar = [s for s in satirlar if s is not None]
+        if self.disk is not None and satirlar:
+            self.disk.yaz(self.isim, satirlar)
+
+    # --- Okuma / yazma ---
+
+    def al(self, anahtar, varsayilan=None):
+        """
+        Geçerli kayıt varsa değeri (negatif kayıtta başarısız değeri), yoksa
+        varsayilan. Bellekte olmayan anahtar diskte de aranır.
+        """
+        with self._kilit:
+            kayit = self._oku(anahtar)
+            if kayit is not None:
+                self.sayac["negatif_isabet" if kayit[3] else "isabet"] += 1
+                return kayit[0]
+        diskteki = self.disk.oku(self.isim, anahtar) if self.disk is not None else None
+        with self._kilit:
+            if diskteki is None:
+                self.sayac["iska"] += 1
+                return varsayilan
+            deger, zaman, bitis = diskteki
+            self.sayac["disk_isabet"] += 1
+            self._yaz(anahtar, deger, zaman, bitis - zaman)
+            return deger
+
+    def al_veya_yukle(self, anahtar, yukleyici, sure=None, zamanli=False):
+        """
+        Geçerli kayıt varsa döndürür; yoksa yukleyici()'yi (anahtar başına tek
+        uçuş) çalıştırıp sonucu kaydeder. Yükleyici istisna atarsa istisna
+        lider ve bekleyenlere iletilir, anahtar negatif kaydedilir.
+        zamanli=True: yukleyici (deger, veri zamanı) veya None döndürür; kayıt
+        veri zamanıyla yazılır (bkz. zaman()), TTL yine yükleme anından sayılır.
+        """
+        with self._kilit:
+            kayit = self._oku(anahtar)
+            if kayit is not None:
+                durum = "negatif" if kayit[3] else "isabet"
+                self.sayac["negatif_isabet" if kayit[3] else "isabet"] += 1
+            else:
+                ucus = self._ucuslar.get(anahtar)
+                lider = ucus is None
+                if lider:
+                    ucus = self._ucuslar[anahtar] = _Ucus()
+                durum = "iska" if lider else "bekleme"
+                self.sayac[durum] += 1
+        aktif_span().ozellik(cache=durum)
+
+        if kayit is not None:
+            return kayit[0]
+        if not lider:
+            ucus.olay.wait()
+            if ucus.hata is not None:
+                raise ucus.hata
+            return ucus.deger
+
+        # Yeniden başlatmadan önce yazılmış, süresi dolmamış kayıt
+        diskteki = self.disk.oku(self.isim, anahtar) if self.disk is not None else None
+        if diskteki is not None:
+            deger, zaman, bitis = diskteki
+            with self._kilit:
+                self.sayac["disk_isabet"] += 1
+                self._yaz(anahtar, deger, zaman, bitis - zaman)
+                del self._ucuslar[anahtar]
+            ucus.deger = deger
+            ucus.olay.set()
+            aktif_span().ozellik(cache="disk")
+            return deger
+
+        baslangic = time.perf_counter()
+        satir = None
+        veri_zamani = None
+        try:
+            sonuc = yukleyici()
+            if zamanli:
+                ucus.deger, veri_zamani = sonuc if sonuc is not None else (None, None)
+            else:
+                ucus.deger = sonuc
+        except Exception as e:
+            ucus.hata = e
+            raise
+        finally:
+            with self._kilit:
+                self.sayac["yukleme"] += 1
+                self._yukleme_s += time.perf_counter() - baslangic
+                if ucus.hata is not None:
+                    self.sayac["yukleme_hata"] += 1
+                simdi = time.time()
+                satir = self._yaz(anahtar, ucus.deger, veri_zamani or simdi, sure, yazma=simdi)
+                del self._ucuslar[anahtar]
+            ucus.olay.set()
+            self._diske_yaz([satir])
+        return ucus.deger
+
+    def kaydet(self, anahtar, deger, sure=None, zaman=None):
+        """zaman: verinin ait olduğu an (varsayılan: şimdi); TTL bu andan itibaren sayılır."""
+        with self._kilit:
+            satir = self._yaz(anahtar, deger, time.time() if zaman is None else zaman, sure)
+        self._diske_yaz([satir])
+
+    def kaydet_coklu(self, kayitlar, sure=None, zaman=None, zamanlar=None):
+        """
+        {anahtar: deger} kayıtlarını tek kilit altında yazar; okuyucular yarım güncelleme görmez.
+        zamanlar: {anahtar: veri zamanı} (örn. fiyatın ait olduğu bar); verilen kayıtların
+        veri zamanı odur, TTL yine yazma anından (zaman) sayılır.
+        """
+        zaman = time.time() if zaman is None else zaman
+        zamanlar = zamanlar or {}
+        with self._kilit:
+            satirlar = [self._yaz(anahtar, deger, zamanlar.get(anahtar, zaman), sure, yazma=zaman)
+                        for anahtar, deger in kayitlar.items()]
+        self._diske_yaz(satirlar)
+
+    def zaman(self, anahtar):
+        """Geçerli kaydın veri zamanı (epoch saniye) veya None."""
+        with self._kilit:
+            kayit = self._veri.get(anahtar)
+            return kayit[1] if kayit is not None and time.time() < kayit[2] else None
+
+    def __contains__(self, anahtar):
+        """Geçerli ve başarılı kayıt var mı (istatistiğe sayılmaz)."""
+        with self._kilit:
+            kayit = self._veri.get(anahtar)
+            return kayit is not None and not kayit[3] and time.time() < kayit[2]
+
+    def temizle(self):
+        with self._kilit:
+            self._veri.clear()
+
+    def __len__(self):
+        return len(self._veri)
+
+    def istatistik(self):
+        with self._kilit:
+            sayac = dict(self.sayac)
+            boyut = len(self._veri)
+        okuma = sayac["isabet"] + sayac["negatif_isabet"] + sayac["iska"] + sayac["bekleme"]
+        return dict(
+            sayac,
+            boyut=boyut,
+            isabet_orani=(sayac["isabet"] + sayac["negatif_isabet"]) / okuma if okuma else 0.0,
+            ort_yukleme_ms=self._yukleme_s / sayac["yukleme"] * 1000 if sayac["yukleme"] else 0.0,
+        )
+
+
+class DiskKatmani:
+    """
+    Kalıcı ikinci katman: SQLite (WAL) tablosunda (ad_alani, anahtar) ->
+    JSON değer, veri zamanı, bitiş. Değerler JSON'a çevrilebilir olmalıdır
+    (fiyat, info sözlüğü, haber listesi, çeviri). Dosya ilk kullanımda
+    açılır; açılışta süresi dolmuş kayıtlar silinir. Birden fazla süreç
+    aynı dosyayı paylaşabilir.
+    """
+
+    def __init__(self, yol):
+        self.yol = yol
+        self._baglanti = None
+        self._kilit = threading.Lock()
+        self.sayac = {"okuma": 0, "isabet": 0, "yazma": 0, "hata": 0}
+
+    def _bag(self):
+        if self._baglanti is None:
+            klasor = os.path.dirname(self.yol)
+            if klasor:
+                os.makedirs(klasor, exist_ok=True)
+            baglanti = sqlite3.connect(self.yol, timeout=5, isolation_level=None, check_same_thread=False)
+            # WAL + synchronous=NORMAL: yazma başına fsync yok, okuyucular yazarı beklemez
+            baglanti.execute("PRAGMA journal_mode=WAL")
+            baglanti.execute("PRAGMA synchronous=NORMAL")
+            baglanti.execute(
+                "CREATE TABLE IF NOT EXISTS kayit (ad_alani TEXT, anahtar TEXT, deger TEXT, "
+                "zaman REAL, bitis REAL, PRIMARY KEY (ad_alani, anahtar)) WITHOUT ROWID"
+            )
+            baglanti.execute("DELETE FROM kayit WHERE bitis <= ?", (time.time(),))
+            self._baglanti = baglanti
+        return self._baglanti
+
+    def oku(self, ad_alani, anahtar):
+        """Süresi dolmamış kayıt için (deger, zaman, bitis), yoksa None."""
+        with self._kilit:
+            self.sayac["okuma"] += 1
+            try:
+                satir = self._bag().execute(
+                    "SELECT deger, zaman, bitis FROM kayit WHERE ad_alani = ? AND anahtar = ?",
+                    (ad_alani, anahtar),
+                ).fetchone()
+            except sqlite3.Error:
+                self.sayac["hata"] += 1
+                return None
+            if satir is None or satir[2] <= time.time():
+                return None
+            self.sayac["isabet"] += 1
+        return json.loads(satir[0]), satir[1], satir[2]
+
+    def yaz(self, ad_alani, kayitlar):
+        """kayitlar: [(anahtar, deger, zaman, bitis), ...] tek işlemde yazılır."""
+        try:
+            satirlar = [(ad_alani, anahtar, json.dumps(deger, ensure_ascii=False), zaman, bitis)
+                        for anahtar, deger, zaman, bitis in kayitlar]
+        except (TypeError, ValueError):
+            self.sayac["hata"] += 1
+            return
+        with self._kilit:
+            try:
+                baglanti = self._bag()
+                baglanti.execute("BEGIN")
+                baglanti.executemany("INSERT OR REPLACE INTO kayit VALUES (?, ?, ?, ?, ?)", satirlar)
+                baglanti.execute("COMMIT")
+                self.sayac["yazma"] += len(satirlar)
+            except sqlite3.Error:
+                self.sayac["hata"] += 1
+                if self._baglanti is not None and self._baglanti.in_transaction:
+                    self._baglanti.execute("ROLLBACK")
+
+    def kapat(self):
+        with self._kilit:
+            if self._baglanti is not None:
+                self._baglanti.close()
+                self._baglanti = None
@@ -0,0 +1,192 @@
+"""
+Finansal Chatbot - ONNX Runtime Inference Backend
+=================================================
+Fine-tune edilmiş BERTurk niyet modelini ONNX'e aktarır, dinamik INT8
+kuantizasyon uygular ve ONNX Runtime ile çalıştırır.
+
+Doğrudan çalıştırıldığında:
+1. ./finans_model -> model.onnx (fp32) dışa aktarımı
+2. model.onnx -> model.int8.onnx dinamik kuantizasyon
+3. training_data_cleaned.csv üzerinde PyTorch ile parite kontrolü
+4. Gecikme / throughput tablosu
+"""
+
+import os
+import time
+
+import numpy as np
+
+from config import MODEL_YOLU, ONNX_MODEL_YOLU, ONNX_INT8_MODEL_YOLU, ONNX_THREAD_SAYISI
+
+# onnxruntime import
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+GIRDI_ISIMLERI = ["input_ids", "attention_mask", "token_type_ids"]
+
+
+# =============================================================================
+# DIŞA AKTARIM VE KUANTİZASYON
+# =============================================================================
+
+def onnx_disa_aktar(model_yolu=MODEL_YOLU, cikti_yolu=ONNX_MODEL_YOLU, opset=14):
+    """PyTorch BertForSequenceClassification modelini ONNX formatına aktarır."""
+    import torch
+    from transformers import BertTokenizer, BertForSequenceClassification
+
+    tokenizer = BertTokenizer.from_pretrained(model_yolu)
+    model = BertForSequenceClassification.from_pretrained(model_yolu)
+    model.eval()
+
+    ornek = tokenizer(["dolar ne kadar", "thy alınır mı"], return_tensors="pt", padding=True)
+    dinamik = {isim: {0: "batch", 1: "uzunluk"} for isim in GIRDI_ISIMLERI}
+    dinamik["logits"] = {0: "batch"}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(ornek[isim] for isim in GIRDI_ISIMLERI),
+            cikti_yolu,
+            input_names=GIRDI_ISIMLERI,
+            output_names=["logits"],
+            dynamic_axes=dinamik,
+            opset_version=opset,
+            do_constant_folding=True,
+        )
+    print(f"[+] [ONNX] Model dışa aktarıldı: {cikti_yolu} ({os.path.getsize(cikti_yolu) / 1e6:.1f} MB)")
+    return cikti_yolu
+
+
+def int8_kuantize_et(girdi_yolu=ONNX_MODEL_YOLU, cikti_yolu=ONNX_INT8_MODEL_YOLU):
+    """ONNX modeline dinamik INT8 (ağırlık) kuantizasyonu uygular."""
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    quantize_dynamic(girdi_yolu, cikti_yolu, weight_type=QuantType.QInt8)
+    print(f"[+] [ONNX] INT8 model kaydedildi: {cikti_yolu} ({os.path.getsize(cikti_yolu) / 1e6:.1f} MB)")
+    return cikti_yolu
+
+
+# =============================================================================
+# INFERENCE
+# =============================================================================
+
+class OnnxNiyetModeli:
+    """ONNX Runtime oturumu üzerinde softmax olasılıkları üreten sarmalayıcı."""
+
+    def __init__(self, yol, thread_sayisi=ONNX_THREAD_SAYISI):
+        if not ONNXRUNTIME_AVAILABLE:
+            raise RuntimeError("onnxruntime kurulu değil")
+        if not os.path.exists(yol):
+            raise FileNotFoundError(f"{yol} bulunamadı ('python onnx_backend.py' ile oluşturun)")
+
+        secenekler = ort.SessionOptions()
+        secenekler.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if thread_sayisi:
+            secenekler.intra_op_num_threads = thread_sayisi
+        self.oturum = ort.InferenceSession(yol, secenekler, providers=["CPUExecutionProvider"])
+        self.girdiler = [g.name for g in self.oturum.get_inputs()]
+
+    def olasiliklar(self, inputs):
+        """Tokenizer çıktısından (return_tensors='np') olasılık matrisi döndürür."""
+        besleme = {isim: np.asarray(inputs[isim], dtype=np.int64) for isim in self.girdiler}
+        logits = self.oturum.run(["logits"], besleme)[0]
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        ustel = np.exp(logits)
+        return ustel / ustel.sum(axis=-1, keepdims=True)
+
+
+# =============================================================================
+# PARİTE KONTROLÜ VE BENCHMARK
+# =============================================================================
+
+def _olasilik_fonksiyonlari(tokenizer, model_yolu):
+    import torch
+    from transformers import BertForSequenceClassification
+
+    pt_model = BertForSequenceClassification.from_pretrained(model_yolu)
+    pt_model.eval()
+
+    def pytorch(metinler):
+        inputs = tokenizer(metinler, return_tensors="pt", truncation=True, padding="longest", max_length=128)
+        with torch.no_grad():
+            return torch.nn.functional.softmax(pt_model(**inputs).logits, dim=-1).numpy()
+
+    def onnx_fn(oturum):
+        def calistir(metinler):
+            inputs = tokenizer(metinler, return_tensors="np", truncation=True, padding="longest", max_length=128)
+            return oturum.olasiliklar(inputs)
+        return calistir
+
+    return {
+        "pytorch": pytorch,
+        "onnx": onnx_fn(OnnxNiyetModeli(ONNX_MODEL_YOLU)),
+        "onnx-int8": onnx_fn(OnnxNiyetModeli(ONNX_INT8_MODEL_YOLU)),
+    }
+
+
+def parite_kontrol(fonksiyonlar, metinler, batch=32):
+    """Her backend'in olasılıklarını PyTorch referansıyla karşılaştırır."""
+    tum = {}
+    for isim, fn in fonksiyonlar.items():
+        parcalar = [fn(metinler[i:i + batch]) for i in range(0, len(metinler), batch)]
+        tum[isim] = np.concatenate(parcalar)
+
+    ref = tum["pytorch"]
+    ref_idx = ref.argmax(-1)
+    ref_guven = ref.max(-1)
+
+    print("\n[*] Parite (referans: PyTorch fp32)")
+    print(f"  {'Backend':<12} {'Argmax uyumu':>14} {'Ort. güven sapması':>20} {'Maks. güven sapması':>21}")
+    for isim, olasilik in tum.items():
+        uyum = (olasilik.argmax(-1) == ref_idx).mean()
+        sapma = np.abs(olasilik.max(-1) - ref_guven)
+        print(f"  {isim:<12} {uyum * 100:>13.2f}% {sapma.mean():>20.4f} {sapma.max():>21.4f}")
+    return tum
+
+
+def gecikme_tablosu(fonksiyonlar, metinler, tekil_adet=200, batch=32):
+    """Batch=1 gecikmesi (p50/p95) ve batch throughput tablosu."""
+    print(f"\n[*] Gecikme / Throughput (tekil: {tekil_adet} soru, batch: {batch})")
+    print(f"  {'Backend':<12} {'p50 ms':>9} {'p95 ms':>9} {'batch=1 q/s':>12} {f'batch={batch} q/s':>13}")
+    for isim, fn in fonksiyonlar.items():
+        fn(metinler[:2])  # Isınma
+        sureler = []
+        for metin in metinler[:tekil_adet]:
+            t0 = time.perf_counter()
+            fn([metin])
+            sureler.append((time.perf_counter() - t0) * 1000)
+        sureler.sort()
+        p50 = sureler[len(sureler) // 2]
+        p95 = sureler[int(len(sureler) * 0.95) - 1]
+
+        t0 = time.perf_counter()
+        for i in range(0, len(metinler), batch):
+            fn(metinler[i:i + batch])
+        toplu_qps = len(metinler) / (time.perf_counter() - t0)
+        print(f"  {isim:<12} {p50:>9.2f} {p95:>9.2f} {1000 / np.mean(sureler):>12.1f} {toplu_qps:>13.1f}")
+
+
+if __name__ == "__main__":
+    import pandas as pd
+    from transformers import BertTokenizer
+
+    print("=" * 50)
+    print("  ONNX / INT8 Backend - Finansal Chatbot")
+    print("=" * 50)
+
+    if not ONNXRUNTIME_AVAILABLE:
+        print("[!] onnxruntime kurulu değil: pip install onnxruntime")
+        raise SystemExit(1)
+
+    onnx_disa_aktar()
+    int8_kuantize_et()
+
+    tokenizer = BertTokenizer.from_pretrained(MODEL_YOLU)
+    metinler = pd.read_csv('training_data_cleaned.csv')['text'].astype(str).tolist()
+    fonksiyonlar = _olasilik_fonksiyonlari(tokenizer, MODEL_YOLU)
+
+    parite_kontrol(fonksiyonlar, metinler)
+    gecikme_tablosu(fonksiyonlar, metinler)
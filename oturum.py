@@ -0,0 +1,200 @@
+"""
+Finansal Chatbot - Çok Oturumlu Konuşma Hafızası
+================================================
+Her kullanıcı oturumu için küçük bir __slots__ nesnesi tutar: son varlık,
+son niyet ve sabit boyutlu halka tamponda (ring buffer) son N soru-cevap.
+
+OturumDeposu oturumları ID ile O(1) bulur ve sınırlı tutar:
+- LRU: en uzun süredir kullanılmayan oturum önce çıkar
+- TTL: OTURUM_SURESI boyunca erişilmeyen oturum süresi dolmuş sayılır
+- Bellek: oturumların tahmini toplam boyutu OTURUM_MAKS_BELLEK_MB'ı aşamaz
+
+Kullanım:
+    python oturum.py --adet 100000     # Boşta oturum başına bellek ve erişim süresi
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from config import OTURUM_MAKS, OTURUM_SURESI, OTURUM_MAKS_BELLEK_MB, OTURUM_GECMIS_BOYUT
+
+REFERANS_KELIMELER = ("peki", "ya", "onun", "bu", "o da", "aynısı", "ne kadar", "ne olur")
+
+
+class Oturum:
+    """Tek bir kullanıcının konuşma hafızası (KonusmaHafizasi ile aynı arayüz)."""
+
+    __slots__ = ("son_varlik", "son_niyet", "_gecmis", "_sira", "bayt", "kilit", "_depo")
+
+    def __init__(self, gecmis_boyut=OTURUM_GECMIS_BOYUT, depo=None):
+        self.son_varlik = None
+        self.son_niyet = None
+        self._gecmis = [None] * gecmis_boyut
+        self._sira = 0            # Yazılan toplam kayıt (halka tampondaki sonraki yer = _sira % boyut)
+        self.bayt = 0             # Geçmişteki metinlerin tahmini boyutu
+        self.kilit = None         # Sunucu: oturumun mesajları sırayla işlensin diye (tembel)
+        self._depo = depo
+
+    @property
+    def gecmis(self):
+        """Geçmiş (soru, cevap) çiftleri, eskiden yeniye."""
+        boyut = len(self._gecmis)
+        if self._sira <= boyut:
+            return self._gecmis[:self._sira]
+        bas = self._sira % boyut
+        return self._gecmis[bas:] + self._gecmis[:bas]
+
+    def guncelle(self, varlik, niyet, soru, cevap):
+        if varlik: self.son_varlik = varlik
+        if niyet: self.son_niyet = niyet
+
+        yer = self._sira % len(self._gecmis)
+        eski = self._gecmis[yer]
+        yeni = (soru, cevap)
+        self._gecmis[yer] = yeni
+        self._sira += 1
+
+        fark = _kayit_bayt(yeni) - (_kayit_bayt(eski) if eski else 0)
+        # Depo bu sırada oturumu (başka thread'de) çıkarabilir: referans bir kez okunur,
+        # oturum boyutu depo kilidi altında güncellenir
+        depo = self._depo
+        if depo is not None:
+            depo._boyut_degisti(self, fark)
+        else:
+            self.bayt += fark
+
+    def referans_var_mi(self, soru):
+        soru = soru.lower()
+        return any(kelime in soru for kelime in REFERANS_KELIMELER)
+
+
+def _kayit_bayt(kayit):
+    soru, cevap = kayit
+    return sys.getsizeof(kayit) + sys.getsizeof(soru) + sys.getsizeof(cevap)
+
+# Boş bir oturumun sabit maliyeti: nesne + halka tampon listesi + depo girdisi
+_SABIT_BAYT = sys.getsizeof(Oturum()) + sys.getsizeof([None] * OTURUM_GECMIS_BOYUT) + 200
+
+
+class OturumDeposu:
+    """
+    Oturum ID -> Oturum. Erişim sırası OrderedDict ile tutulur; en başta en
+    eski erişilen oturum olduğundan LRU, TTL ve bellek tahliyesi baştan O(1).
+    """
+
+    def __init__(self, maks_oturum=OTURUM_MAKS, sure=OTURUM_SURESI,
+                 maks_bellek_mb=OTURUM_MAKS_BELLEK_MB, gecmis_boyut=OTURUM_GECMIS_BOYUT):
+        self.maks_oturum = maks_oturum
+        self.sure = sure
+        self.maks_bayt = int(maks_bellek_mb * 1024 * 1024)
+        self.gecmis_boyut = gecmis_boyut
+        self._oturumlar = OrderedDict()   # id -> (oturum, son erişim)
+        self._kilit = threading.Lock()
+        self.bayt = 0
+        self.tahliye = {"lru": 0, "ttl": 0, "bellek": 0}
+
+    def al(self, oturum_id):
+        """Oturumu döndürür; yoksa veya süresi dolmuşsa yenisini oluşturur."""
+        simdi = time.monotonic()
+        with self._kilit:
+            kayit = self._oturumlar.get(oturum_id)
+            if kayit is not None and simdi - kayit[1] < self.sure:
+                self._oturumlar[oturum_id] = (kayit[0], simdi)
+                self._oturumlar.move_to_end(oturum_id)
+                return kayit[0]
+            if kayit is not None:
+                self._cikar(oturum_id, "ttl")
+
+            oturum = Oturum(self.gecmis_boyut, depo=self)
+            self._oturumlar[oturum_id] = (oturum, simdi)
+            self.bayt += _SABIT_BAYT
+            self._tahliye_et(simdi)
+            return oturum
+
+    def _boyut_degisti(self, oturum, fark):
+        with self._kilit:
+            oturum.bayt += fark
+            if oturum._depo is not self:
+                return  # Arada çıkarıldı: depo toplamına yansımaz
+            self.bayt += fark
+            self._tahliye_et(time.monotonic())
+
+    def _cikar(self, oturum_id, neden):
+        oturum, _ = self._oturumlar.pop(oturum_id)
+        oturum._depo = None   # Hâlâ işlenen bir isteğin güncellemesi sayaçlara yansımasın
+        self.bayt -= _SABIT_BAYT + oturum.bayt
+        self.tahliye[neden] += 1
+
+    def _tahliye_et(self, simdi):
+        """Baştan (en eski erişim) başlayarak süresi dolan ve sınırı aşan oturumları çıkarır."""
+        while self._oturumlar:
+            eski_id, (_, erisim) = next(iter(self._oturumlar.items()))
+            if simdi - erisim >= self.sure:
+                self._cikar(eski_id, "ttl")
+            elif len(self._oturumlar) > self.maks_oturum:
+                self._cikar(eski_id, "lru")
+            elif self.bayt > self.maks_bayt and len(self._oturumlar) > 1:
+                self._cikar(eski_id, "bellek")
+            else:
+                break
+
+    def temizle_suresi_dolanlar(self):
+        """Periyodik çağrı için: boşta kalıp süresi dolan oturumları çıkarır."""
+        with self._kilit:
+            self._tahliye_et(time.monotonic())
+
+    def __len__(self):
+        return len(self._oturumlar)
+
+    def __contains__(self, oturum_id):
+        return oturum_id in self._oturumlar
+
+    def istatistik(self):
+        return {
+            "oturum": len(self._oturumlar),
+            "tahmini_mb": round(self.bayt / (1024 * 1024), 2),
+            "tahliye": dict(self.tahliye),
+        }
+
+
+# =============================================================================
+# ÖLÇÜM
+# =============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    import tracemalloc
+
+    parser = argparse.ArgumentParser(description="Oturum deposu bellek / erişim ölçümü")
+    parser.add_argument("--adet", type=int, default=100_000, help="Oluşturulacak oturum sayısı")
+    parser.add_argument("--mesaj", type=int, default=2, help="Oturum başına soru-cevap")
+    args = parser.parse_args()
+
+    cevap = "Dolar şu an 32,45 TL seviyesinde işlem görüyor. " * 4
+    depo = OturumDeposu(maks_oturum=args.adet, maks_bellek_mb=10_000)
+
+    tracemalloc.start()
+    for i in range(args.adet):
+        o = depo.al(f"oturum-{i}")
+        for _ in range(args.mesaj):
+            o.guncelle("DOLAR", "Hedef Fiyat Sorgulama", f"dolar ne kadar {i}", f"{cevap}{i}")
+    gercek, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    baslangic = time.perf_counter()
+    for i in range(0, args.adet, 7):
+        depo.al(f"oturum-{i}")
+    erisim_us = (time.perf_counter() - baslangic) / len(range(0, args.adet, 7)) * 1e6
+
+    print(f"  Oturum:               {len(depo)}")
+    print(f"  Ölçülen bellek:       {gercek / 1024 / 1024:.1f} MB ({gercek / args.adet:.0f} bayt/oturum)")
+    print(f"  Depo tahmini:         {depo.istatistik()['tahmini_mb']:.1f} MB")
+    print(f"  Erişim (al):          {erisim_us:.2f} µs")
+
+    # Bellek sınırı: tahmini boyut sınırın altında tutulur
+    sinirli = OturumDeposu(maks_oturum=args.adet, maks_bellek_mb=5)
+    for i in range(args.adet):
+        sinirli.al(f"oturum-{i}").guncelle("DOLAR", None, "soru", cevap)
+    print(f"  5 MB sınırlı depo:    {sinirli.istatistik()}")
@@ -0,0 +1,233 @@
+"""
+Finansal Chatbot - Asenkron HTTP / WebSocket Sunucusu
+=====================================================
+cevap_uret hattını çok oturumlu bir asyncio sunucusunda çalıştırır.
+Her oturumun kendi konuşma hafızası vardır; BERT/Zemberek işi ve
+bloklayan ağ aksiyonları ayrı, sınırlı thread havuzlarında yürür.
+
+Uç noktalar:
+    POST /sohbet   {"oturum": "abc", "soru": "thy alınır mı"} -> {"oturum", "cevap", "sure_ms"}
+    GET  /ws?oturum=abc   Her metin mesajı bir soru, her cevap bir JSON mesajı
+    GET  /saglik          Durum ve sayaçlar
+
+Kullanım:
+    python server.py
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import chat
+from actions import fiyat_yenileyici, cache_istatistikleri, tarayici_havuzu, kazici_istatistikleri
+from http_istemci import istemci
+from oturum import OturumDeposu
+from config import (
+    SUNUCU_HOST, SUNUCU_PORT, SUNUCU_MODEL_ISCI, SUNUCU_AG_ISCI,
+    SUNUCU_MAKS_ESZAMANLI, SUNUCU_ISTEK_ZAMAN_ASIMI, SUNUCU_MIKRO_BATCH, BATCH_MAKS_BOYUT,
+    SUNUCU_ISCI_HAVUZU, SUNUCU_LOG_SEVIYESI
+)
+from izleme import log, log_seviyesi_ayarla
+
+# aiohttp import
+try:
+    from aiohttp import web, WSMsgType
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+
+# =============================================================================
+# SOHBET SERVİSİ
+# =============================================================================
+
+class SohbetServisi:
+    def __init__(self):
+        self.oturumlar = OturumDeposu()
+        # Mikro-batch açıkken forward pass tek kuyruk thread'inde çalışır; model
+        # havuzundaki thread'ler yalnızca bekler, bu yüzden bir batch dolacak kadar olmalı.
+        # İşçi modunda tahmin işçi süreçlerinde: her işçiye iş yetişecek kadar bekleyen thread
+        if chat.isci_havuzu is not None:
+            model_isci = max(SUNUCU_MODEL_ISCI, 2 * len(chat.isci_havuzu.isciler))
+        elif SUNUCU_MIKRO_BATCH:
+            model_isci = max(SUNUCU_MODEL_ISCI, BATCH_MAKS_BOYUT)
+        else:
+            model_isci = SUNUCU_MODEL_ISCI
+        self.model_havuzu = ThreadPoolExecutor(model_isci, thread_name_prefix="model")
+        self.ag_havuzu = ThreadPoolExecutor(SUNUCU_AG_ISCI, thread_name_prefix="aksiyon")
+        self.kapi = asyncio.Semaphore(SUNUCU_MAKS_ESZAMANLI)
+        self.istek_sayisi = 0
+        self.hata_sayisi = 0
+
+    async def _isle(self, soru, hafiza, iptal):
+        loop = asyncio.get_running_loop()
+        b, erken_cevap = await loop.run_in_executor(
+            self.model_havuzu, chat.cevap_hazirla, soru, hafiza
+        )
+        if erken_cevap is not None or iptal.is_set():
+            # İstek zaman aşımına uğradıysa kimsenin okumayacağı aksiyon çalıştırılmaz
+            return erken_cevap
+        return await loop.run_in_executor(self.ag_havuzu, chat.cevap_tamamla, b)
+
+    async def cevapla(self, oturum_id, soru):
+        """
+        Soruyu oturumun hafızasıyla cevaplar; CPU ve G/Ç kısımları ayrı havuzlarda.
+        Çağıran iptal ederse (zaman aşımı) thread'deki iş durdurulamaz: oturum kilidi
+        iş bitene kadar tutulur, aynı oturumun sonraki sorusu hafızayı yarım görmez.
+        """
+        hafiza = self.oturumlar.al(oturum_id)
+        if hafiza.kilit is None:
+            # Aynı oturumun mesajları sırayla işlenir (hafıza tutarlılığı)
+            hafiza.kilit = asyncio.Lock()
+
+        # Önce oturum kilidi, sonra global slot: bir oturumun sıradaki istekleri
+        # kendi kilidini beklerken eşzamanlılık slotlarını tutmaz
+        await hafiza.kilit.acquire()
+        gorev = None
+        try:
+            async with self.kapi:
+                self.istek_sayisi += 1
+                iptal = asyncio.Event()
+                gorev = asyncio.ensure_future(self._isle(soru, hafiza, iptal))
+                try:
+                    return await asyncio.shield(gorev)
+                except asyncio.CancelledError:
+                    iptal.set()
+                    raise
+        finally:
+            if gorev is None or gorev.done():
+                hafiza.kilit.release()
+            else:
+                def _birak(g):
+                    if not g.cancelled() and g.exception() is not None:
+                        log.warning("[!] [SUNUCU] Zaman aşımına uğrayan istek hatası: %s", g.exception())
+                    hafiza.kilit.release()
+                gorev.add_done_callback(_birak)
+
+    async def zaman_sinirli_cevapla(self, oturum_id, soru):
+        baslangic = time.perf_counter()
+        try:
+            cevap = await asyncio.wait_for(self.cevapla(oturum_id, soru), SUNUCU_ISTEK_ZAMAN_ASIMI)
+        except asyncio.TimeoutError:
+            self.hata_sayisi += 1
+            cevap = "Cevap hazırlanırken zaman aşımı oluştu, lütfen tekrar deneyin."
+        except Exception as e:
+            self.hata_sayisi += 1
+            log.error("[!] [SUNUCU] Kritik Hata: %s", e)
+            cevap = "Beklenmeyen bir hata oluştu."
+        return {
+            "oturum": oturum_id,
+            "cevap": cevap,
+            "sure_ms": round((time.perf_counter() - baslangic) * 1000, 1),
+        }
+
+    def kapat(self):
+        self.model_havuzu.shutdown(wait=False, cancel_futures=True)
+        self.ag_havuzu.shutdown(wait=False, cancel_futures=True)
+
+
+# =============================================================================
+# HTTP / WEBSOCKET UÇ NOKTALARI
+# =============================================================================
+
+async def sohbet(request):
+    try:
+        veri = await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return web.json_response({"hata": "Geçersiz JSON"}, status=400)
+    if not isinstance(veri, dict):
+        return web.json_response({"hata": "Geçersiz JSON"}, status=400)
+
+    soru = str(veri.get("soru", "")).strip()
+    if not soru:
+        return web.json_response({"hata": "'soru' alanı boş"}, status=400)
+    oturum_id = str(veri.get("oturum") or uuid.uuid4().hex)
+
+    servis = request.app["servis"]
+    return web.json_response(await servis.zaman_sinirli_cevapla(oturum_id, soru))
+
+
+async def websocket(request):
+    ws = web.WebSocketResponse(heartbeat=30)
+    await ws.prepare(request)
+    oturum_id = request.query.get("oturum") or uuid.uuid4().hex
+    servis = request.app["servis"]
+
+    async for mesaj in ws:
+        if mesaj.type != WSMsgType.TEXT:
+            continue
+        soru = mesaj.data.strip()
+        if soru:
+            await ws.send_json(await servis.zaman_sinirli_cevapla(oturum_id, soru))
+    return ws
+
+
+async def saglik(request):
+    servis = request.app["servis"]
+    return web.json_response({
+        "durum": "ok",
+        "oturum": servis.oturumlar.istatistik(),
+        "istek": servis.istek_sayisi,
+        "hata": servis.hata_sayisi,
+        "tahmin_cache": chat.tahmin_cache.istatistik(),
+        "fiyat_yenileyici": fiyat_yenileyici.sayac,
+        "aksiyon_cache": cache_istatistikleri(),
+        "http": istemci.istatistik(),
+        "tarayici_havuzu": tarayici_havuzu.istatistik() if tarayici_havuzu else None,
+        "haber_kazicilari": kazici_istatistikleri(),
+        "isci_havuzu": chat.isci_havuzu.isci_basina_soru if chat.isci_havuzu else None,
+    })
+
+
+async def _oturum_temizleyici(app):
+    """Süresi dolan boşta oturumları erişim beklemeden periyodik olarak siler."""
+    while True:
+        await asyncio.sleep(60)
+        app["servis"].oturumlar.temizle_suresi_dolanlar()
+
+async def _baslat(app):
+    app["servis"] = SohbetServisi()
+    app["temizleyici"] = asyncio.create_task(_oturum_temizleyici(app))
+    # Fiyat cache'i ilk kullanıcıdan önce ısınsın, sonra periyodik toplu yenilensin
+    fiyat_yenileyici.baslat()
+    # Model ve Zemberek ilk istekten önce model havuzunda ısıtılır
+    await asyncio.get_running_loop().run_in_executor(app["servis"].model_havuzu, chat.isindir)
+    print(chat.baslatma_raporu())
+
+
+async def _kapat(app):
+    app["temizleyici"].cancel()
+    fiyat_yenileyici.durdur()
+    if tarayici_havuzu:
+        tarayici_havuzu.kapat()
+    app["servis"].kapat()
+    if chat.isci_havuzu is not None:
+        chat.isci_havuzu.kapat()
+
+
+def uygulama_olustur():
+    # Eşzamanlı BERT istekleri tek forward pass'te toplansın
+    chat.MIKRO_BATCH_AKTIF = SUNUCU_MIKRO_BATCH
+    # İstek başına aşama logları yerine span izleri kullanılır (IZLEME_AKTIF)
+    log_seviyesi_ayarla(SUNUCU_LOG_SEVIYESI)
+    if SUNUCU_ISCI_HAVUZU:
+        # Fork, event loop ve arka plan thread'leri başlamadan önce yapılır
+        from worker_havuzu import IsciHavuzu
+        chat.isci_havuzu = IsciHavuzu()
+
+    app = web.Application()
+    app.router.add_post("/sohbet", sohbet)
+    app.router.add_get("/ws", websocket)
+    app.router.add_get("/saglik", saglik)
+    app.on_startup.append(_baslat)
+    app.on_cleanup.append(_kapat)
+    return app
+
+
+if __name__ == "__main__":
+    if not AIOHTTP_AVAILABLE:
+        print("[!] aiohttp kurulu değil: pip install aiohttp")
+        raise SystemExit(1)
+    web.run_app(uygulama_olustur(), host=SUNUCU_HOST, port=SUNUCU_PORT)
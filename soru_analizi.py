@@ -0,0 +1,121 @@
+"""
+Finansal Chatbot - İstek Başına Ortak Zemberek Analizi
+======================================================
+Bir kullanıcı mesajı için normalizasyonu ve morfolojik çözümlemeyi en
+fazla birer kez çalıştırır; normalize metin, token listesi ve
+fiil/zaman/soru özellikleri sonraki tüm aşamalara bu nesneden sunulur.
+
+Normalizasyon ve morfoloji iki ayrı Zemberek çağrısıdır:
+TurkishSentenceNormalizer.normalize yalnızca ham metin alır ve kendi
+ön işleme (deasciifier, birleştirme/ayırma), aday üretimi ve dil modeli
+çözümlemesini yapar; hazır bir çözümleme sonucundan beslenemez. Eğitim
+verisi de aynı normalizer ile üretildiği için BERT girdisi bu çağrıdan
+türetilmeye devam eder.
+
+Nesneler analiz cache'inde istekler arasında paylaşılır; tembel alanlar
+nesne başına bir kilitle bir kez hesaplanır.
+"""
+
+import re
+import threading
+import time
+
+SORU_KELIMELERI = ["ne", "nasıl", "kaç", "ne kadar", "ne zaman", "niçin", "neden", "kim"]
+
+
+class SoruAnalizi:
+    """
+    Tek bir soru için tembel hesaplanan Zemberek çıktıları.
+
+    Parametreler:
+    - soru: Kullanıcının ham mesajı
+    - morphology / normalizer: Zemberek nesneleri (yüklenemediyse None)
+    """
+
+    def __init__(self, soru, morphology=None, normalizer=None):
+        self.soru = soru
+        self._morphology = morphology
+        self._normalizer = normalizer
+        self._normalize = None
+        self._cozumleme = None
+        self._ozet = None
+        self.sureler = {}
+        self._kilit = threading.RLock()   # ozet -> cozumleme iç içe çağrılır
+
+    def _olc(self, asama, fn):
+        baslangic = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            self.sureler[asama] = self.sureler.get(asama, 0.0) + time.perf_counter() - baslangic
+
+    @property
+    def normalize(self):
+        """BERT girdisi: Zemberek ile normalize edilmiş metin."""
+        if self._normalize is None:
+            with self._kilit:
+                if self._normalize is None:
+                    metin = self.soru
+                    if self._normalizer is not None:
+                        try: metin = self._olc("normalize", lambda: self._normalizer.normalize(self.soru))
+                        except: pass
+                    self._normalize = metin
+        return self._normalize
+
+    @property
+    def cozumleme(self):
+        """Tokenize + morfolojik analiz + belirsizlik giderme (tek geçiş)."""
+        if self._cozumleme is None and self._morphology is not None:
+            with self._kilit:
+                if self._cozumleme is None:
+                    self._cozumleme = self._olc(
+                        "morfoloji", lambda: self._morphology.analyze_and_disambiguate(self.soru)
+                    )
+        return self._cozumleme
+
+    @property
+    def tokenlar(self):
+        if self.cozumleme is None:
+            return self.soru.split()
+        return [kelime.word_analysis.inp for kelime in self.cozumleme]
+
+    @property
+    def ozet(self):
+        """Kural tabanlı soru kontrolü + Zemberek fiil/zaman etiketleri."""
+        if self._ozet is None:
+            with self._kilit:
+                if self._ozet is None:
+                    self._ozet = self._olc("ozellik", self._ozet_cikar)
+        return self._ozet
+
+    def _ozet_cikar(self):
+        if self.cozumleme is None:
+            return {"fiil": "işlem", "zaman": "güncel", "soru_mu": "?" in self.soru}
+
+        soru_temiz = self.soru.lower().strip()
+        ozet = {
+            "fiil": "belirsiz",
+            "zaman": "belirtilmemiş",
+            "soru_mu": False
+        }
+
+        # 1. Kural: Soru işareti var mı veya soru kelimesi içeriyor mu?
+        if soru_temiz.endswith("?") or any(re.search(rf"\b{k}\b", soru_temiz) for k in SORU_KELIMELERI):
+            ozet["soru_mu"] = True
+
+        # 2. Kural: Zemberek etiketlerini kontrol et (mı/mi ekleri için)
+        for res in self.cozumleme.best_analysis():
+            pos = res.item.primary_pos.name
+            tags = res.format_string()
+
+            # Zemberek soru ekini yakalarsa (örn: alacak mısın?)
+            if pos == "Question" or "Ques" in tags:
+                ozet["soru_mu"] = True
+
+            if pos == "Verb":
+                ozet["fiil"] = res.item.lemma
+                if "Fut" in tags: ozet["zaman"] = "gelecek"
+                elif "Past" in tags: ozet["zaman"] = "geçmiş"
+                elif "Prog" in tags: ozet["zaman"] = "şimdiki"
+                elif "Necess" in tags: ozet["zaman"] = "gereklilik"
+        return ozet
@@ -0,0 +1,256 @@
+"""
+Finansal Chatbot - Headless Tarayıcı Havuzu
+===========================================
+Selenium ile scraping her URL için yeni bir headless Chrome başlatıp
+kapatıyordu; süreç başlatma sayfa başına saniyeler sürer. Havuz birkaç
+sıcak sürücü örneği tutar:
+
+- Ödünç alma süreyle sınırlıdır: boşta sürücü yoksa ve sınıra ulaşıldıysa
+  en fazla `bekleme_suresi` (ve istek süre bütçesi) kadar beklenir,
+  sonra TarayiciBulunamadi atılır
+- Sürücü `maks_sayfa` sayfadan sonra kapatılıp yenisiyle değiştirilir
+  (Chrome bellek sızıntısı / bozulan oturum durumu)
+- Ödünç blok içinde hata çıkarsa (çökme, sayfa timeout'u) sürücü havuza
+  geri konmaz, kapatılır; yerine gerektiğinde yenisi açılır
+- Sürücüler tembel açılır; isit() ile önceden açılabilir
+
+Sürücü fabrikası dışarıdan verilir; yaşam döngüsü ve eşzamanlılık
+gerçek tarayıcı olmadan sahte sürücüyle test edilir
+(test_tarayici_havuzu.py). python tarayici_havuzu.py havuzlu ve URL
+başına tarayıcı açan scraping'i sahte sürücüyle karşılaştırır.
+
+Kullanım:
+    havuz = TarayiciHavuzu(chrome_olustur, boyut=3)
+    with havuz.al() as driver:
+        driver.get(url)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from config import TARAYICI_HAVUZ_BOYUT, TARAYICI_MAKS_SAYFA, TARAYICI_BEKLEME_SURESI
+from http_istemci import kalan_sure
+from izleme import log, span
+
+
+class TarayiciBulunamadi(TimeoutError):
+    """Süre içinde boşta sürücü bulunamadı (havuz dolu)."""
+
+
+class _Surucu:
+    __slots__ = ("driver", "sayfa", "olusturma")
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.sayfa = 0
+        self.olusturma = time.monotonic()
+
+
+class TarayiciHavuzu:
+    """
+    Parametreler:
+    - fabrika: Parametresiz fonksiyon, yeni bir sürücü döndürür (quit() metodu olmalı)
+    - boyut: Aynı anda açık olabilecek en fazla sürücü
+    - maks_sayfa: Sürücü bu kadar ödünçten sonra yenilenir
+    - bekleme_suresi: Ödünç alma için en uzun bekleme (saniye)
+    """
+
+    def __init__(self, fabrika, boyut=TARAYICI_HAVUZ_BOYUT, maks_sayfa=TARAYICI_MAKS_SAYFA,
+                 bekleme_suresi=TARAYICI_BEKLEME_SURESI):
+        self.fabrika = fabrika
+        self.boyut = boyut
+        self.maks_sayfa = maks_sayfa
+        self.bekleme_suresi = bekleme_suresi
+        self._bosta = []          # LIFO: en son kullanılan (sıcak) sürücü önce verilir
+        self._acik = 0            # Açık + açılmakta olan sürücü sayısı
+        self._kapali = False
+        self._kosul = threading.Condition()
+        self.sayac = {"odunc": 0, "olusturma": 0, "yenileme": 0, "cokme": 0,
+                      "zaman_asimi": 0, "bekleme_s": 0.0}
+
+    # -------------------------------------------------------------------------
+    # Sürücü yaşam döngüsü
+    # -------------------------------------------------------------------------
+
+    def _olustur(self):
+        """Kilit dışında çağrılır; yer (_acik) önceden ayrılmıştır."""
+        try:
+            with span("selenium.baslat", upstream="selenium"):
+                surucu = _Surucu(self.fabrika())
+        except Exception:
+            with self._kosul:
+                self._acik -= 1
+                self._kosul.notify()
+            raise
+        with self._kosul:
+            self.sayac["olusturma"] += 1
+        return surucu
+
+    def _kapat(self, surucu):
+        """Kilit dışında çağrılır; sürücünün yeri serbest bırakılır."""
+        try:
+            surucu.driver.quit()
+        except Exception as e:
+            log.debug("   > [TARAYICI] quit hatası: %s", e)
+        with self._kosul:
+            self._acik -= 1
+            self._kosul.notify()
+
+    def _odunc_al(self, timeout):
+        son_an = time.monotonic() + timeout
+        with self._kosul:
+            while True:
+                if self._kapali:
+                    raise RuntimeError("Tarayıcı havuzu kapatıldı")
+                if self._bosta:
+                    return self._bosta.pop()
+                if self._acik < self.boyut:
+                    self._acik += 1
+                    break
+                kalan = son_an - time.monotonic()
+                if kalan <= 0:
+                    self.sayac["zaman_asimi"] += 1
+                    raise TarayiciBulunamadi(f"{timeout:.1f} s içinde boşta tarayıcı bulunamadı")
+                self._kosul.wait(kalan)
+        return self._olustur()
+
+    def _iade_et(self, surucu, saglam):
+        surucu.sayfa += 1
+        if not saglam or surucu.sayfa >= self.maks_sayfa:
+            with self._kosul:
+                self.sayac["cokme" if not saglam else "yenileme"] += 1
+            self._kapat(surucu)
+            return
+        with self._kosul:
+            if not self._kapali:
+                self._bosta.append(surucu)
+                self._kosul.notify()
+                return
+        self._kapat(surucu)
+
+    @contextmanager
+    def al(self, timeout=None):
+        """
+        Sürücü ödünç verir. timeout: bekleme üst sınırı (varsayılan bekleme_suresi);
+        istek süre bütçesi daha kısaysa o kullanılır. Blok hata ile çıkarsa
+        sürücü bozuk sayılıp kapatılır ve hata yukarı iletilir.
+        """
+        timeout = self.bekleme_suresi if timeout is None else timeout
+        kalan = kalan_sure()
+        if kalan is not None:
+            timeout = max(0.0, min(timeout, kalan))
+
+        with span("tarayici.al", boyut=self.boyut) as s:
+            baslangic = time.monotonic()
+            surucu = self._odunc_al(timeout)
+            bekleme = time.monotonic() - baslangic
+            s.ozellik(bekleme_ms=round(bekleme * 1000, 1), sayfa=surucu.sayfa)
+        with self._kosul:
+            self.sayac["odunc"] += 1
+            self.sayac["bekleme_s"] += bekleme
+
+        saglam = False
+        try:
+            yield surucu.driver
+            saglam = True
+        finally:
+            self._iade_et(surucu, saglam)
+
+    # -------------------------------------------------------------------------
+    # Isıtma / kapatma
+    # -------------------------------------------------------------------------
+
+    def isit(self, adet=None):
+        """Arka planda `adet` (varsayılan boyut) sürücü açar; ilk scrape başlatma beklemez."""
+        def _isit():
+            for _ in range(min(adet or self.boyut, self.boyut)):
+                with self._kosul:
+                    if self._kapali or self._acik >= self.boyut:
+                        return
+                    self._acik += 1
+                try:
+                    surucu = self._olustur()
+                except Exception as e:
+                    log.warning("   > [TARAYICI] Isıtma hatası: %s", e)
+                    return
+                with self._kosul:
+                    self._bosta.append(surucu)
+                    self._kosul.notify()
+        threading.Thread(target=_isit, name="tarayici_isit", daemon=True).start()
+
+    def kapat(self):
+        """Boştaki sürücüleri kapatır; ödünçtekiler iade edilince kapatılır."""
+        with self._kosul:
+            self._kapali = True
+            bosta, self._bosta = self._bosta, []
+            self._kosul.notify_all()
+        for surucu in bosta:
+            self._kapat(surucu)
+
+    def istatistik(self):
+        with self._kosul:
+            return dict(self.sayac, acik=self._acik, bosta=len(self._bosta), boyut=self.boyut)
+
+
+# =============================================================================
+# SAHTE SÜRÜCÜ İLE KARŞILAŞTIRMA
+# =============================================================================
+
+if __name__ == "__main__":
+    import random
+    from concurrent.futures import ThreadPoolExecutor
+
+    import izleme
+    izleme.log_seviyesi_ayarla("ERROR")
+
+    BASLATMA, SAYFA = 0.2, 0.01
+
+    class SahteSurucu:
+        def __init__(self):
+            time.sleep(BASLATMA)   # Chrome süreç başlatma
+
+        def get(self, url):
+            time.sleep(SAYFA)
+            if "cok" in url:
+                raise RuntimeError("tarayıcı çöktü")
+
+        def quit(self):
+            pass
+
+    BOYUT, MAKS_SAYFA, ISCI, SAYFA_SAYISI = 3, 10, 8, 200
+    havuz = TarayiciHavuzu(SahteSurucu, boyut=BOYUT, maks_sayfa=MAKS_SAYFA, bekleme_suresi=5)
+    rng = random.Random(0)
+    urller = [f"https://ornek/{'cok' if rng.random() < 0.05 else 'haber'}/{i}" for i in range(SAYFA_SAYISI)]
+
+    def havuzlu_scrape(url):
+        try:
+            with havuz.al() as driver:
+                driver.get(url)
+        except RuntimeError:
+            pass
+
+    def tek_kullanimlik(url):
+        # Önceki davranış: her URL için yeni sürücü
+        driver = SahteSurucu()
+        try:
+            driver.get(url)
+        except RuntimeError:
+            pass
+        driver.quit()
+
+    sureler = {}
+    for isim, scrape in (("Havuzlu", havuzlu_scrape), ("URL başına tarayıcı", tek_kullanimlik)):
+        baslangic = time.perf_counter()
+        with ThreadPoolExecutor(ISCI) as isci:
+            list(isci.map(scrape, urller))
+        sureler[isim] = time.perf_counter() - baslangic
+    ist = havuz.istatistik()
+    havuz.kapat()
+
+    print("=" * 64)
+    print(f"  {SAYFA_SAYISI} sayfa, {ISCI} thread, havuz {BOYUT}, maks {MAKS_SAYFA} sayfa/sürücü")
+    print("=" * 64)
+    print(f"  Havuz istatistiği  : {ist}")
+    print(f"  Havuzlu            : {sureler['Havuzlu']:.2f} s, {ist['olusturma']} tarayıcı başlatıldı")
+    print(f"  URL başına tarayıcı: {sureler['URL başına tarayıcı']:.2f} s, {SAYFA_SAYISI} tarayıcı başlatıldı")
@@ -0,0 +1,110 @@
+"""
+Finansal Chatbot - Tembel (Lazy) Bileşen Yükleme
+================================================
+Ağır bileşenleri (Zemberek, BERT) modül import'unda değil ilk kullanımda
+yükler; her yükleme adımının süresini ve RSS artışını başlatma raporuna
+kaydeder.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# psutil import (opsiyonel, RSS ölçümü için)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def rss_mb():
+    """Sürecin anlık RSS değerini MB cinsinden döndürür."""
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss / 1e6
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError, AttributeError):
+        # Linux dışı sistemler: tepe RSS (anlık değil)
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+# =============================================================================
+# BAŞLATMA RAPORU
+# =============================================================================
+
+_rapor = []
+_rapor_kilit = threading.Lock()
+
+
+@contextmanager
+def olcum(isim):
+    """Bir başlatma adımının süresini ve RSS artışını rapora ekler."""
+    rss_once = rss_mb()
+    baslangic = time.perf_counter()
+    durum = "OK"
+    try:
+        yield
+    except Exception:
+        durum = "HATA"
+        raise
+    finally:
+        kayit = (isim, time.perf_counter() - baslangic, rss_mb() - rss_once, durum)
+        with _rapor_kilit:
+            _rapor.append(kayit)
+
+
+def baslatma_raporu():
+    """Yüklenen bileşenlerin süre / RSS dökümünü tablo olarak döndürür."""
+    with _rapor_kilit:
+        kayitlar = list(_rapor)
+    satirlar = [
+        f"  {'Bileşen':<28} {'Süre (s)':>9} {'RSS +MB':>9}  Durum",
+        "  " + "-" * 56,
+    ]
+    for isim, sure, rss, durum in kayitlar:
+        satirlar.append(f"  {isim:<28} {sure:>9.2f} {rss:>9.1f}  {durum}")
+    toplam = sum(k[1] for k in kayitlar)
+    satirlar.append("  " + "-" * 56)
+    satirlar.append(f"  {'Toplam':<28} {toplam:>9.2f} {'':>9}  RSS: {rss_mb():.0f} MB")
+    return "\n".join(satirlar)
+
+
+# =============================================================================
+# TEMBEL BİLEŞEN
+# =============================================================================
+
+class TembelBilesen:
+    """
+    İlk al() çağrısında yükleyiciyi bir kez çalıştırır (thread-safe).
+    Yükleme hata verirse hata saklanır, al() None döner ve tekrar denenmez.
+    """
+
+    def __init__(self, isim, yukleyici):
+        self.isim = isim
+        self._yukleyici = yukleyici
+        self._deger = None
+        self._yuklendi = False
+        self.hata = None
+        self._kilit = threading.Lock()
+
+    @property
+    def yuklendi(self):
+        return self._yuklendi
+
+    def al(self):
+        if self._yuklendi:
+            return self._deger
+        with self._kilit:
+            if not self._yuklendi:
+                try:
+                    with olcum(self.isim):
+                        self._deger = self._yukleyici()
+                except Exception as e:
+                    self.hata = e
+                    print(f"[!] [{self.isim}] Yükleme hatası: {e}")
+                self._yuklendi = True
+        return self._deger
@@ -88,6 +88,9 @@ FIYAT_BASARILI = [
     "[FİYAT] {varlik_isim} için son kaydedilen rakam: {fiyat}"
 ]
 
+# Fiyatın hangi andaki veri olduğu (fiyat cevabının sonuna eklenir)
+FIYAT_ZAMANI = "\n_🕒 {saat} itibarıyla_"
+
 FIYAT_HATA = [
     "{varlik_isim} için anlık fiyat bilgisi şu an alınamıyor. Lütfen daha sonra tekrar deneyin.",
     "Fiyat servislerimizde geçici bir yoğunluk var, {varlik_isim} verisine ulaşamadım.",
@@ -0,0 +1,92 @@
+"""
+Artımlı gösterge motoru testleri: sonuçlar tam yeniden hesaplama ile aynı
+kalmalı, temettü / bölünme sonrası yeniden düzeltilen geçmiş dahil.
+
+Kullanım:
+    python -m pytest -q test_gostergeler.py
+"""
+
+import os
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import bar_deposu as bar_deposu_modulu
+from bar_deposu import BAR_DTYPE, BarDeposu
+from gostergeler import GostergeMotoru
+
+GUN = 86400
+
+
+def barlar_olustur(kapanislar, ilk_gun=0):
+    barlar = np.zeros(len(kapanislar), dtype=BAR_DTYPE)
+    barlar["ts"] = (np.arange(len(kapanislar)) + ilk_gun) * GUN
+    barlar["close"] = kapanislar
+    return barlar
+
+
+def tam_hesap(barlar):
+    return GostergeMotoru().senkronize("X", barlar)
+
+
+@pytest.fixture
+def kapanislar():
+    rng = np.random.default_rng(0)
+    return 100 + np.cumsum(rng.normal(0, 1, 260))
+
+
+def test_yeni_ve_revize_barlar_tam_hesapla_ayni(kapanislar):
+    motor = GostergeMotoru()
+    barlar = barlar_olustur(kapanislar)
+    motor.senkronize("X", barlar[:250])
+    revize = barlar[:251].copy()
+    revize["close"][-1] += 0.5          # Gün içi bar kapanışta revize edildi
+    motor.senkronize("X", revize)
+    assert motor.senkronize("X", barlar) == tam_hesap(barlar)
+
+
+def test_geriye_donuk_duzeltmede_durum_yeniden_kurulur(kapanislar):
+    motor = GostergeMotoru()
+    barlar = barlar_olustur(kapanislar)
+    motor.senkronize("X", barlar[:250])
+
+    # Temettü: tüm geçmiş kapanışlar 0.9 ile ölçeklenerek yeniden yazıldı, yeni bar eklendi
+    duzeltilmis = barlar[:251].copy()
+    duzeltilmis["close"][:250] *= 0.9
+    sonuc = motor.senkronize("X", duzeltilmis)
+
+    assert sonuc == tam_hesap(duzeltilmis)
+    assert sonuc["sma50"] == pytest.approx(np.mean(duzeltilmis["close"][-50:]))
+
+
+def test_bar_deposu_yeniden_duzeltme_gosterge_motoruna_yansir(tmp_path, monkeypatch, kapanislar):
+    """bar_deposu temettü görünce geçmişi yeniden çeker; motor eski tabanlı durumu kullanmaz."""
+    gunler = pd.date_range("2025-01-01", periods=len(kapanislar), freq="D", tz="UTC")
+    kaynak = {"n": 250, "carpan": 1.0, "temettu": None}
+
+    def history(start=None, **kwargs):
+        df = pd.DataFrame({"Open": 0.0, "High": 0.0, "Low": 0.0, "Volume": 0.0,
+                           "Close": kapanislar[:kaynak["n"]] * kaynak["carpan"],
+                           "Dividends": 0.0, "Stock Splits": 0.0}, index=gunler[:kaynak["n"]])
+        if kaynak["temettu"] is not None:
+            df.loc[gunler[kaynak["temettu"]], "Dividends"] = 1.0
+            df.loc[gunler[:kaynak["temettu"]], "Close"] *= 0.9
+        return df[df.index >= pd.Timestamp(start, tz="UTC")] if start else df
+
+    monkeypatch.setattr(bar_deposu_modulu, "yf",
+                        types.SimpleNamespace(Ticker=lambda _: types.SimpleNamespace(history=history)),
+                        raising=False)
+    monkeypatch.setattr(bar_deposu_modulu, "YFINANCE_AVAILABLE", True)
+    depo = BarDeposu(klasor=str(tmp_path), yenileme_suresi=0)
+    motor = GostergeMotoru()
+
+    motor.senkronize("X", depo.guncelle("X"))
+    kaynak.update(n=251, temettu=250)
+    os.utime(depo._yol("X"), (0, 0))   # Son çekim eski: delta çekim yapılsın
+    barlar = depo.guncelle("X")
+
+    assert depo.sayac["yeniden_duzeltme"] == 1
+    assert barlar["close"][0] == pytest.approx(kapanislar[0] * 0.9)
+    assert motor.senkronize("X", barlar) == tam_hesap(barlar)
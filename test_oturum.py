@@ -0,0 +1,51 @@
+"""
+Oturum deposu testleri: tahliye ve bayt muhasebesi.
+
+Kullanım:
+    python -m pytest -q test_oturum.py
+"""
+
+import threading
+
+from oturum import OturumDeposu, _SABIT_BAYT
+
+
+def test_cikarilan_oturumun_guncellemesi_depoya_yansimaz():
+    depo = OturumDeposu(maks_oturum=1)
+    eski = depo.al("a")
+    depo.al("b")                       # "a" LRU ile çıkarıldı
+    oncesi = depo.bayt
+    eski.guncelle("DOLAR", None, "dolar ne kadar", "32 TL")
+    assert depo.bayt == oncesi == _SABIT_BAYT + depo.al("b").bayt
+    assert eski.bayt > 0
+
+    # guncelle depo referansını okuduktan sonra oturum çıkarılırsa
+    depo._boyut_degisti(eski, 100)
+    assert depo.bayt == oncesi
+
+
+def test_esazamanli_guncelleme_ve_tahliyede_bayt_tutarli():
+    depo = OturumDeposu(maks_oturum=50)
+    dur = threading.Event()
+    hatalar = []
+
+    def guncelleyici(n):
+        try:
+            while not dur.is_set():
+                depo.al(f"oturum-{n % 80}").guncelle("DOLAR", None, "soru", "cevap" * (n % 7))
+                n += 3
+        except Exception as e:
+            hatalar.append(e)
+
+    isciler = [threading.Thread(target=guncelleyici, args=(i,)) for i in range(4)]
+    for isci in isciler:
+        isci.start()
+    for i in range(2000):
+        depo.al(f"yeni-{i}")           # Sürekli LRU tahliyesi
+    dur.set()
+    for isci in isciler:
+        isci.join()
+
+    assert hatalar == []
+    beklenen = sum(_SABIT_BAYT + oturum.bayt for oturum, _ in depo._oturumlar.values())
+    assert depo.bayt == beklenen
@@ -0,0 +1,162 @@
+"""
+Tarayıcı havuzu yaşam döngüsü ve eşzamanlılık testleri.
+Gerçek Chrome yerine başlatması ve sayfası gecikmeli sahte sürücü kullanılır.
+
+Kullanım:
+    python -m pytest -q test_tarayici_havuzu.py
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tarayici_havuzu import TarayiciHavuzu, TarayiciBulunamadi
+
+BOYUT, MAKS_SAYFA = 3, 10
+
+
+class SahteSurucu:
+    """Açık / toplam sürücü sayısını tutar; eşzamanlı veya kapatıldıktan sonra kullanımda hata verir."""
+
+    kilit = threading.Lock()
+    acik = 0
+    en_cok_acik = 0
+    toplam = 0
+
+    def __init__(self):
+        time.sleep(0.02)   # Chrome süreç başlatma
+        with SahteSurucu.kilit:
+            SahteSurucu.acik += 1
+            SahteSurucu.toplam += 1
+            SahteSurucu.en_cok_acik = max(SahteSurucu.en_cok_acik, SahteSurucu.acik)
+        self.kullanimda = threading.Lock()
+        self.kapali = False
+        self.hatalar = []
+
+    def get(self, url):
+        if self.kapali:
+            self.hatalar.append("kapatılmış sürücü kullanıldı")
+        if not self.kullanimda.acquire(blocking=False):
+            self.hatalar.append("sürücü iki thread'e aynı anda verildi")
+            return
+        try:
+            time.sleep(0.002)
+            if "cok" in url:
+                raise RuntimeError("tarayıcı çöktü")
+        finally:
+            self.kullanimda.release()
+
+    def quit(self):
+        if self.kapali:
+            self.hatalar.append("sürücü iki kez kapatıldı")
+        self.kapali = True
+        with SahteSurucu.kilit:
+            SahteSurucu.acik -= 1
+
+
+@pytest.fixture
+def surucular():
+    """Oluşturulan sahte sürücüleri toplar; sayaçları her test için sıfırlar."""
+    SahteSurucu.acik = SahteSurucu.en_cok_acik = SahteSurucu.toplam = 0
+    olusturulan = []
+
+    def fabrika():
+        surucu = SahteSurucu()
+        olusturulan.append(surucu)
+        return surucu
+    fabrika.olusturulan = olusturulan
+    yield fabrika
+    assert [h for s in olusturulan for h in s.hatalar] == []
+
+
+@pytest.fixture
+def havuz(surucular):
+    havuz = TarayiciHavuzu(surucular, boyut=BOYUT, maks_sayfa=MAKS_SAYFA, bekleme_suresi=5)
+    yield havuz
+    havuz.kapat()
+
+
+def test_eszamanli_kullanim_sinir_ve_sayim(havuz):
+    rng = random.Random(0)
+    urller = [f"https://ornek/{'cok' if rng.random() < 0.05 else 'haber'}/{i}" for i in range(200)]
+
+    def scrape(url):
+        try:
+            with havuz.al() as driver:
+                driver.get(url)
+            return "ok"
+        except RuntimeError:
+            return "cokme"
+
+    with ThreadPoolExecutor(8) as isci:
+        sonuclar = list(isci.map(scrape, urller))
+    ist = havuz.istatistik()
+
+    assert SahteSurucu.en_cok_acik <= BOYUT
+    assert ist["odunc"] == len(urller)
+    assert ist["cokme"] == sonuclar.count("cokme") > 0
+    # Her sürücü ya çöküp ya maks_sayfa'da yenilenip kapandı ya da hâlâ açık
+    assert ist["olusturma"] == SahteSurucu.toplam == ist["cokme"] + ist["yenileme"] + ist["acik"]
+    assert ist["acik"] == SahteSurucu.acik <= BOYUT
+
+
+def test_maks_sayfada_yenilenir(havuz, surucular):
+    for i in range(MAKS_SAYFA + 1):
+        with havuz.al() as driver:
+            driver.get(f"https://ornek/{i}")
+    ilk, ikinci = surucular.olusturulan
+    assert ilk.kapali and not ikinci.kapali
+    assert havuz.istatistik()["yenileme"] == 1
+
+
+def test_hatali_blokta_surucu_kapatilir(havuz, surucular):
+    with pytest.raises(RuntimeError):
+        with havuz.al() as driver:
+            driver.get("https://ornek/cok")
+    assert surucular.olusturulan[0].kapali
+    assert havuz.istatistik()["acik"] == 0
+    with havuz.al() as driver:
+        assert driver is surucular.olusturulan[1]
+
+
+def test_dolu_havuzda_bekleme_sureyle_sinirli(havuz):
+    tutulanlar = [havuz.al() for _ in range(BOYUT)]
+    for cm in tutulanlar:
+        cm.__enter__()
+    baslangic = time.perf_counter()
+    with pytest.raises(TarayiciBulunamadi):
+        with havuz.al(timeout=0.1):
+            pass
+    assert 0.1 <= time.perf_counter() - baslangic < 0.3
+    assert havuz.istatistik()["zaman_asimi"] == 1
+    for cm in tutulanlar:
+        cm.__exit__(None, None, None)
+
+
+def test_iade_bekleyene_verilir(havuz):
+    tutulanlar = [havuz.al() for _ in range(BOYUT)]
+    surucu = tutulanlar[0].__enter__()
+    for cm in tutulanlar[1:]:
+        cm.__enter__()
+    threading.Timer(0.05, tutulanlar[0].__exit__, (None, None, None)).start()
+    with havuz.al(timeout=1) as driver:
+        assert driver is surucu
+    for cm in tutulanlar[1:]:
+        cm.__exit__(None, None, None)
+
+
+def test_kapat_tum_suruculeri_kapatir(havuz):
+    odunc = havuz.al()
+    odunc.__enter__()
+    with havuz.al():
+        pass
+    havuz.kapat()
+    assert SahteSurucu.acik == 1   # Ödünçteki iade edilince kapanır
+    odunc.__exit__(None, None, None)
+    assert SahteSurucu.acik == 0
+    with pytest.raises(RuntimeError):
+        with havuz.al():
+            pass
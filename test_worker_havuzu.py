@@ -0,0 +1,77 @@
+"""
+Pre-fork işçi havuzu testleri: eşzamanlı çağrıların dağıtımı, sonuç
+yönlendirme ve ölen işçi. Model yerine gecikmeli sahte tahmin kullanılır
+(fork ile işçilere de geçer).
+
+Kullanım:
+    python -m pytest -q test_worker_havuzu.py
+"""
+
+import os
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import chat
+import worker_havuzu
+from worker_havuzu import IsciHavuzu
+
+TAHMIN_SURESI = 0.3
+
+
+def sahte_tahmin(sorular, normalize=True):
+    time.sleep(TAHMIN_SURESI)
+    if any("hata" in s for s in sorular):
+        raise ValueError("bozuk soru")
+    if any("olum" in s for s in sorular):
+        os.kill(os.getpid(), signal.SIGKILL)
+    return [(s.upper(), 1.0) for s in sorular]
+
+
+@pytest.fixture
+def havuz(monkeypatch):
+    monkeypatch.setattr(chat, "isindir", lambda *a, **k: None)
+    monkeypatch.setattr(chat, "tahmin_yap_batch", sahte_tahmin)
+    monkeypatch.setattr(worker_havuzu, "ISCI_YOKLAMA_SURESI", 0.1)
+    havuz = IsciHavuzu(4)
+    yield havuz
+    havuz.kapat()
+
+
+def test_sira_korunur(havuz):
+    sorular = [f"soru {i}" for i in range(20)]
+    assert havuz.tahmin(sorular, parca=3) == [(s.upper(), 1.0) for s in sorular]
+
+
+def test_eszamanli_tekli_cagrilar_isciler_arasinda_dagitilir(havuz):
+    baslangic = time.perf_counter()
+    with ThreadPoolExecutor(4) as isci:
+        sonuclar = list(isci.map(lambda i: havuz.tahmin([f"soru {i}"]), range(4)))
+    sure = time.perf_counter() - baslangic
+
+    assert sonuclar == [[(f"SORU {i}", 1.0)] for i in range(4)]
+    assert sure < 2 * TAHMIN_SURESI     # Sırayla olsaydı 4 * TAHMIN_SURESI
+    assert len(havuz.isci_basina_soru) > 1
+
+
+def test_hata_cagiriya_iletilir_sonraki_cagri_etkilenmez(havuz):
+    with pytest.raises(ValueError):
+        havuz.tahmin(["a", "hata", "b"], parca=1)
+    assert havuz.tahmin(["c"]) == [("C", 1.0)]
+
+
+def test_zaman_asimi_sonraki_cagriya_sizmaz(havuz):
+    with pytest.raises(TimeoutError):
+        havuz.tahmin(["gec"], timeout=0.05)
+    assert havuz.tahmin(["yeni"]) == [("YENI", 1.0)]
+
+
+def test_olen_isci_bekleyen_cagriyi_sonlandirir(havuz):
+    baslangic = time.perf_counter()
+    with pytest.raises(RuntimeError, match="öldü"):
+        havuz.tahmin(["olum"], timeout=10)
+    assert time.perf_counter() - baslangic < 2
+    with pytest.raises(RuntimeError):
+        havuz.tahmin(["soru"])
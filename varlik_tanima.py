@@ -0,0 +1,116 @@
+"""
+Finansal Chatbot - Aho-Corasick Varlık Tanıma (NER)
+===================================================
+Takma ad sözlüğünü tek seferde çok desenli bir otomata derler ve metni
+tek geçişte tarayarak tüm varlık geçişlerini konumlarıyla birlikte bulur.
+Maliyet sözlük boyutundan bağımsız olarak metin uzunluğuyla orantılıdır.
+
+Kelime sınırı kuralları:
+- Sol sınır her zaman zorunludur ("konsolidasyon" içindeki "ons" eşleşmez).
+- Sağ sınır zorunludur; ancak yeterince uzun takma adlar Türkçe ek
+  alabilir ("dolardan", "altını", "thy'nin" -> kesme işareti zaten sınır).
+"""
+
+from collections import deque, namedtuple
+
+from config import NER_EK_MIN_UZUNLUK
+
+VarlikEslesmesi = namedtuple("VarlikEslesmesi", ["varlik", "anahtar", "baslangic", "bitis"])
+
+
+def kucuk_harf(metin):
+    """Uzunluğu koruyan küçük harf dönüşümü ('İ'.lower() iki karakter üretir)."""
+    return metin.replace("İ", "i").lower()
+
+
+class AhoCorasick:
+    """Klasik Aho-Corasick otomatı (goto / fail / çıktı tabloları)."""
+
+    def __init__(self, desenler):
+        self._goto = [{}]
+        self._fail = [0]
+        self._cikti = [[]]
+
+        for desen, deger in desenler.items():
+            durum = 0
+            for karakter in desen:
+                sonraki = self._goto[durum].get(karakter)
+                if sonraki is None:
+                    sonraki = len(self._goto)
+                    self._goto[durum][karakter] = sonraki
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._cikti.append([])
+                durum = sonraki
+            self._cikti[durum].append((desen, deger))
+
+        # BFS ile fail linkleri; çıktılar fail zinciri boyunca birleştirilir
+        kuyruk = deque(self._goto[0].values())
+        while kuyruk:
+            durum = kuyruk.popleft()
+            for karakter, sonraki in self._goto[durum].items():
+                kuyruk.append(sonraki)
+                geri = self._fail[durum]
+                while geri and karakter not in self._goto[geri]:
+                    geri = self._fail[geri]
+                hedef = self._goto[geri].get(karakter, 0)
+                self._fail[sonraki] = hedef if hedef != sonraki else 0
+                self._cikti[sonraki] = self._cikti[sonraki] + self._cikti[self._fail[sonraki]]
+
+    @property
+    def durum_sayisi(self):
+        return len(self._goto)
+
+    def ara(self, metin):
+        """Metindeki tüm (örtüşenler dahil) geçişleri üretir: (baslangic, bitis, desen, deger)."""
+        goto, fail, cikti = self._goto, self._fail, self._cikti
+        durum = 0
+        for i, karakter in enumerate(metin):
+            while durum and karakter not in goto[durum]:
+                durum = fail[durum]
+            durum = goto[durum].get(karakter, 0)
+            for desen, deger in cikti[durum]:
+                yield i + 1 - len(desen), i + 1, desen, deger
+
+
+class VarlikTanimlayici:
+    """Takma ad -> varlık sözlüğü üzerinde kelime sınırı duyarlı NER."""
+
+    def __init__(self, sozluk, min_ek_uzunlugu=NER_EK_MIN_UZUNLUK):
+        self.min_ek_uzunlugu = min_ek_uzunlugu
+        self._otomat = AhoCorasick({kucuk_harf(k): v for k, v in sozluk.items()})
+
+    def _sinirda_mi(self, metin, bas, bit, anahtar):
+        if bas > 0 and metin[bas - 1].isalnum():
+            return False
+        if bit == len(metin) or not metin[bit].isalnum():
+            return True
+        # Türkçe ek: uzun takma adın ardından harf gelebilir (dolar-dan)
+        return len(anahtar) >= self.min_ek_uzunlugu and metin[bit].isalpha()
+
+    def tum_eslesmeler(self, metin):
+        """
+        Metindeki tüm varlık geçişlerini soldan sağa döndürür. Örtüşen
+        adaylarda en soldaki, eşitlikte en uzun olan seçilir
+        ("türk hava yolları" içindeki alt desenler ayrıca raporlanmaz).
+        """
+        metin = kucuk_harf(metin)
+        adaylar = [
+            (bas, -(bit - bas), bit, anahtar, varlik)
+            for bas, bit, anahtar, varlik in self._otomat.ara(metin)
+            if self._sinirda_mi(metin, bas, bit, anahtar)
+        ]
+        adaylar.sort()
+
+        sonuc = []
+        son_bitis = 0
+        for bas, _, bit, anahtar, varlik in adaylar:
+            if bas >= son_bitis:
+                sonuc.append(VarlikEslesmesi(varlik, anahtar, bas, bit))
+                son_bitis = bit
+        return sonuc
+
+    def bul(self, metin):
+        """Metindeki ilk (en soldaki) varlık eşleşmesini döndürür, yoksa None."""
+        eslesmeler = self.tum_eslesmeler(metin)
+        return eslesmeler[0] if eslesmeler else None
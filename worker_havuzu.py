@@ -0,0 +1,325 @@
+"""
+Finansal Chatbot - Pre-fork Inference İşçi Havuzu
+=================================================
+Ana süreç BERT modelini ve Zemberek'i bir kez yükler, ardından fork ile
+işçi süreçleri başlatır. Model ağırlıkları ve sözlük sayfaları işçiler
+arasında copy-on-write olarak paylaşılır; N işçi ~1 model kadar bellek
+kullanır. Sorular ortak bir görev kuyruğundan işçilere dağıtılır.
+
+Karşılaştırma için "naive" mod her işçiyi spawn ile başlatır; her süreç
+modeli kendisi yükler (N ayrı chat.py çalıştırmakla eşdeğer).
+
+Eşzamanlı çağrılar birbirini beklemez: her çağrının parçaları kuyruğa
+atılır, tek bir dağıtıcı thread sonuç kuyruğunu okuyup sonucu çağrı
+numarasıyla ilgili çağrıya iletir. Ölen işçi fark edilince bekleyen
+çağrılar hata alır; hiçbir bekleme süresiz değildir.
+
+Sunucuda işçi modu: config.SUNUCU_ISCI_HAVUZU = True (server.py havuzu
+başlatır, chat.tahmin_yap soruları işçilere gönderir).
+
+Kullanım:
+    python worker_havuzu.py --isci 4 --karsilastir
+
+    havuz = IsciHavuzu(4)
+    havuz.tahmin(["thy alınır mı", "altın ne kadar"])   # [(niyet, guven), ...]
+"""
+
+import argparse
+import gc
+import itertools
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+import chat
+from config import (
+    ISCI_SAYISI, ISCI_TORCH_THREAD, ISCI_BATCH_BOYUT, ISCI_HAZIR_SURESI, ISCI_TAHMIN_SURESI,
+    ISCI_YOKLAMA_SURESI
+)
+from izleme import log
+
+
+def _torch_thread_ayarla(sayi):
+    try:
+        import torch
+        torch.set_num_threads(sayi)
+    except ImportError:
+        pass
+
+
+def _isci_dongusu(gorevler, sonuclar, yukle):
+    """İşçi süreci: görev kuyruğundan soru parçalarını alıp niyet tahmini yapar."""
+    _torch_thread_ayarla(ISCI_TORCH_THREAD)
+    if yukle:
+        chat.isindir()
+    sonuclar.put(("hazir", os.getpid(), None))
+
+    while True:
+        gorev = gorevler.get()
+        if gorev is None:
+            break
+        parca_id, sorular, normalize = gorev
+        try:
+            sonuclar.put((parca_id, os.getpid(), chat.tahmin_yap_batch(sorular, normalize=normalize)))
+        except Exception as e:
+            sonuclar.put((parca_id, os.getpid(), e))
+
+
+def bellek_bilgisi(pid):
+    """/proc/<pid>/smaps_rollup'tan Rss, Pss, paylaşılan ve özel bellek (MB)."""
+    bilgi = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for satir in f:
+                parcalar = satir.split()
+                if len(parcalar) >= 2 and parcalar[0].endswith(":") and parcalar[1].isdigit():
+                    bilgi[parcalar[0][:-1]] = int(parcalar[1]) / 1024
+    except OSError:
+        return None
+    return {
+        "rss": bilgi.get("Rss", 0.0),
+        "pss": bilgi.get("Pss", 0.0),
+        "paylasilan": bilgi.get("Shared_Clean", 0.0) + bilgi.get("Shared_Dirty", 0.0),
+        "ozel": bilgi.get("Private_Clean", 0.0) + bilgi.get("Private_Dirty", 0.0),
+    }
+
+
+class _Cagri:
+    """Bir tahmin çağrısının toplanan parçaları; tamamlanınca future çözülür."""
+
+    __slots__ = ("future", "parca_sayisi", "toplanan", "hata")
+
+    def __init__(self, parca_sayisi):
+        self.future = Future()
+        self.parca_sayisi = parca_sayisi
+        self.toplanan = {}
+        self.hata = None
+
+
+class IsciHavuzu:
+    """
+    Parametreler:
+    - isci_sayisi: Başlatılacak işçi süreç sayısı
+    - mod: "fork" (model paylaşımlı) veya "naive" (her işçi kendi modelini yükler)
+    """
+
+    def __init__(self, isci_sayisi=ISCI_SAYISI, mod="fork"):
+        self.mod = mod
+        baslangic = time.perf_counter()
+
+        if mod == "fork":
+            # Ana süreçte tek OpenMP thread'i: fork sonrası çocuklar kilitlenmesin
+            _torch_thread_ayarla(ISCI_TORCH_THREAD)
+            chat.isindir()
+            # Yüklenen nesneleri GC'nin dışına al; GC taraması sayfalara yazıp
+            # copy-on-write paylaşımını bozmasın
+            gc.collect()
+            gc.freeze()
+            ctx = mp.get_context("fork")
+        else:
+            ctx = mp.get_context("spawn")
+
+        self.gorevler = ctx.Queue()
+        self.sonuclar = ctx.Queue()
+        self.isciler = [
+            ctx.Process(target=_isci_dongusu, args=(self.gorevler, self.sonuclar, mod != "fork"), daemon=True)
+            for _ in range(isci_sayisi)
+        ]
+        for isci in self.isciler:
+            isci.start()
+        try:
+            self._hazir_bekle()
+        except Exception:
+            self._sonlandir()
+            raise
+        self.baslatma_suresi = time.perf_counter() - baslangic
+        self.isci_basina_soru = {}   # Yalnızca dağıtıcı thread yazar
+
+        self._cagri_no = itertools.count()
+        self._bekleyenler = {}       # çağrı no -> _Cagri
+        self._kilit = threading.Lock()
+        self._hata = None            # Havuz bozulduysa (ölen işçi) sonraki çağrılara atılır
+        self._kapali = False
+        self._dagitici = threading.Thread(target=self._dagit, name="isci_sonuc", daemon=True)
+        self._dagitici.start()
+
+    # -------------------------------------------------------------------------
+    # İşçi durumu
+    # -------------------------------------------------------------------------
+
+    def _olu_isci(self):
+        """Beklenmedik şekilde çıkmış ilk işçi veya None."""
+        return next((isci for isci in self.isciler if not isci.is_alive()), None)
+
+    def _hazir_bekle(self):
+        """Her işçinin "hazir" mesajını bekler; ölen işçi veya süre aşımında hata atar."""
+        son_an = time.monotonic() + ISCI_HAZIR_SURESI
+        hazir = 0
+        while hazir < len(self.isciler):
+            try:
+                self.sonuclar.get(timeout=ISCI_YOKLAMA_SURESI)
+                hazir += 1
+                continue
+            except queue.Empty:
+                pass
+            olu = self._olu_isci()
+            if olu is not None:
+                raise RuntimeError(f"İşçi başlatılamadı (pid {olu.pid}, çıkış kodu {olu.exitcode})")
+            if time.monotonic() > son_an:
+                raise TimeoutError(f"{ISCI_HAZIR_SURESI} s içinde {len(self.isciler) - hazir} işçi hazır olmadı")
+
+    # -------------------------------------------------------------------------
+    # Sonuç dağıtımı
+    # -------------------------------------------------------------------------
+
+    def _dagit(self):
+        """Sonuç kuyruğunu okur, her parçayı çağrısına iletir; ölen işçiyi yoklar."""
+        son_yoklama = time.monotonic()
+        while True:
+            try:
+                mesaj = self.sonuclar.get(timeout=ISCI_YOKLAMA_SURESI)
+            except queue.Empty:
+                mesaj = None
+            if self._kapali:
+                return
+            if mesaj is not None:
+                self._parca_isle(*mesaj)
+            if time.monotonic() - son_yoklama >= ISCI_YOKLAMA_SURESI:
+                son_yoklama = time.monotonic()
+                olu = self._olu_isci()
+                if olu is not None:
+                    self._boz(RuntimeError(f"İşçi süreci öldü (pid {olu.pid}, çıkış kodu {olu.exitcode})"))
+                    return
+
+    def _parca_isle(self, parca_id, pid, sonuc):
+        cagri_no, parca_no = parca_id
+        with self._kilit:
+            cagri = self._bekleyenler.get(cagri_no)
+            if cagri is None:
+                return  # Zaman aşımına uğramış bir çağrının sonucu
+            cagri.toplanan[parca_no] = sonuc
+            if isinstance(sonuc, Exception):
+                cagri.hata = cagri.hata or sonuc
+            else:
+                self.isci_basina_soru[pid] = self.isci_basina_soru.get(pid, 0) + len(sonuc)
+            if len(cagri.toplanan) < cagri.parca_sayisi:
+                return
+            del self._bekleyenler[cagri_no]
+        # Hata olsa da tüm parçalar toplandı: kuyrukta bu çağrıya ait sonuç kalmaz
+        if cagri.hata is not None:
+            cagri.future.set_exception(cagri.hata)
+        else:
+            cagri.future.set_result([s for i in range(cagri.parca_sayisi) for s in cagri.toplanan[i]])
+
+    def _boz(self, hata):
+        log.error("[!] [İŞÇİ] %s; bekleyen çağrılar iptal ediliyor", hata)
+        with self._kilit:
+            self._hata = hata
+            bekleyenler, self._bekleyenler = self._bekleyenler, {}
+        for cagri in bekleyenler.values():
+            cagri.future.set_exception(hata)
+
+    # -------------------------------------------------------------------------
+    # Tahmin
+    # -------------------------------------------------------------------------
+
+    def tahmin(self, sorular, parca=ISCI_BATCH_BOYUT, normalize=True, timeout=ISCI_TAHMIN_SURESI):
+        """
+        Soruları parçalara bölüp işçilere dağıtır, sonuçları girdi sırasıyla döndürür.
+        Eşzamanlı çağrıların parçaları aynı anda farklı işçilerde işlenir. Bir parça
+        hata verirse çağrının diğer parçaları da toplanır, sonra hata atılır.
+        timeout içinde bitmezse TimeoutError; işçi öldüyse RuntimeError atılır.
+        """
+        if not sorular:
+            return []
+        parcalar = [sorular[i:i + parca] for i in range(0, len(sorular), parca)]
+        cagri = _Cagri(len(parcalar))
+        with self._kilit:
+            if self._hata is not None:
+                raise self._hata
+            if self._kapali:
+                raise RuntimeError("İşçi havuzu kapatıldı")
+            cagri_no = next(self._cagri_no)
+            self._bekleyenler[cagri_no] = cagri
+        for parca_no, p in enumerate(parcalar):
+            self.gorevler.put(((cagri_no, parca_no), p, normalize))
+
+        try:
+            return cagri.future.result(timeout)
+        except FutureTimeoutError:
+            with self._kilit:
+                self._bekleyenler.pop(cagri_no, None)
+            raise TimeoutError(f"{timeout} s içinde işçilerden sonuç gelmedi") from None
+
+    def bellek_raporu(self):
+        return {isci.pid: bellek_bilgisi(isci.pid) for isci in self.isciler}
+
+    def _sonlandir(self):
+        for isci in self.isciler:
+            if isci.is_alive():
+                isci.terminate()
+
+    def kapat(self):
+        with self._kilit:
+            self._kapali = True
+            bekleyenler, self._bekleyenler = self._bekleyenler, {}
+        for cagri in bekleyenler.values():
+            cagri.future.set_exception(RuntimeError("İşçi havuzu kapatıldı"))
+        for _ in self.isciler:
+            self.gorevler.put(None)
+        for isci in self.isciler:
+            isci.join(timeout=10)
+        self._sonlandir()
+        self._dagitici.join(timeout=ISCI_YOKLAMA_SURESI * 2)
+
+
+# =============================================================================
+# KARŞILAŞTIRMA
+# =============================================================================
+
+def _calistir(mod, isci_sayisi, sorular):
+    print(f"\n[*] Mod: {mod} | {isci_sayisi} işçi")
+    havuz = IsciHavuzu(isci_sayisi, mod=mod)
+    # Isınma: ölçüm setinde olmayan cümlelerle (işçilerin tahmin cache'i dolmasın)
+    havuz.tahmin([f"ısınma cümlesi {i}" for i in range(isci_sayisi * ISCI_BATCH_BOYUT)])
+    havuz.isci_basina_soru.clear()
+
+    baslangic = time.perf_counter()
+    havuz.tahmin(sorular)
+    sure = time.perf_counter() - baslangic
+
+    rapor = havuz.bellek_raporu()
+    print(f"  {'PID':>8} {'RSS MB':>9} {'PSS MB':>9} {'Paylaşılan':>11} {'Özel MB':>9} {'Soru':>6}")
+    for pid, b in rapor.items():
+        if b is None:
+            print(f"  {pid:>8}  (bellek bilgisi okunamadı)")
+            continue
+        print(f"  {pid:>8} {b['rss']:>9.0f} {b['pss']:>9.0f} {b['paylasilan']:>11.0f} {b['ozel']:>9.0f} "
+              f"{havuz.isci_basina_soru.get(pid, 0):>6}")
+    toplam_pss = sum(b["pss"] for b in rapor.values() if b)
+    havuz.kapat()
+    return {"baslatma": havuz.baslatma_suresi, "qps": len(sorular) / sure, "pss": toplam_pss}
+
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Pre-fork inference işçi havuzu")
+    parser.add_argument("--isci", type=int, default=ISCI_SAYISI, help="İşçi süreç sayısı")
+    parser.add_argument("--adet", type=int, default=1024, help="Ölçülecek soru sayısı")
+    parser.add_argument("--karsilastir", action="store_true", help="Naive (spawn) mod ile karşılaştır")
+    args = parser.parse_args()
+
+    sorular = pd.read_csv('training_data_cleaned.csv')['text'].astype(str).head(args.adet).tolist()
+    sonuclar = {"fork": _calistir("fork", args.isci, sorular)}
+    if args.karsilastir:
+        sonuclar["naive"] = _calistir("naive", args.isci, sorular)
+
+    print("\n" + "=" * 58)
+    print(f"  {'Mod':<8} {'Başlatma s':>11} {'Toplam PSS MB':>15} {'Throughput q/s':>16}")
+    print("=" * 58)
+    for mod, s in sonuclar.items():
+        print(f"  {mod:<8} {s['baslatma']:>11.1f} {s['pss']:>15.0f} {s['qps']:>16.1f}")
@@ -0,0 +1,105 @@
+"""
+Finansal Chatbot - Yük Testi
+============================
+server.py'ye çok sayıda eşzamanlı sanal kullanıcıyla istek gönderir;
+istek/saniye ve p50/p95/p99 gecikmelerini raporlar.
+
+Kullanım:
+    python yuk_testi.py --kullanici 200 --soru 10
+    python yuk_testi.py --ws --url ws://localhost:8080/ws
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+import aiohttp
+
+SORULAR = [
+    "dolar ne kadar",
+    "thy alınır mı",
+    "akbank hakkında haber var mı",
+    "altın yükselir mi",
+    "garanti hedef fiyatı nedir",
+    "bist100 düşer mi",
+    "peki ya ereğli",
+    "koç holding genel durumu nasıl",
+]
+
+
+def yuzdelik(sirali, oran):
+    if not sirali:
+        return 0.0
+    return sirali[min(len(sirali) - 1, int(len(sirali) * oran))]
+
+
+async def http_kullanici(oturum, url, soru_sayisi, gecikmeler, hatalar):
+    oturum_id = uuid.uuid4().hex
+    for _ in range(soru_sayisi):
+        baslangic = time.perf_counter()
+        try:
+            async with oturum.post(url, json={"oturum": oturum_id, "soru": random.choice(SORULAR)}) as yanit:
+                await yanit.read()
+                if yanit.status != 200:
+                    hatalar.append(yanit.status)
+                    continue
+        except aiohttp.ClientError as e:
+            hatalar.append(str(e))
+            continue
+        gecikmeler.append((time.perf_counter() - baslangic) * 1000)
+
+
+async def ws_kullanici(oturum, url, soru_sayisi, gecikmeler, hatalar):
+    try:
+        async with oturum.ws_connect(f"{url}?oturum={uuid.uuid4().hex}") as ws:
+            for _ in range(soru_sayisi):
+                baslangic = time.perf_counter()
+                await ws.send_str(random.choice(SORULAR))
+                mesaj = await ws.receive()
+                if mesaj.type != aiohttp.WSMsgType.TEXT:
+                    hatalar.append(str(mesaj.type))
+                    return
+                gecikmeler.append((time.perf_counter() - baslangic) * 1000)
+    except aiohttp.ClientError as e:
+        hatalar.append(str(e))
+
+
+async def calistir(args):
+    url = args.url or ("ws://localhost:8080/ws" if args.ws else "http://localhost:8080/sohbet")
+    kullanici_fn = ws_kullanici if args.ws else http_kullanici
+    gecikmeler, hatalar = [], []
+
+    baglanti = aiohttp.TCPConnector(limit=args.kullanici)
+    zaman_asimi = aiohttp.ClientTimeout(total=args.zaman_asimi)
+    async with aiohttp.ClientSession(connector=baglanti, timeout=zaman_asimi) as oturum:
+        baslangic = time.perf_counter()
+        await asyncio.gather(*[
+            kullanici_fn(oturum, url, args.soru, gecikmeler, hatalar)
+            for _ in range(args.kullanici)
+        ])
+        sure = time.perf_counter() - baslangic
+
+    gecikmeler.sort()
+    print("=" * 50)
+    print(f"  Hedef: {url}")
+    print(f"  {args.kullanici} kullanıcı x {args.soru} soru")
+    print("=" * 50)
+    print(f"  Başarılı istek:   {len(gecikmeler)}")
+    print(f"  Hatalı istek:     {len(hatalar)}")
+    print(f"  Toplam süre:      {sure:.2f} s")
+    print(f"  İstek/saniye:     {len(gecikmeler) / sure:.1f}")
+    print(f"  p50 gecikme:      {yuzdelik(gecikmeler, 0.50):.1f} ms")
+    print(f"  p95 gecikme:      {yuzdelik(gecikmeler, 0.95):.1f} ms")
+    print(f"  p99 gecikme:      {yuzdelik(gecikmeler, 0.99):.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Finansal chatbot sunucusu yük testi")
+    parser.add_argument("--url", help="Hedef URL (varsayılan: localhost:8080)")
+    parser.add_argument("--ws", action="store_true", help="HTTP yerine WebSocket kullan")
+    parser.add_argument("--kullanici", type=int, default=100, help="Eşzamanlı sanal kullanıcı")
+    parser.add_argument("--soru", type=int, default=10, help="Kullanıcı başına soru")
+    parser.add_argument("--zaman-asimi", type=float, default=60, help="İstek zaman aşımı (s)")
+    asyncio.run(calistir(parser.parse_args()))